@@ -0,0 +1,378 @@
+"""Shared async Airtable client.
+
+A single pooled ``httpx.AsyncClient`` (keep-alive, HTTP/2, per-request
+timeouts) is opened when the app starts and closed on shutdown. Every
+``fetch_airtable_*`` coroutine in ``server.py`` goes through it so that
+Airtable round-trips never block the event loop and TLS sessions are reused.
+
+Requests are also paced per base by a token bucket, because Airtable allows
+roughly 5 requests per second per base and answers bursts with 429s.
+Interactive reads are dequeued before background refreshes, and 429/503
+responses are retried after ``Retry-After`` plus jittered exponential backoff
+(a 429 without ``Retry-After`` waits out Airtable's 30 second penalty first).
+Interactive reads only retry within a small budget and otherwise get the
+429 back at once, so a route falls back instead of hanging; refreshes keep
+retrying in the background.
+"""
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import os
+import random
+import time
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+AIRTABLE_API_URL = "https://api.airtable.com/v0"
+
+# Tunables (seconds / connection counts), overridable from the environment
+AIRTABLE_TIMEOUT = float(os.environ.get('AIRTABLE_TIMEOUT', '15'))
+AIRTABLE_CONNECT_TIMEOUT = float(os.environ.get('AIRTABLE_CONNECT_TIMEOUT', '5'))
+AIRTABLE_MAX_CONNECTIONS = int(os.environ.get('AIRTABLE_MAX_CONNECTIONS', '20'))
+AIRTABLE_MAX_KEEPALIVE = int(os.environ.get('AIRTABLE_MAX_KEEPALIVE', '10'))
+AIRTABLE_KEEPALIVE_EXPIRY = float(os.environ.get('AIRTABLE_KEEPALIVE_EXPIRY', '60'))
+AIRTABLE_RATE_PER_BASE = float(os.environ.get('AIRTABLE_RATE_PER_BASE', '5'))  # requests per second
+AIRTABLE_BURST = int(os.environ.get('AIRTABLE_BURST', '5'))
+AIRTABLE_MAX_RETRIES = int(os.environ.get('AIRTABLE_MAX_RETRIES', '4'))
+AIRTABLE_BACKOFF_BASE = float(os.environ.get('AIRTABLE_BACKOFF_BASE', '0.5'))  # seconds
+AIRTABLE_BACKOFF_MAX = float(os.environ.get('AIRTABLE_BACKOFF_MAX', '30'))  # seconds
+# Airtable keeps answering 429 for 30 seconds after a rate-limit breach, and retries inside that window extend it
+AIRTABLE_RATE_LIMIT_PENALTY = float(os.environ.get('AIRTABLE_RATE_LIMIT_PENALTY', '30'))  # seconds
+# Interactive reads (cold misses in a request handler) give up sooner than refreshes
+AIRTABLE_INTERACTIVE_MAX_RETRIES = int(os.environ.get('AIRTABLE_INTERACTIVE_MAX_RETRIES', '1'))
+AIRTABLE_INTERACTIVE_MAX_WAIT = float(os.environ.get('AIRTABLE_INTERACTIVE_MAX_WAIT', '5'))  # seconds
+AIRTABLE_SCHEMA_TTL = float(os.environ.get('AIRTABLE_SCHEMA_TTL', '86400'))  # seconds
+
+RETRYABLE_STATUS_CODES = {429, 503}
+
+# Lower value is served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+# Set to PRIORITY_BACKGROUND inside refresh/warm-up tasks; request handlers keep the default
+request_priority: ContextVar[int] = ContextVar('airtable_request_priority', default=PRIORITY_INTERACTIVE)
+
+
+class TokenBucket:
+    """Per-base token bucket whose waiters are released in priority order"""
+
+    def __init__(self, rate: float = AIRTABLE_RATE_PER_BASE, burst: int = AIRTABLE_BURST):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._waiters = []  # heap of (priority, sequence, future)
+        self._sequence = itertools.count()
+        self._drainer: Optional[asyncio.Task] = None
+        self.stats = {"granted": 0, "queued": 0, "max_queue_depth": 0, "wait_seconds_total": 0.0,
+                      "wait_seconds_max": 0.0}
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, priority: int = PRIORITY_INTERACTIVE) -> float:
+        """Wait for a request slot; returns the seconds spent waiting"""
+        started = time.monotonic()
+        self._refill()
+        if not self._waiters and self.tokens >= 1 and started >= self.blocked_until:
+            self.tokens -= 1
+            self.stats["granted"] += 1
+            return 0.0
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self.stats["queued"] += 1
+        self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], len(self._waiters))
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain())
+        await future
+
+        waited = time.monotonic() - started
+        self.stats["granted"] += 1
+        self.stats["wait_seconds_total"] += waited
+        self.stats["wait_seconds_max"] = max(self.stats["wait_seconds_max"], waited)
+        return waited
+
+    async def _drain(self):
+        while self._waiters:
+            self._refill()
+            now = time.monotonic()
+            if now < self.blocked_until:
+                await asyncio.sleep(self.blocked_until - now)
+                continue
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                continue
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                # The waiting request was cancelled
+                continue
+            self.tokens -= 1
+            future.set_result(None)
+
+    def pause(self, seconds: float):
+        """Hold every request for this base for ``seconds`` (after a 429)"""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Retry-After (if sent) plus jittered exponential backoff.
+
+    A 429 without Retry-After waits out Airtable's penalty window rather than
+    the (much shorter) backoff alone.
+    """
+    backoff = min(AIRTABLE_BACKOFF_MAX, AIRTABLE_BACKOFF_BASE * 2 ** attempt)
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                seconds = 0.0
+        return max(seconds, 0.0) + random.uniform(0, backoff)
+    if response.status_code == 429:
+        return AIRTABLE_RATE_LIMIT_PENALTY + random.uniform(0, backoff)
+    return random.uniform(backoff / 2, backoff)
+
+
+class AirtableClient:
+    """Pooled async client for the Airtable REST API"""
+
+    def __init__(self, token: Optional[str] = None, transport: Optional[httpx.AsyncBaseTransport] = None,
+                 http2: bool = True, rate_per_base: float = AIRTABLE_RATE_PER_BASE, burst: int = AIRTABLE_BURST):
+        self.token = token
+        self.transport = transport
+        self.http2 = http2
+        self.rate_per_base = rate_per_base
+        self.burst = burst
+        self._client: Optional[httpx.AsyncClient] = None
+        self._buckets = {}
+        self._stats = {}
+        self._payloads = {}
+        # (base, table) pairs where a projected field turned out not to exist
+        self._unprojectable = set()
+
+    async def start(self):
+        """Open the shared connection pool (idempotent)"""
+        if self._client is not None and not self._client.is_closed:
+            return
+        self._client = httpx.AsyncClient(
+            base_url=AIRTABLE_API_URL,
+            http2=self.http2,
+            transport=self.transport,
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Content-Type": "application/json"
+            },
+            timeout=httpx.Timeout(AIRTABLE_TIMEOUT, connect=AIRTABLE_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=AIRTABLE_MAX_CONNECTIONS,
+                max_keepalive_connections=AIRTABLE_MAX_KEEPALIVE,
+                keepalive_expiry=AIRTABLE_KEEPALIVE_EXPIRY
+            )
+        )
+
+    async def close(self):
+        """Close the connection pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _bucket(self, base_id: str) -> TokenBucket:
+        if base_id not in self._buckets:
+            self._buckets[base_id] = TokenBucket(self.rate_per_base, self.burst)
+            self._stats[base_id] = {"requests": 0, "throttled": 0, "retries": 0, "shed": 0}
+        return self._buckets[base_id]
+
+    async def get(self, base_id: str, table_id: str, params: Optional[dict] = None,
+                  timeout: Optional[float] = None, fields: Optional[list] = None,
+                  label: Optional[str] = None) -> httpx.Response:
+        """GET a table listing and return the raw response (no status check).
+
+        ``fields`` is sent as ``fields[]`` so Airtable only returns the columns
+        the caller maps. If Airtable rejects the projection because one of the
+        names does not exist, the request is repeated without it (and the table
+        is no longer projected) rather than failing the fetch.
+        """
+        if fields and (base_id, table_id) not in self._unprojectable:
+            response = await self._send(base_id, f"/{base_id}/{table_id}", {**(params or {}), "fields[]": list(fields)},
+                                        timeout)
+            if response.status_code != 422 or "UNKNOWN_FIELD_NAME" not in response.text:
+                self._record_payload(label or table_id, response)
+                return response
+            logger.warning(f"Field projection rejected for {base_id}/{table_id}, fetching full records: {response.text}")
+            self._unprojectable.add((base_id, table_id))
+        response = await self._send(base_id, f"/{base_id}/{table_id}", params, timeout)
+        self._record_payload(label or table_id, response)
+        return response
+
+    async def _send(self, base_id: str, path: str, params: Optional[dict],
+                    timeout: Optional[float]) -> httpx.Response:
+        if self._client is None or self._client.is_closed:
+            # Scripts and tests may call fetchers without running the app lifespan
+            await self.start()
+        request_timeout = httpx.Timeout(timeout, connect=AIRTABLE_CONNECT_TIMEOUT) if timeout else httpx.USE_CLIENT_DEFAULT
+        bucket = self._bucket(base_id)
+        stats = self._stats[base_id]
+        priority = request_priority.get()
+        interactive = priority == PRIORITY_INTERACTIVE
+        max_retries = AIRTABLE_INTERACTIVE_MAX_RETRIES if interactive else AIRTABLE_MAX_RETRIES
+        deadline = time.monotonic() + AIRTABLE_INTERACTIVE_MAX_WAIT if interactive else None
+
+        attempt = 0
+        while True:
+            if deadline is not None and bucket.blocked_until > deadline:
+                # The base is paused for longer than an interactive read may wait: answer for Airtable
+                stats["shed"] += 1
+                return httpx.Response(429, request=self._client.build_request("GET", path, params=params))
+            await bucket.acquire(priority)
+            stats["requests"] += 1
+            response = await self._client.get(path, params=params, timeout=request_timeout)
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+            if response.status_code == 429:
+                stats["throttled"] += 1
+            delay = retry_delay(response, attempt)
+            # Pausing the bucket also holds back every other request to this base
+            bucket.pause(delay)
+            if attempt >= max_retries or (deadline is not None and time.monotonic() + delay > deadline):
+                return response
+            stats["retries"] += 1
+            attempt += 1
+
+    async def get_base_schema(self, base_id: str) -> httpx.Response:
+        """GET the metadata API table list for a base (needs the schema.bases:read scope)"""
+        return await self._send(base_id, f"/meta/bases/{base_id}/tables", None, None)
+
+    def _record_payload(self, label: str, response: httpx.Response):
+        payload = self._payloads.setdefault(label, {"responses": 0, "bytes_total": 0, "decodes": 0,
+                                                    "decode_seconds_total": 0.0})
+        payload["responses"] += 1
+        payload["bytes_total"] += len(response.content)
+
+    def decode(self, response: httpx.Response, label: Optional[str] = None) -> dict:
+        """Parse a JSON response body, timing the decode per collection label"""
+        started = time.perf_counter()
+        data = json.loads(response.content)
+        payload = self._payloads.get(label or response.url.path.rsplit("/", 1)[-1])
+        if payload is not None:
+            payload["decodes"] += 1
+            payload["decode_seconds_total"] += time.perf_counter() - started
+        return data
+
+    def stats(self) -> dict:
+        """Per-base request, throttling and queueing counters plus per-collection payload sizes"""
+        bases = {}
+        for base_id, bucket in self._buckets.items():
+            granted = bucket.stats["granted"]
+            bases[base_id] = {
+                **self._stats[base_id],
+                **bucket.stats,
+                "queue_depth": bucket.queue_depth,
+                "wait_seconds_avg": bucket.stats["wait_seconds_total"] / granted if granted else 0.0,
+                "paused_for": max(0.0, bucket.blocked_until - time.monotonic())
+            }
+        payloads = {}
+        for label, payload in self._payloads.items():
+            payloads[label] = {
+                **payload,
+                "bytes_avg": payload["bytes_total"] // payload["responses"] if payload["responses"] else 0,
+                "decode_ms_avg": round(1000 * payload["decode_seconds_total"] / payload["decodes"], 3) if payload["decodes"] else 0.0
+            }
+        return {"bases": bases, "payloads": payloads}
+
+    async def list_records(self, base_id: str, table_id: str, params: Optional[dict] = None,
+                           timeout: Optional[float] = None, fields: Optional[list] = None,
+                           label: Optional[str] = None) -> dict:
+        """GET one page of records, raising on non-2xx responses"""
+        response = await self.get(base_id, table_id, params=params, timeout=timeout, fields=fields, label=label)
+        response.raise_for_status()
+        return self.decode(response, label)
+
+
+class SchemaResolver:
+    """Discovers each table's field names once and compiles alias chains against them.
+
+    Field names come from the metadata API when the token is allowed to read
+    it, otherwise from the keys seen in a sample of records (the view's
+    first page, or the bare table's if the view cannot be read). Callers then
+    look up only the aliases that actually exist, instead of probing every
+    spelling on every record. An empty sample is not cached, nor is one in
+    which a ``required`` attribute matched no alias, so the next call samples
+    again rather than serving nothing for ``ttl`` seconds.
+    """
+
+    def __init__(self, client: AirtableClient, ttl: float = AIRTABLE_SCHEMA_TTL):
+        self.client = client
+        self.ttl = ttl
+        self._fields = {}  # (base, table) -> (resolved_at, set of field names, source)
+
+    async def field_names(self, base_id: str, table_id: str, view: Optional[str] = None) -> set:
+        cached = self._fields.get((base_id, table_id))
+        if cached is not None and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        names, source = None, "metadata"
+        response = await self.client.get_base_schema(base_id)
+        if response.status_code == 200:
+            for table in response.json().get("tables", []):
+                if table_id in (table.get("id"), table.get("name")):
+                    names = {field["name"] for field in table.get("fields", [])}
+                    break
+        if names is None:
+            # No metadata access: empty cells are omitted from records, so sample a page
+            source = "sample"
+            params = {"maxRecords": 100}
+            sample = None
+            if view:
+                try:
+                    sample = await self.client.list_records(base_id, table_id, params={**params, "view": view})
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code >= 500:
+                        raise
+                    logger.warning(f"View {view} of {base_id}/{table_id} not readable "
+                                   f"({e.response.status_code}), sampling the table instead")
+            if sample is None:
+                sample = await self.client.list_records(base_id, table_id, params=params)
+            names = set()
+            for record in sample.get("records", []):
+                names.update(record.get("fields", {}))
+
+        logger.info(f"Resolved {len(names)} fields for {base_id}/{table_id} from {source}")
+        if names:
+            self._fields[(base_id, table_id)] = (time.monotonic(), names, source)
+        return names
+
+    async def resolve(self, base_id: str, table_id: str, aliases: dict, view: Optional[str] = None,
+                      required: tuple = ()) -> dict:
+        """Map each attribute to the alias field names that exist, in preference order"""
+        names = await self.field_names(base_id, table_id, view=view)
+        columns = {attribute: [alias for alias in candidates if alias in names]
+                   for attribute, candidates in aliases.items()}
+        cached = self._fields.get((base_id, table_id))
+        if cached is not None and cached[2] == "sample" and any(not columns[attribute] for attribute in required):
+            # A sparse sample (e.g. rows with the column still empty); look again next time
+            self.forget(base_id, table_id)
+        return columns
+
+    def forget(self, base_id: str, table_id: str):
+        """Drop a cached schema (e.g. after the table layout changed)"""
+        self._fields.pop((base_id, table_id), None)
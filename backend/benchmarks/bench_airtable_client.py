@@ -0,0 +1,67 @@
+"""Concurrent /api/* throughput: blocking Airtable calls vs the pooled async client.
+
+The "blocking" run replays what the old ``requests.get`` calls did (a
+synchronous wait on the event loop thread); the "async" run uses the shared
+``AirtableClient``. Both talk to the same fake Airtable with identical latency.
+
+    python benchmarks/bench_airtable_client.py [--requests 200] [--concurrency 50] [--latency 0.05]
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+import httpx
+
+from synthetic import FakeAirtable
+
+import server
+from airtable_client import AirtableClient
+
+ROUTES = ["/api/podcasts", "/api/articles", "/api/events", "/api/newsroom", "/api/videos"]
+
+
+async def run(mode, total, concurrency, latency):
+    fake = FakeAirtable(latency=latency, blocking=(mode == "blocking"))
+    server.AIRTABLE_ACCESS_TOKEN = "bench"
+    # Isolate the client: no Mongo mirror writes, no request coalescing
+    server.content_cache.mirror = None
+    server.upstream_flights.do = lambda key, label, fn, *args, **kwargs: fn(*args, **kwargs)
+    # The fake upstream has no rate limit, so do not pace requests either
+    server.airtable = AirtableClient(token="bench", transport=fake.transport(), http2=False, rate_per_base=1e6, burst=10**6)
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=server.app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as api:
+        async def one(i):
+            async with semaphore:
+                # Measure upstream cost, not the content cache
+                server.content_cache.invalidate()
+                response = await api.get(ROUTES[i % len(ROUTES)])
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - started
+
+    await server.airtable.close()
+    return elapsed, fake.requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05, help="fake Airtable latency in seconds")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}, upstream latency {args.latency * 1000:.0f} ms")
+    print(f"{'mode':<10} {'elapsed (s)':>12} {'req/s':>10} {'upstream calls':>15}")
+    for mode in ("blocking", "async"):
+        elapsed, upstream = asyncio.run(run(mode, args.requests, args.concurrency, args.latency))
+        print(f"{mode:<10} {elapsed:>12.2f} {args.requests / elapsed:>10.1f} {upstream:>15}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Refresh-time model construction: per-record vs page-batched validation, on a large table.
+
+"per-record" is how ``RecordMapper.map_many`` used to build models, one
+``Model(**values)`` call per record. "batched" is the current path: extracted
+values are validated a page at a time through a cached ``TypeAdapter``.
+"trusted" is ``model_construct``, which skips validation; it is shown for
+reference because it is not faster here (it runs in Python, validation runs
+in pydantic-core). "restore" is rebuilding a snapshot from its MongoDB mirror
+copy (plain dicts), per record vs in one ``validate_many`` call.
+
+Times are the best of ``--repeat`` runs; peak is the tracemalloc high-water
+mark of one run, above the raw records.
+
+    python benchmarks/bench_bulk_validation.py [--size 50000] [--repeat 3]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from synthetic import article_fields, event_fields, make_records, podcast_fields, video_fields
+
+import server
+from record_mapping import validate_many
+
+MAPPERS = {
+    "videos": (server.VIDEO_MAPPER, video_fields),
+    "podcasts": (server.PODCAST_MAPPER, podcast_fields),
+    "articles": (server.ARTICLE_MAPPER, article_fields),
+    "events": (server.EVENT_MAPPER, event_fields),
+}
+
+
+def per_record(mapper, records):
+    """``map_many`` as it was before batched validation"""
+    extract, model, required = mapper.extract, mapper.model, mapper.required
+    results = []
+    for record in records:
+        values = extract(record)
+        if required and not all(values[attr] for attr in required):
+            continue
+        results.append(model(**values))
+    return results
+
+
+def trusted(mapper, records):
+    extract, construct, required = mapper.extract, mapper.model.model_construct, mapper.required
+    return [construct(**values) for values in map(extract, records)
+            if not required or all(values[attr] for attr in required)]
+
+
+def measure(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+        del result
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'table':>9} {'path':>11} {'ms':>8} {'peak MB':>8}")
+    for name, (mapper, make_fields) in MAPPERS.items():
+        records = make_records(args.size, make_fields)
+        dumped = [item.model_dump() for item in mapper.map_many(records)]
+        model = mapper.model
+        paths = {
+            "per-record": lambda: per_record(mapper, records),
+            "batched": lambda: mapper.map_many(records),
+            "trusted": lambda: trusted(mapper, records),
+            "restore/1": lambda: [model(**item) for item in dumped],
+            "restore/all": lambda: validate_many(model, dumped),
+        }
+        assert paths["batched"]() == paths["per-record"](), "batched validation built different models"
+        for path, fn in paths.items():
+            seconds, peak = measure(fn, args.repeat)
+            print(f"{name:>9} {path:>11} {seconds * 1e3:>8.0f} {peak / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Retained memory per snapshot record: pydantic models vs what a snapshot holds.
+
+For each collection, synthetic Airtable records are mapped to models the way
+a refresh does. "models" is what holding those models would cost. "records"
+is the compact slot records alone (``compact_items``). "snapshot" is
+everything a refresh installs: ``CollectionCache._install`` builds the
+``CollectionSnapshot`` (compact records, the rendered listing and its
+precompressed variants, per-record hashes, ``by_id`` and ``positions``) and
+the collection's indexes, as configured on ``server.content_cache``
+(blog-table snapshots hold their listing projection).
+Cross-collection indexes are left out. "json" is the listing's JSON size,
+for scale. Figures are the bytes tracemalloc sees still allocated once the
+raw records (and, for the last two, the models) are dropped, divided by the
+number of records. Interned strings are shared with the rest of the
+process, so they are only counted once; when interning grows the
+interpreter's string table, the resize is charged to whichever table
+happened to trigger it (hence the odd outlier row).
+
+    python benchmarks/bench_compact_memory.py [--sizes 1000,10000]
+"""
+import argparse
+import gc
+import tracemalloc
+
+from synthetic import article_fields, event_fields, make_records, member_fields, podcast_fields, video_fields
+
+import server
+from compact import compact_items
+from conditional import digest
+from rendering import dumps
+
+MAPPERS = {
+    "videos": (server.VIDEO_MAPPER, video_fields),
+    "podcasts": (server.PODCAST_MAPPER, podcast_fields),
+    "articles": (server.ARTICLE_MAPPER, article_fields),
+    "newsroom": (server.NEWSROOM_MAPPER, article_fields),
+    "in_the_press": (server.IN_THE_PRESS_MAPPER, article_fields),
+    "events": (server.EVENT_MAPPER, event_fields),
+    "team": (server.TEAM_MAPPER, member_fields),
+    "gc_members": (server.gc_member_mapper(*(tuple(aliases) for aliases in server.GC_MEMBER_FIELD_ALIASES.values())),
+                   member_fields),
+}
+
+
+def live_bytes():
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def new_cache(name):
+    listing_only = {name: server.content_cache.listing_only[name]} if name in server.content_cache.listing_only else {}
+    return server.CollectionCache({name: None}, indexes={name: server.content_cache.indexes.get(name, {})},
+                                  listing_only=listing_only)
+
+
+def retained(size, make_fields, mapper, keep):
+    """(bytes per record, record count, kept) for ``keep(models)`` once the raw records and models are gone"""
+    tracemalloc.start()
+    baseline = live_bytes()
+    records = make_records(size, make_fields)
+    models = mapper.map_many(records)
+    del records
+    count = len(models)
+    kept = keep(models)
+    del models
+    kept_bytes = live_bytes() - baseline
+    tracemalloc.stop()
+    return kept_bytes / max(count, 1), count, kept
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000")
+    args = parser.parse_args()
+
+    print(f"{'table':>12} {'records':>8} {'models B/rec':>13} {'records B/rec':>14} {'snapshot B/rec':>15} "
+          f"{'json B/rec':>11}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        for name, (mapper, make_fields) in MAPPERS.items():
+            # Build adapters, classes and index machinery untraced
+            new_cache(name)._install(name, mapper.map_many(make_records(10, make_fields)))
+            model_bytes, count, models = retained(size, make_fields, mapper, list)
+            if not count:
+                print(f"{name:>12} {size:>8} {'(no records mapped)':>28}")
+                continue
+            expected = digest(dumps(models))
+            del models
+            compact_bytes, _, compact = retained(size, make_fields, mapper, compact_items)
+            assert digest(dumps(compact)) == expected, "compact records render differently"
+            del compact
+            cache = new_cache(name)
+            snapshot_bytes, _, snapshot = retained(size, make_fields, mapper,
+                                                   lambda models: cache._install(name, models))
+            json_bytes = len(snapshot.body().identity) / count
+            del snapshot
+            cache.invalidate()
+            print(f"{name:>12} {count:>8} {model_bytes:>13.0f} {compact_bytes:>14.0f} {snapshot_bytes:>15.0f} "
+                  f"{json_bytes:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
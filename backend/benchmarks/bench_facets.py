@@ -0,0 +1,68 @@
+"""/api/videos faceting: filtering and counting with ``FacetIndex`` vs a per-request scan.
+
+"scan" filters the list and counts every facet in Python, as the client
+page does today. "index" is the snapshot's ``FacetIndex``: build cost is
+paid once per refresh, queries are boolean masks plus one bincount per facet.
+
+    python benchmarks/bench_facets.py [--sizes 1000,10000,100000] [--queries 200]
+"""
+import argparse
+import random
+import time
+from collections import Counter
+
+from synthetic import CATEGORIES, SPEAKERS, TAGS, make_records, video_fields
+
+import server
+from facets import FacetIndex
+
+
+def scan_select(items, filters):
+    """Filter, then count each facet with every other facet's filter applied"""
+    def matches(item, skip=None):
+        return all(not values or set(values).intersection(server.VIDEO_FACETS[facet](item))
+                   for facet, values in filters.items() if facet != skip)
+    selected = [item for item in items if matches(item)]
+    counts = {}
+    for facet, values_of in server.VIDEO_FACETS.items():
+        counter = Counter(value for item in items if matches(item, facet) for value in set(values_of(item)) if value)
+        counts[facet] = sorted(counter.items(), key=lambda entry: (-entry[1], entry[0]))
+    return selected, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated catalog sizes")
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    queries = [{"category": rng.sample(CATEGORIES, rng.randint(0, 2)), "tags": rng.sample(TAGS, rng.randint(0, 2)),
+                "speaker": rng.sample(SPEAKERS, rng.randint(0, 1))} for _ in range(args.queries)]
+
+    print(f"{'items':>8} {'scan ms/query':>14} {'index build ms':>15} {'index us/query':>15}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        items = server.VIDEO_MAPPER.map_many(make_records(size, video_fields))
+
+        started = time.perf_counter()
+        index = FacetIndex(items, server.VIDEO_FACETS)
+        build = time.perf_counter() - started
+
+        scan_queries = queries[:max(1, min(len(queries), 1_000_000 // size))]  # keep the slow path bounded
+        started = time.perf_counter()
+        expected = [scan_select(items, filters) for filters in scan_queries]
+        scan = (time.perf_counter() - started) / len(scan_queries)
+
+        started = time.perf_counter()
+        results = [index.select(filters) for filters in queries]
+        lookup = (time.perf_counter() - started) / len(queries)
+
+        for (selected, counts), (scanned, scanned_counts) in zip(results, expected):
+            assert [item.id for item in selected] == [item.id for item in scanned], "index disagrees with scan"
+            assert {facet: [(entry["value"], entry["count"]) for entry in entries if entry["count"]]
+                    for facet, entries in counts.items()} == scanned_counts, "facet counts disagree with scan"
+        print(f"{size:>8} {scan * 1e3:>14.2f} {build * 1e3:>15.1f} {lookup * 1e6:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Refresh CPU cost of mapping Airtable records: hand-written loop vs compiled mappers.
+
+The "hand-written" column replays the per-record normalization the video
+fetcher used to do inline; "compiled" is ``VIDEO_MAPPER.map_many``. The
+"extract" columns leave out pydantic model construction, which both paths
+share. Fetchers map one Airtable page (100 records) per call; the larger
+sizes show how a single very large batch behaves.
+
+    python benchmarks/bench_record_mapping.py [--sizes 10000,50000] [--repeat 3]
+"""
+import argparse
+import time
+
+from synthetic import article_fields, event_fields, make_records, podcast_fields, video_fields
+
+import server
+
+
+def handwritten_video(record):
+    """The inline normalization ``fetch_airtable_videos`` used before the mapping specs"""
+    fields = record.get("fields", {})
+    featured_speakers_raw = fields.get("Featured Speakers", "")
+    headshot_raw = fields.get("Headshot (from Featured Speakers)", [])
+    tags_raw = fields.get("Tags", [])
+    keywords_raw = fields.get("Keywords", [])
+
+    featured_speakers = ""
+    if featured_speakers_raw:
+        if isinstance(featured_speakers_raw, list):
+            featured_speakers = ", ".join(featured_speakers_raw)
+        else:
+            featured_speakers = str(featured_speakers_raw)
+
+    tags = []
+    if tags_raw:
+        if isinstance(tags_raw, list):
+            tags = tags_raw
+        elif isinstance(tags_raw, str):
+            tags = [tags_raw]
+
+    keywords = []
+    if keywords_raw:
+        if isinstance(keywords_raw, list):
+            for item in keywords_raw:
+                if isinstance(item, str) and ',' in item:
+                    keywords.extend([k.strip() for k in item.split(',') if k.strip()])
+                else:
+                    keywords.append(item)
+        elif isinstance(keywords_raw, str):
+            if ',' in keywords_raw:
+                keywords = [k.strip() for k in keywords_raw.split(',') if k.strip()]
+            else:
+                keywords = [keywords_raw]
+
+    headshot_url = None
+    if headshot_raw and isinstance(headshot_raw, list) and len(headshot_raw) > 0:
+        headshot_url = headshot_raw[0].get("url", "")
+
+    return dict(
+        id=record.get("id", ""),
+        video_description=fields.get("Video Description", ""),
+        vimeo_name=fields.get("Vimeo Name", ""),
+        featured_speakers=featured_speakers,
+        headshot=headshot_url,
+        category=fields.get("Category", ""),
+        tags=tags,
+        keywords=keywords,
+        vanguard_vimeo_link=fields.get("Vanguard Vimeo Link", ""),
+        vimeo_long_description=fields.get("Vimeo - long description", ""),
+        softr_order=fields.get("Softr Order (Videos Members Page)", 0)
+    )
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,50000", help="comma-separated record counts")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    print("videos (us/record)")
+    print(f"{'records':>8} {'hand extract':>13} {'compiled extract':>17} {'hand + model':>13} {'compiled + model':>17}")
+    for size in sizes:
+        records = make_records(size, video_fields)
+        extract = server.VIDEO_MAPPER.extract
+        hand = best_of(args.repeat, lambda: [handwritten_video(record) for record in records])
+        compiled = best_of(args.repeat, lambda: [extract(record) for record in records])
+        hand_models = best_of(args.repeat, lambda: [server.AirtableVideo(**handwritten_video(record))
+                                                     for record in records])
+        compiled_models = best_of(args.repeat, lambda: server.VIDEO_MAPPER.map_many(records))
+        per_record = [seconds / size * 1e6 for seconds in (hand, compiled, hand_models, compiled_models)]
+        print(f"{size:>8} {per_record[0]:>13.2f} {per_record[1]:>17.2f} {per_record[2]:>13.2f} {per_record[3]:>17.2f}")
+
+    print()
+    print("compiled mappers, extract + model (us/record)")
+    mappers = [("podcasts", server.PODCAST_MAPPER, podcast_fields), ("events", server.EVENT_MAPPER, event_fields),
+               ("articles", server.ARTICLE_MAPPER, article_fields)]
+    print(f"{'records':>8} " + " ".join(f"{name:>10}" for name, _, _ in mappers))
+    for size in sizes:
+        row = []
+        for _, mapper, fields_fn in mappers:
+            records = make_records(size, fields_fn)
+            row.append(best_of(args.repeat, lambda: mapper.map_many(records)) / size * 1e6)
+        print(f"{size:>8} " + " ".join(f"{cost:>10.2f}" for cost in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Build cost of the cross-type TF-IDF "related content" index, and lookup cost.
+
+The catalog is split evenly between videos, podcasts and articles. Build
+time is paid once per refresh of any of the three; lookups only merge
+precomputed neighbor lists.
+
+    python benchmarks/bench_related.py [--sizes 300,1000,5000,20000] [--queries 1000]
+
+All-pairs scoring is quadratic in catalog size; 300 is today's catalog
+(three views capped at 100 records each).
+"""
+import argparse
+import random
+import time
+
+from synthetic import article_fields, make_records, podcast_fields, video_fields
+
+import server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="300,1000,5000,20000", help="comma-separated total catalog sizes")
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'terms':>7} {'build ms':>9} {'us/lookup':>10} {'us/lookup (type)':>17}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        per_type = size // 3
+        # Distinct id ranges per table, as Airtable record ids are globally unique
+        collections = {
+            "videos": server.VIDEO_MAPPER.map_many(make_records(per_type, video_fields, seed=1)),
+            "podcasts": server.PODCAST_MAPPER.map_many(make_records(per_type, podcast_fields, seed=2)),
+            "articles": server.ARTICLE_MAPPER.map_many(make_records(per_type, article_fields, seed=3)),
+        }
+        for offset, items in enumerate(collections.values()):
+            for item in items:
+                item.id = f"{item.id}-{offset}"
+
+        started = time.perf_counter()
+        index = server.build_related_index(collections)
+        build = time.perf_counter() - started
+
+        ids = [item.id for items in collections.values() for item in items]
+        ids = random.Random(5).sample(ids, min(args.queries, len(ids)))
+        started = time.perf_counter()
+        for item_id in ids:
+            index.related(item_id)
+        lookup = (time.perf_counter() - started) / len(ids)
+        started = time.perf_counter()
+        for item_id in ids:
+            index.related(item_id, ["podcast"], 3)
+        typed = (time.perf_counter() - started) / len(ids)
+
+        print(f"{len(index.entries):>8} {index.vocabulary_size:>7} {build * 1e3:>9.1f} "
+              f"{lookup * 1e6:>10.1f} {typed * 1e6:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
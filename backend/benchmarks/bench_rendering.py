@@ -0,0 +1,63 @@
+"""Per-request cost of list bodies: FastAPI serialization vs pre-rendered snapshot bytes.
+
+"fastapi" is what a list route used to cost per request: validate the
+models against the route's response_model, convert them to JSON-ready data
+and encode them with the stdlib encoder. "pre-rendered" is the snapshot's
+body picked by content negotiation. Build times are paid once per refresh.
+
+    python benchmarks/bench_rendering.py [--sizes 100,1000,10000] [--requests 50]
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from synthetic import article_fields, make_records, video_fields
+
+import server
+
+COLLECTIONS = {"videos": (server.VIDEO_MAPPER, video_fields), "articles": (server.ARTICLE_MAPPER, article_fields)}
+
+
+async def fastapi_body(field, items) -> bytes:
+    content = await serialize_response(field=field, response_content=items, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000", help="comma-separated collection sizes")
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    fields = {route.path: route.response_field for route in server.app.routes if hasattr(route, "response_field")}
+
+    print(f"{'collection':>10} {'items':>6} {'MB':>6} {'build ms':>9} {'fastapi us':>11} "
+          f"{'pre-rendered us':>16} {'gzip KB':>8} {'br KB':>7}")
+    for name, (mapper, make_fields) in COLLECTIONS.items():
+        for size in (int(size) for size in args.sizes.split(",")):
+            items = mapper.map_many(make_records(size, make_fields))
+            started = time.perf_counter()
+            snapshot = server.CollectionSnapshot(name, items)
+            snapshot.body().precompress(brotli_quality=server.PRECOMPRESS_BROTLI_QUALITY)
+            build = time.perf_counter() - started
+
+            field = fields[f"/api/{name}"]
+            assert await fastapi_body(field, items) == snapshot.body().identity, "pre-rendered bytes differ"
+            started = time.perf_counter()
+            for _ in range(args.requests):
+                await fastapi_body(field, items)
+            before = (time.perf_counter() - started) / args.requests
+
+            started = time.perf_counter()
+            for _ in range(args.requests):
+                snapshot.body().negotiate("gzip, deflate, br")
+            after = (time.perf_counter() - started) / args.requests
+
+            body = snapshot.body()
+            print(f"{name:>10} {size:>6} {len(body.identity) / 1e6:>6.2f} {build * 1e3:>9.1f} {before * 1e6:>11.0f} "
+                  f"{after * 1e6:>16.2f} {len(body.encoded('gzip')) / 1e3:>8.1f} {len(body.encoded('br')) / 1e3:>7.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
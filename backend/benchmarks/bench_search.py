@@ -0,0 +1,58 @@
+"""/api/search cost: BM25 index build per collection and query latency over the whole catalog.
+
+Items are split evenly across the five searchable collections. Queries mix
+rare terms (titles, speaker names) with words that occur in every body.
+
+    python benchmarks/bench_search.py [--sizes 500,5000,50000] [--queries 300]
+"""
+import argparse
+import random
+import time
+
+from synthetic import SPEAKERS, article_fields, make_records, podcast_fields, video_fields
+
+import server
+from search import search
+
+QUERIES = ["leadership", "governance future", "video 17", "podcast 3 leadership", "executives ideas functions"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="500,5000,50000", help="comma-separated total catalog sizes")
+    parser.add_argument("--queries", type=int, default=300)
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'build ms':>9} {'us/query':>9} {'us/query (top 1)':>17}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        per_type = size // 5
+        records = {
+            "videos": server.VIDEO_MAPPER.map_many(make_records(per_type, video_fields, seed=1)),
+            "podcasts": server.PODCAST_MAPPER.map_many(make_records(per_type, podcast_fields, seed=2)),
+            "articles": server.ARTICLE_MAPPER.map_many(make_records(per_type, article_fields, seed=3)),
+            "newsroom": server.NEWSROOM_MAPPER.map_many(make_records(per_type, article_fields, seed=4)),
+            "in_the_press": server.IN_THE_PRESS_MAPPER.map_many(make_records(per_type, article_fields, seed=5)),
+        }
+        started = time.perf_counter()
+        indexes = {content_type: build(records[collection])
+                   for content_type, (collection, build) in server.SEARCH_TYPES.items()}
+        build_time = time.perf_counter() - started
+
+        rng = random.Random(11)
+        queries = [rng.choice(QUERIES + [rng.choice(SPEAKERS)]) for _ in range(args.queries)]
+        started = time.perf_counter()
+        for query in queries:
+            search(indexes, query, 10)
+        query_time = (time.perf_counter() - started) / len(queries)
+
+        # One result, so scoring dominates rather than snippet rendering
+        started = time.perf_counter()
+        for query in queries:
+            search(indexes, query, 1)
+        scoring_time = (time.perf_counter() - started) / len(queries)
+
+        print(f"{size:>8} {build_time * 1e3:>9.1f} {query_time * 1e6:>9.1f} {scoring_time * 1e6:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
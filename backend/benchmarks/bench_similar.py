@@ -0,0 +1,71 @@
+"""/similar lookups: per-request full scan vs the snapshot's inverted keyword index.
+
+"scan" is what the routes used to do per request (set intersection against
+every item, then a full sort). "index" is ``KeywordIndex``: build cost is
+paid once per refresh, queries walk only the target's postings lists
+("cold"), and repeats are memoized ("warm").
+
+    python benchmarks/bench_similar.py [--sizes 1000,10000,100000] [--queries 200]
+"""
+import argparse
+import random
+import time
+
+from synthetic import make_records, podcast_fields
+
+import server
+from similarity import KeywordIndex
+
+
+def scan_similar(items, item_id, k=3):
+    """The per-request algorithm the /similar routes used before the index"""
+    target = next((item for item in items if item.id == item_id), None)
+    if not target or not target.keywords:
+        return []
+    target_keywords = set(target.keywords)
+    similar = []
+    for item in items:
+        if item.id == item_id or not item.keywords:
+            continue
+        overlap = len(target_keywords.intersection(set(item.keywords)))
+        if overlap > 0:
+            similar.append((item, overlap))
+    similar.sort(key=lambda pair: pair[1], reverse=True)
+    return [item for item, _ in similar[:k]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated catalog sizes")
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'scan ms/query':>14} {'index build ms':>15} {'cold us/query':>14} {'warm us/query':>14}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        items = server.PODCAST_MAPPER.map_many(make_records(size, podcast_fields))
+        ids = [item.id for item in random.Random(3).sample(items, min(args.queries, size))]
+
+        started = time.perf_counter()
+        index = KeywordIndex(items)
+        build = time.perf_counter() - started
+
+        scan_ids = ids[:max(1, min(len(ids), 2_000_000 // size))]  # keep the slow path bounded
+        started = time.perf_counter()
+        expected = [scan_similar(items, item_id) for item_id in scan_ids]
+        scan = (time.perf_counter() - started) / len(scan_ids)
+
+        started = time.perf_counter()
+        cold = [index.similar(item_id) for item_id in ids]
+        cold_time = (time.perf_counter() - started) / len(ids)
+        started = time.perf_counter()
+        for item_id in ids:
+            index.similar(item_id)
+        warm_time = (time.perf_counter() - started) / len(ids)
+
+        assert [[item.id for item in result] for result in cold[:len(scan_ids)]] == \
+               [[item.id for item in result] for result in expected], "index disagrees with scan"
+        print(f"{size:>8} {scan * 1e3:>14.2f} {build * 1e3:>15.1f} {cold_time * 1e6:>14.1f} {warm_time * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""/api/suggest cost: per-keystroke lookup with ``SuggestIndex`` vs a linear scan.
+
+Every synthetic title and speaker goes in, as ``build_suggest_index`` does for
+the live collections. Prefixes are typed one character at a time, so short
+(broad) prefixes that match most of the catalog dominate, as they do in a
+real search box.
+
+    python benchmarks/bench_suggest.py [--sizes 1000,10000,100000]
+"""
+import argparse
+import time
+
+from synthetic import article_fields, make_records, podcast_fields, video_fields
+
+import server
+from suggest import normalize
+
+TYPED = ["l", "le", "lea", "lead", "v", "vi", "vid", "video 1", "s", "sp", "speaker 4", "p", "po", "fut", "gov"]
+
+
+def scan_suggest(index, prefix, limit=8):
+    """Check every suggestion's word starts, then sort; what a route without an index would do"""
+    normalized = normalize(prefix)
+    matches = [suggestion for suggestion in index.suggestions
+               if (" " + normalize(suggestion.text)).find(" " + normalized) >= 0]
+    matches.sort(key=lambda suggestion: -suggestion.weight)
+    return matches[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated total catalog sizes")
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'keys':>8} {'build ms':>9} {'scan us/key':>12} {'index us/key':>13}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        per_type = size // 3
+        collections = {
+            "videos": server.VIDEO_MAPPER.map_many(make_records(per_type, video_fields, seed=1)),
+            "podcasts": server.PODCAST_MAPPER.map_many(make_records(per_type, podcast_fields, seed=2)),
+            "articles": server.ARTICLE_MAPPER.map_many(make_records(per_type, article_fields, seed=3)),
+            "gc_members": [],
+        }
+        started = time.perf_counter()
+        index = server.build_suggest_index(collections)
+        build = time.perf_counter() - started
+
+        scan_prefixes = TYPED[:max(1, min(len(TYPED), 300_000 // size))]  # keep the slow path bounded
+        started = time.perf_counter()
+        expected = [scan_suggest(index, prefix) for prefix in scan_prefixes]
+        scan = (time.perf_counter() - started) / len(scan_prefixes)
+
+        rounds = 200
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for prefix in TYPED:
+                index.suggest(prefix)
+        lookup = (time.perf_counter() - started) / (rounds * len(TYPED))
+
+        # Same weights in the same order; equal-weight ties may pick different suggestions
+        assert [[suggestion.weight for suggestion in index.suggest(prefix)] for prefix in scan_prefixes] == \
+               [[suggestion.weight for suggestion in result] for result in expected], "index disagrees with scan"
+        print(f"{len(index.suggestions):>8} {len(index.keys):>8} {build * 1e3:>9.1f} "
+              f"{scan * 1e6:>12.1f} {lookup * 1e6:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Synthetic Airtable records and a fake Airtable transport for benchmarks.
+
+Nothing here talks to the real Airtable API; the fake transport serves
+generated records with a configurable per-request latency.
+"""
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+# Make ``import server`` work when a benchmark is run from anywhere
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+KEYWORDS = [f"keyword-{i}" for i in range(400)]
+TAGS = ["Leadership", "Legal", "Life Sciences", "Risk", "Strategy", "Culture", "Innovation", "Governance"]
+CATEGORIES = ["Keynote", "Panel", "Fireside Chat", "Workshop", "Interview"]
+SPEAKERS = [f"Speaker {i}" for i in range(250)]
+LOREM = ("The Vanguard Network brings senior executives together to exchange ideas on leadership, "
+         "governance and the future of their functions. ") * 4
+
+
+def attachment(rng, name):
+    return [{"id": f"att{rng.randrange(10**8)}", "url": f"https://dl.airtable.com/{name}.jpg",
+             "filename": f"{name}.jpg", "size": rng.randrange(10**6), "type": "image/jpeg",
+             "thumbnails": {"small": {"url": f"https://dl.airtable.com/{name}-s.jpg", "width": 36, "height": 36},
+                            "large": {"url": f"https://dl.airtable.com/{name}-l.jpg", "width": 512, "height": 512}}}]
+
+
+def video_fields(i, rng):
+    return {
+        "Video Description": f"Video {i} description",
+        "Vimeo Name": f"Video {i}",
+        "Featured Speakers": rng.sample(SPEAKERS, 2),
+        "Headshot (from Featured Speakers)": attachment(rng, f"video-{i}"),
+        "Category": rng.choice(CATEGORIES),
+        "Tags": rng.sample(TAGS, 2),
+        "Keywords": [", ".join(rng.sample(KEYWORDS, 4))],
+        "Vanguard Vimeo Link": f"https://vimeo.com/{100000 + i}",
+        "Vimeo - long description": LOREM,
+        "Softr Order (Videos Members Page)": i,
+    }
+
+
+def podcast_fields(i, rng):
+    return {
+        "Title": f"Podcast {i}",
+        "Thumbnail": attachment(rng, f"podcast-{i}"),
+        "Featured Speaker for Linked In": rng.sample(SPEAKERS, 1),
+        "Description": LOREM,
+        "Soundcloud Embed code (medium)": f"<iframe src=\"https://w.soundcloud.com/player/?url={i}\"></iframe>",
+        "Keywords": rng.sample(KEYWORDS, 4),
+        "Release date": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}",
+    }
+
+
+def article_fields(i, rng):
+    return {
+        "Blog Title": f"Article {i}",
+        "Description (teaser)": f"Teaser for article {i}",
+        "Photo": attachment(rng, f"article-{i}"),
+        "Social:Image": attachment(rng, f"article-social-{i}"),
+        "Featured Speaker for Linked In": rng.sample(SPEAKERS, 2),
+        "Featured Speakers": rng.sample(SPEAKERS, 2),
+        "Body of Q&A": LOREM * 3,
+        "Body of Blog": LOREM * 6,
+        "tags": rng.sample(TAGS, 2),
+        "Published to Web": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}",
+        "Publish By": f"2025-{1 + i % 12:02d}-{1 + i % 28:02d}",
+        "Type of detailed content": ["Q&A"],
+        "Type of News": ["Announcement"],
+        "Keywords (From video)": rng.sample(KEYWORDS, 4),
+        "Internal Notes": LOREM,
+    }
+
+
+def event_fields(i, rng):
+    return {
+        "Event Title": f"Event {i}",
+        "Date & Time being/end": "June 5, 2026 9:00 AM - 11:00 AM",
+        "Start Date": f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}",
+        "Listing Picture": attachment(rng, f"event-{i}"),
+        "Append to magic link": f"?event={i}",
+        "Session Leader Name": rng.sample(SPEAKERS, 1),
+        "Location": "New York",
+        "Audience (Network)": ["GC Exchange"],
+    }
+
+
+def member_fields(i, rng):
+    return {
+        "Name": f"Member {i}",
+        "WholeName": f"Member {i}",
+        "Headshot": attachment(rng, f"member-{i}"),
+        "Emergent Headshot": attachment(rng, f"team-{i}"),
+        "Company": f"Company {i % 50}",
+        "Position": "General Counsel",
+        "Title (External)": "Managing Director",
+        "Job Description (Public)": LOREM,
+        "Emergent LinkedIn": f"https://linkedin.com/in/member-{i}",
+        "Emergent Section": "Leadership",
+    }
+
+
+def fields_for_table(table_id):
+    """Pick the synthetic field generator matching a real table id"""
+    import server
+    return {
+        server.VIDEOS_TABLE_ID: video_fields,
+        server.PODCASTS_TABLE_ID: podcast_fields,
+        server.ARTICLES_TABLE_ID: article_fields,
+        server.EVENTS_TABLE_ID: event_fields,
+    }.get(table_id, member_fields)
+
+
+def make_records(count, fields_fn, seed=7):
+    rng = random.Random(seed)
+    return [{"id": f"rec{i:014d}", "createdTime": "2025-01-01T00:00:00.000Z", "fields": fields_fn(i, rng)}
+            for i in range(count)]
+
+
+class FakeAirtable:
+    """Serves generated tables over an ``httpx`` mock transport"""
+
+    def __init__(self, records_per_table=100, latency=0.05, page_size=100, blocking=False):
+        self.records_per_table = records_per_table
+        self.latency = latency
+        self.page_size = page_size
+        self.blocking = blocking
+        self.requests = 0
+        self._tables = {}
+
+    def _records(self, table_id):
+        if table_id not in self._tables:
+            self._tables[table_id] = make_records(self.records_per_table, fields_for_table(table_id))
+        return self._tables[table_id]
+
+    def _respond(self, request):
+        self.requests += 1
+        table_id = request.url.path.rstrip("/").split("/")[-1]
+        records = self._records(table_id)
+        record_ids = re.findall(r"RECORD_ID\(\)='(\w+)'", request.url.params.get("filterByFormula", ""))
+        if record_ids:
+            records = [record for record in records if record["id"] in record_ids]
+        total = min(len(records), int(request.url.params.get("maxRecords") or len(records)))
+        offset = int(request.url.params.get("offset") or 0)
+        end = min(offset + self.page_size, total)
+        page = records[offset:end]
+        fields = request.url.params.get_list("fields[]")
+        if fields:
+            # Like Airtable, return only the requested columns
+            page = [{**record, "fields": {name: value for name, value in record["fields"].items() if name in fields}}
+                    for record in page]
+        payload = {"records": page}
+        if end < total:
+            payload["offset"] = str(end)
+        return httpx.Response(200, content=json.dumps(payload).encode(), headers={"Content-Type": "application/json"})
+
+    def transport(self):
+        if self.blocking:
+            # Emulates the old synchronous ``requests.get`` call on the event loop thread
+            def handler(request):
+                time.sleep(self.latency)
+                return self._respond(request)
+        else:
+            async def handler(request):
+                await asyncio.sleep(self.latency)
+                return self._respond(request)
+        return httpx.MockTransport(handler)
@@ -0,0 +1,128 @@
+"""HTTP caching policy for content routes, and surrogate-key purging for edge caches.
+
+Every content response carries ``Cache-Control`` from its collection's
+``CachePolicy`` and a ``Surrogate-Key`` header naming what it was built
+from: collection names for listings and anything derived from a whole
+collection, record ids for detail pages. An edge cache (Fastly, or any CDN
+that understands surrogate keys) can then hold responses for ``s-maxage``
+while browsers revalidate after ``max-age``. When a refresh changes records,
+``SurrogatePurger`` purges just the changed ids and their collection.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+PURGE_BATCH = 256  # keys per purge request (Fastly's limit for batch surrogate-key purges)
+
+
+class CachePolicy(NamedTuple):
+    """Cache-Control lifetimes in seconds"""
+    max_age: int  # browsers
+    s_maxage: int  # shared caches, which are purged on change
+    stale_while_revalidate: int
+    stale_if_error: int
+
+    def header(self) -> str:
+        return (f"public, max-age={self.max_age}, s-maxage={self.s_maxage}, "
+                f"stale-while-revalidate={self.stale_while_revalidate}, stale-if-error={self.stale_if_error}")
+
+    @classmethod
+    def parse(cls, text: str) -> "CachePolicy":
+        """A policy from Cache-Control style directives, e.g. "max-age=60, s-maxage=300"; omitted ones default"""
+        values = DEFAULT_POLICY._asdict()
+        for directive in text.split(","):
+            name, _, seconds = directive.strip().partition("=")
+            attribute = name.strip().lower().replace("-", "_")
+            if attribute not in values or not seconds.strip().isdigit():
+                raise ValueError(f"Unsupported cache directive: {directive.strip()}")
+            values[attribute] = int(seconds)
+        return cls(**values)
+
+
+def strictest(policies: Iterable[CachePolicy]) -> CachePolicy:
+    """The shortest of every lifetime, for responses built from several collections"""
+    return CachePolicy(*(min(values) for values in zip(*policies)))
+
+
+DEFAULT_POLICY = CachePolicy(max_age=300, s_maxage=3600, stale_while_revalidate=3600, stale_if_error=86400)
+
+# Events change within the day; the team and GC member directories rarely do
+COLLECTION_POLICIES = {
+    "events": CachePolicy(max_age=60, s_maxage=300, stale_while_revalidate=600, stale_if_error=86400),
+    "team": CachePolicy(max_age=3600, s_maxage=86400, stale_while_revalidate=86400, stale_if_error=604800),
+    "gc_members": CachePolicy(max_age=3600, s_maxage=86400, stale_while_revalidate=86400, stale_if_error=604800),
+}
+
+
+def collection_policies(names: Iterable[str]) -> Dict[str, CachePolicy]:
+    """Policy per collection; override with e.g. CACHE_POLICY_EVENTS="max-age=30, s-maxage=120" """
+    policies = {}
+    for name in names:
+        override = os.environ.get(f'CACHE_POLICY_{name.upper()}')
+        policies[name] = CachePolicy.parse(override) if override else COLLECTION_POLICIES.get(name, DEFAULT_POLICY)
+    return policies
+
+
+class SurrogatePurger:
+    """Sends purge events for changed surrogate keys.
+
+    Each event is logged and kept in a short history (see ``stats()``). When
+    ``url`` is set, the keys are also POSTed there as
+    ``{"surrogate_keys": [...]}`` in batches of ``PURGE_BATCH``, with
+    ``token`` as a bearer token, over one pooled client that ``close()``
+    shuts down; failures are logged and not retried, since ``s-maxage``
+    bounds how long an edge can serve a missed purge.
+    """
+
+    def __init__(self, url: Optional[str] = None, token: Optional[str] = None, timeout: float = 5.0,
+                 history: int = 50, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.url = url
+        self.token = token
+        self.transport = transport
+        self.timeout = timeout
+        self.recent = deque(maxlen=history)
+        self.sent = 0
+        self.failed = 0
+        self._tasks = set()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def purge(self, keys: List[str]):
+        if not keys:
+            return
+        self.recent.append({"at": time.time(), "keys": keys[:20], "count": len(keys)})
+        logger.info(f"Purging {len(keys)} surrogate key(s): {' '.join(keys[:10])}{' ...' if len(keys) > 10 else ''}")
+        if self.url:
+            task = asyncio.create_task(self._send(keys))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, keys: List[str]):
+        if self._client is None or self._client.is_closed:
+            headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+            self._client = httpx.AsyncClient(timeout=self.timeout, headers=headers, transport=self.transport)
+        try:
+            for start in range(0, len(keys), PURGE_BATCH):
+                response = await self._client.post(self.url, json={"surrogate_keys": keys[start:start + PURGE_BATCH]})
+                response.raise_for_status()
+            self.sent += 1
+        except Exception as e:
+            self.failed += 1
+            logger.warning(f"Surrogate-key purge of {len(keys)} key(s) failed: {str(e)}")
+
+    async def close(self):
+        """Wait briefly for in-flight purges, then close the connection pool"""
+        if self._tasks:
+            await asyncio.wait(self._tasks, timeout=self.timeout)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> dict:
+        return {"sent": self.sent, "failed": self.failed, "pending": len(self._tasks), "recent": list(self.recent)}
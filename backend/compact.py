@@ -0,0 +1,92 @@
+"""Compact records for collection snapshots.
+
+Snapshots hold their records for as long as they are current, in every
+worker, and a pydantic instance is expensive to keep: an instance
+``__dict__``, a ``fields_set`` set and a growable list per list field, with
+the same tag, keyword, category and speaker strings repeated across
+thousands of records. ``compact_items`` copies validated models into
+generated ``__slots__`` classes instead. These have the same attribute
+names, so indexes and routes read them exactly like the models. List fields
+become tuples, identical tuples are shared, and short strings are interned.
+
+Response bodies are rendered from ``model_dump()``. Routes that still hand
+records to FastAPI take ``view()``, which rebuilds the pydantic model
+without re-validating it.
+"""
+import sys
+from operator import attrgetter
+from typing import Dict, Iterable, List
+
+INTERN_MAX_LENGTH = 128  # longer strings (descriptions, bodies, URLs) are rarely shared
+
+_classes: Dict[type, type] = {}
+
+
+class CompactRecord:
+    """Base of the generated slot classes; ``model`` is the pydantic model a class stands in for"""
+
+    __slots__ = ()
+    model = None
+    _values = None  # attrgetter over every slot, set per generated class
+
+    def model_dump(self) -> dict:
+        """Field values as the model would dump them (lists, not tuples)"""
+        return {name: list(value) if type(value) is tuple else value
+                for name, value in zip(self.__slots__, self._values(self))}
+
+    def view(self):
+        """The pydantic model for this record, trusted as already validated"""
+        return self.model.model_construct(**self.model_dump())
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values(self) == other._values(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={value!r}" for name, value in zip(self.__slots__, self._values(self)))
+        return f"{type(self).__name__}({values})"
+
+
+def compact_class(model) -> type:
+    """The slot class for a pydantic model, generated once"""
+    cls = _classes.get(model)
+    if cls is None:
+        fields = tuple(model.model_fields)
+        cls = _classes[model] = type(f"Compact{model.__name__}", (CompactRecord,), {
+            "__slots__": fields,
+            "model": model,
+            "_values": staticmethod(attrgetter(*fields) if len(fields) > 1
+                                    else (lambda record: (getattr(record, fields[0]),))),
+        })
+    return cls
+
+
+def _compact_value(value, tuples: Dict[tuple, tuple]):
+    if type(value) is str:
+        return sys.intern(value) if len(value) <= INTERN_MAX_LENGTH else value
+    if type(value) is list:
+        value = tuple(sys.intern(element) if type(element) is str and len(element) <= INTERN_MAX_LENGTH
+                      else element for element in value)
+        try:
+            return tuples.setdefault(value, value)
+        except TypeError:  # unhashable elements
+            return value
+    return value
+
+
+def compact_items(items: Iterable) -> List[CompactRecord]:
+    """Compact copies of validated models (already compact records are kept as they are)"""
+    tuples: Dict[tuple, tuple] = {}
+    compacted = []
+    for item in items:
+        if not isinstance(item, CompactRecord):
+            record = object.__new__(compact_class(type(item)))
+            values = item.__dict__
+            for name in record.__slots__:
+                object.__setattr__(record, name, _compact_value(values[name], tuples))
+            item = record
+        compacted.append(item)
+    return compacted
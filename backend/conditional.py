@@ -0,0 +1,83 @@
+"""Content hashes and HTTP conditional-request validators.
+
+Snapshots hash every record's JSON form once, when they are built; routes
+turn those hashes into strong ``ETag`` values and answer ``If-None-Match``
+(or, without it, ``If-Modified-Since``) before doing any other work.
+"""
+import hashlib
+import json
+import re
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Mapping, Optional
+
+HASH_BYTES = 16
+# Compressed variants of a body are tagged "<hash>-<coding>" (see variant_etag)
+CODING_SUFFIX = re.compile(r'-(?:br|gzip)"$')
+
+
+def digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=HASH_BYTES).hexdigest()
+
+
+def content_hash(item) -> str:
+    """Hex digest of a record's JSON form (pydantic models, compact records or plain dicts)"""
+    if hasattr(item, "model_dump_json"):
+        return digest(item.model_dump_json().encode())
+    if hasattr(item, "model_dump"):
+        item = item.model_dump()
+    return digest(json.dumps(item, sort_keys=True, separators=(",", ":"), default=str).encode())
+
+
+def combine_hashes(hashes: Iterable[str]) -> str:
+    """One digest for an ordered sequence of digests (or of any strings that identify a variant)"""
+    combined = hashlib.blake2b(digest_size=HASH_BYTES)
+    for value in hashes:
+        combined.update(value.encode())
+        combined.update(b"\0")
+    return combined.hexdigest()
+
+
+def variant_etag(etag: str, encoding: Optional[str]) -> str:
+    """The strong ETag of a content-coded variant; each coding has distinct bytes, so a distinct tag"""
+    return f'{etag[:-1]}-{encoding}"' if encoding else etag
+
+
+def http_date(moment: datetime) -> str:
+    """IMF-fixdate for a naive UTC datetime, e.g. for Last-Modified"""
+    return format_datetime(moment.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def _entity_tags(if_none_match: str):
+    return [tag[2:] if tag.startswith("W/") else tag for tag in (tag.strip() for tag in if_none_match.split(","))]
+
+
+def matched_etag(headers: Mapping[str, str], etag: str) -> Optional[str]:
+    """The variant of ``etag`` (as tagged by ``variant_etag``) that the client's If-None-Match holds, if any"""
+    for tag in _entity_tags(headers.get("if-none-match") or ""):
+        if CODING_SUFFIX.sub('"', tag) == etag:
+            return tag
+    return None
+
+
+def is_fresh(headers: Mapping[str, str], etag: str, modified: Optional[datetime]) -> bool:
+    """Whether the client's cached copy is current (RFC 9110 section 13.2.2).
+
+    ``If-None-Match`` is compared weakly against ``etag``, ignoring any
+    content-coding suffix; ``If-Modified-Since`` is only consulted when the
+    request has no ``If-None-Match``.
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [CODING_SUFFIX.sub('"', tag) for tag in _entity_tags(if_none_match)]
+        return "*" in tags or etag in tags
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since and modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+    return False
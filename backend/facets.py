@@ -0,0 +1,83 @@
+"""Precomputed facet indexes for filtering a collection snapshot.
+
+``FacetIndex`` keeps, for every value of every facet, the sorted positions
+of the items carrying it (built once per snapshot by ``CollectionCache``).
+A query turns each filtered facet into a boolean mask over the snapshot:
+values of one facet are ORed, facets are ANDed. Counts follow the usual
+multi-select convention: a facet's counts apply every filter except its own,
+so picking a category still shows how many items the other categories hold.
+"""
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class FacetIndex:
+    """Sorted position arrays per facet value over one snapshot's items.
+
+    ``facets`` maps a facet name to a function returning the values an item
+    carries (None and blank values are skipped).
+    """
+
+    def __init__(self, items: list, facets: Mapping[str, Callable[[object], Iterable[Optional[str]]]]):
+        self.items = items
+        self.postings: Dict[str, Dict[str, np.ndarray]] = {}
+        # Per facet: value names, and every posting's value number, for counting in one bincount
+        self._values: Dict[str, List[str]] = {}
+        self._flat: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for facet, values in facets.items():
+            positions: Dict[str, List[int]] = {}
+            for position, item in enumerate(items):
+                for value in dict.fromkeys(value.strip() for value in values(item) if value and value.strip()):
+                    positions.setdefault(value, []).append(position)
+            names = list(positions)
+            postings = {value: np.asarray(positions[value], dtype=np.int32) for value in names}
+            self.postings[facet] = postings
+            self._values[facet] = names
+            self._flat[facet] = (
+                np.concatenate([postings[value] for value in names]) if names else np.zeros(0, dtype=np.int32),
+                np.repeat(np.arange(len(names), dtype=np.int32), [len(postings[value]) for value in names])
+            )
+
+    def _mask(self, facet: str, values: Sequence[str]) -> np.ndarray:
+        mask = np.zeros(len(self.items), dtype=bool)
+        postings = self.postings[facet]
+        for value in values:
+            found = postings.get(value)
+            if found is not None:
+                mask[found] = True
+        return mask
+
+    def select(self, filters: Mapping[str, Sequence[str]]) -> Tuple[list, Dict[str, List[dict]]]:
+        """Items matching ``filters`` ({facet: [values]}) in snapshot order, and counts for every facet.
+
+        Counts are lists of {"value", "count"}, largest first, and always
+        include the selected values (with a zero count if nothing matches).
+        """
+        unknown = set(filters) - set(self.postings)
+        if unknown:
+            raise KeyError(f"Unknown facet(s): {', '.join(sorted(unknown))}")
+        masks = {facet: self._mask(facet, values) for facet, values in filters.items() if values}
+
+        matched = np.ones(len(self.items), dtype=bool)
+        for mask in masks.values():
+            matched &= mask
+        items = [self.items[position] for position in np.flatnonzero(matched)]
+
+        counts = {}
+        for facet, names in self._values.items():
+            # Every filter but this facet's own
+            base = np.ones(len(self.items), dtype=bool)
+            for other, mask in masks.items():
+                if other != facet:
+                    base &= mask
+            flat_positions, flat_values = self._flat[facet]
+            value_counts = np.bincount(flat_values[base[flat_positions]], minlength=len(names))
+            selected = set(filters.get(facet) or ())
+            facet_counts = [{"value": names[number], "count": int(value_counts[number])}
+                            for number in np.flatnonzero(value_counts)]
+            counted = {entry["value"] for entry in facet_counts}
+            facet_counts.extend({"value": value, "count": 0} for value in selected if value not in counted)
+            facet_counts.sort(key=lambda entry: (-entry["count"], entry["value"]))
+            counts[facet] = facet_counts
+        return items, counts
@@ -0,0 +1,74 @@
+"""Cursor pagination and sparse field selection for list routes.
+
+Cursors are opaque to clients: URL-safe base64 of the last returned
+record's id and its position in the snapshot. A page resumes after that
+record's current position, so records added or removed by a refresh in
+between do not make the rest of a listing repeat or skip; if the record
+itself has gone, its old position is used instead.
+"""
+import base64
+import binascii
+import json
+import math
+from bisect import bisect_right
+from typing import Callable, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+
+class Page(NamedTuple):
+    items: list
+    next_cursor: Optional[str]  # None on the last page
+
+
+def encode_cursor(item_id: str, position: int) -> str:
+    raw = json.dumps([item_id, position], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """(record id, snapshot position) from a cursor; ValueError if it was not made by ``encode_cursor``"""
+    try:
+        item_id, position = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor") from None
+    if not isinstance(item_id, str) or not isinstance(position, int) or position < 0:
+        raise ValueError("Invalid cursor")
+    return item_id, position
+
+
+def paginate(items: list, positions: Mapping[str, int], cursor: Optional[str] = None, limit: Optional[int] = None,
+             position_of: Optional[Callable[[object], int]] = None) -> Page:
+    """One page of ``items``, which are in snapshot order.
+
+    ``positions`` maps record ids to snapshot positions. ``items`` may be a
+    subset of the snapshot (e.g. filtered), in which case ``position_of``
+    gives each item's snapshot position; by default an item's index is its
+    position. Without ``limit`` the page runs to the end.
+    """
+    start = 0
+    if cursor:
+        item_id, position = decode_cursor(cursor)
+        # Half a step back when the record is gone: resume at whatever now holds its position
+        after = positions[item_id] if item_id in positions else position - 0.5
+        start = bisect_right(items, after, key=position_of) if position_of else math.floor(after) + 1
+    stop = len(items) if limit is None else min(len(items), start + limit)
+    page = items[start:stop]
+    if not page or stop >= len(items):
+        return Page(page, None)
+    last = page[-1]
+    return Page(page, encode_cursor(last.id, position_of(last) if position_of else stop - 1))
+
+
+def parse_fields(value: Optional[str], model) -> Optional[Tuple[str, ...]]:
+    """Comma-separated ``fields`` parameter as model field names in model order (always with id), or None"""
+    if not value:
+        return None
+    names = {name.strip() for name in value.split(",") if name.strip()}
+    unknown = sorted(names - set(model.model_fields))
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    return tuple(name for name in model.model_fields if name == "id" or name in names)
+
+
+def select_fields(items: Iterable, fields: Tuple[str, ...]) -> List[dict]:
+    """Sparse records: just ``fields`` of each model, as plain dicts ready for JSON"""
+    return [{name: getattr(item, name) for name in fields} for item in items]
@@ -0,0 +1,266 @@
+"""Declarative mapping from Airtable records to the API models.
+
+Each model is described once as ``{attribute: rule}``, where a rule names the
+Airtable field(s) it reads and how the raw value is normalized (list-or-string
+joins, first attachment URL, keyword splitting, ...). ``RecordMapper``
+compiles a spec into a single generated extractor function, so a refresh
+costs one dict literal per record instead of a chain of ``isinstance``
+branches, and maps whole pages of records in one call. Extracted values are
+validated a page at a time through a cached ``TypeAdapter``, one call into
+pydantic-core per page rather than one per record.
+
+The spec also knows which fields it reads, so ``RecordMapper.source_fields``
+is exactly the ``fields[]`` projection to request from Airtable.
+"""
+import functools
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from pydantic import TypeAdapter
+
+VALIDATE_BATCH = 100  # records per validation call (one Airtable page)
+
+
+def join_values(raw) -> str:
+    """Linked/multi-select values as one display string ("A, B"); scalars as str"""
+    if not raw:
+        return ""
+    if isinstance(raw, list):
+        return ", ".join(raw)
+    return str(raw)
+
+
+def as_list(raw) -> list:
+    """Multi-select values as a list; a single string becomes a one-item list"""
+    if not raw:
+        return []
+    if isinstance(raw, list):
+        return raw
+    if isinstance(raw, str):
+        return [raw]
+    return []
+
+
+def split_commas(raw) -> list:
+    """Like ``as_list``, but comma-separated strings are split into trimmed items"""
+    if not raw:
+        return []
+    if isinstance(raw, str):
+        raw = [raw]
+    elif not isinstance(raw, list):
+        return []
+    values = []
+    for item in raw:
+        if isinstance(item, str) and ',' in item:
+            values.extend([part for part in map(str.strip, item.split(',')) if part])
+        else:
+            values.append(item)
+    return values
+
+
+def attachment_url(raw) -> Optional[str]:
+    """URL of the first file in an attachment field, or None if it has none"""
+    if raw and isinstance(raw, list):
+        return raw[0].get("url", "")
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def list_adapter(model) -> TypeAdapter:
+    """``TypeAdapter(List[model])``, built once per model"""
+    return TypeAdapter(List[model])
+
+
+def validate_many(model, values: Sequence[dict]) -> list:
+    """Models for a list of attribute dicts, validated in one call"""
+    return list_adapter(model).validate_python(values)
+
+
+class Rule(ABC):
+    """How one model attribute is read from a record's ``fields``"""
+
+    sources: Sequence[str] = ()
+
+    @abstractmethod
+    def compile(self) -> Callable[[dict], Any]:
+        """A function from a record's ``fields`` to the attribute's value"""
+
+    def inline(self, ref: str, namespace: dict) -> Optional[str]:
+        """Python expression over ``fields`` to splice into the extractor, or None to call ``compile()``.
+
+        Helpers the expression needs are bound in ``namespace`` under names prefixed with ``ref``.
+        """
+        return None
+
+
+class value(Rule):
+    """A field as-is, or ``default`` when it is missing"""
+
+    def __init__(self, name: str, default: Any = ""):
+        self.sources = (name,)
+        self.default = default
+
+    def compile(self):
+        name, default = self.sources[0], self.default
+        return lambda fields: fields.get(name, default)
+
+    def inline(self, ref, namespace):
+        if self.default is None or isinstance(self.default, (str, int, float, bool)):
+            return f"fields.get({self.sources[0]!r}, {self.default!r})"
+        return None
+
+
+class _Converted(Rule):
+    """A single field passed through a normalizing function"""
+
+    convert: Callable[[Any], Any] = None
+
+    def __init__(self, name: str):
+        self.sources = (name,)
+
+    def compile(self):
+        name, convert = self.sources[0], self.convert
+        return lambda fields: convert(fields.get(name))
+
+    def inline(self, ref, namespace):
+        namespace[f"{ref}_convert"] = self.convert
+        return f"{ref}_convert(fields.get({self.sources[0]!r}))"
+
+
+class joined(_Converted):
+    """A list-or-string field as one string (``join_values``)"""
+    convert = staticmethod(join_values)
+
+
+class string_list(_Converted):
+    """A list-or-string field as a list (``as_list``), optionally splitting commas (``split_commas``)"""
+
+    def __init__(self, name: str, split: bool = False):
+        super().__init__(name)
+        self.convert = split_commas if split else as_list
+
+
+class first_attachment(Rule):
+    """URL of the first attachment in the first of ``names`` that has any, else None"""
+
+    def __init__(self, *names: str):
+        self.sources = names
+
+    def compile(self):
+        names = self.sources
+        if len(names) == 1:
+            name = names[0]
+            return lambda fields: attachment_url(fields.get(name))
+
+        def extract(fields):
+            for name in names:
+                raw = fields.get(name)
+                if raw and isinstance(raw, list):
+                    return raw[0].get("url", "")
+            return None
+        return extract
+
+    def inline(self, ref, namespace):
+        if len(self.sources) != 1:
+            return None
+        namespace[f"{ref}_url"] = attachment_url
+        return f"{ref}_url(fields.get({self.sources[0]!r}))"
+
+
+class first_of(Rule):
+    """First truthy result of ``rules`` (in order), else ``default``"""
+
+    def __init__(self, *rules: Rule, default: Any = ""):
+        self.rules = rules
+        self.default = default
+        self.sources = tuple(name for rule in rules for name in rule.sources)
+
+    def compile(self):
+        getters = [rule.compile() for rule in self.rules]
+        default = self.default
+
+        def extract(fields):
+            for getter in getters:
+                result = getter(fields)
+                if result:
+                    return result
+            return default
+        return extract
+
+
+class computed(Rule):
+    """``fn(fields)`` for values that combine several fields; ``names`` are the fields it reads"""
+
+    def __init__(self, fn: Callable[[dict], Any], *names: str):
+        self.fn = fn
+        self.sources = names
+
+    def compile(self):
+        return self.fn
+
+
+class RecordMapper:
+    """A model's mapping spec, compiled into one extractor and applied in batch.
+
+    ``required`` attributes must be truthy for a record to be kept (e.g.
+    newsroom articles need a title and a teaser); ``map_many`` also accepts a
+    per-call ``where`` predicate over the extracted values.
+    """
+
+    def __init__(self, model, spec: Dict[str, Rule], required: Sequence[str] = ()):
+        self.model = model
+        self.spec = spec
+        self.required = tuple(required)
+        self.source_fields: List[str] = list(dict.fromkeys(name for rule in spec.values() for name in rule.sources))
+        self.extract = self._compile()
+
+    def _compile(self) -> Callable[[dict], dict]:
+        namespace = {}
+        lines = [
+            "def extract(record):",
+            "    fields = record.get('fields', {})",
+            "    return {",
+            "        'id': record.get('id', ''),",
+        ]
+        for position, (attr, rule) in enumerate(self.spec.items()):
+            ref = f"_rule{position}"
+            expression = rule.inline(ref, namespace)
+            if expression is None:
+                namespace[ref] = rule.compile()
+                expression = f"{ref}(fields)"
+            lines.append(f"        {attr!r}: {expression},")
+        lines.append("    }")
+        exec("\n".join(lines), namespace)
+        return namespace["extract"]
+
+    def omitting(self, fields: Sequence[str]) -> Callable:
+        """A function turning a mapped model into what mapping it without ``fields`` would have given"""
+        blanks = {attr: rule.compile()({}) for attr, rule in self.spec.items() if set(rule.sources) & set(fields)}
+        return lambda item: item.model_copy(update=blanks)
+
+    def map_one(self, record: dict):
+        """The model for one record, or None if it lacks a required attribute"""
+        values = self.extract(record)
+        for attr in self.required:
+            if not values[attr]:
+                return None
+        return self.model(**values)
+
+    def map_many(self, records: Iterable[dict], where: Optional[Callable[[dict], bool]] = None) -> list:
+        """Models for every qualifying record, in order"""
+        extract, required = self.extract, self.required
+        validate = list_adapter(self.model).validate_python
+        results, batch = [], []
+        for record in records:
+            values = extract(record)
+            if required and not all(values[attr] for attr in required):
+                continue
+            if where is not None and not where(values):
+                continue
+            batch.append(values)
+            if len(batch) == VALIDATE_BATCH:
+                results.extend(validate(batch))
+                batch = []
+        if batch:
+            results.extend(validate(batch))
+        return results
@@ -0,0 +1,125 @@
+"""JSON response bodies serialized once and served in the encoding a client accepts.
+
+``RenderedJSON`` holds one body's UTF-8 JSON bytes (orjson, byte-for-byte
+what FastAPI's encoder would produce for these models) plus its gzip and
+brotli variants. Snapshots precompress their full listing when a refresh
+installs them; per-record and per-query bodies compress on first use at
+cheaper settings and keep the result for as long as the body is held.
+"""
+import gzip
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import brotli
+import orjson
+
+COMPRESS_MIN_SIZE = 1024  # bytes; smaller bodies are not worth a Content-Encoding
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Preference order when a client accepts several encodings equally
+ENCODINGS = ("br", "gzip")
+
+
+def _default(value):
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content) -> bytes:
+    """Compact UTF-8 JSON; pydantic models are dumped field by field"""
+    return orjson.dumps(content, default=_default)
+
+
+def exact(raw: bytes) -> bytes:
+    """``raw`` copied into an allocation of its own size.
+
+    orjson hands back its output in a buffer of at least ~8 KB however short
+    the JSON is, so bytes kept beyond one response are copied first.
+    """
+    return bytes(memoryview(raw))
+
+
+def render_array(items: Iterable) -> Tuple[bytes, List[int]]:
+    """``items`` as one JSON array, plus where each element starts.
+
+    ``starts`` has one entry per element and a final ``len(body)``; element
+    ``i`` is ``body[starts[i]:starts[i + 1] - 1]`` (the byte before the next
+    start is the "," or "]" that follows it).
+    """
+    buffer = bytearray(b"[")
+    starts = []
+    for item in items:
+        starts.append(len(buffer))
+        buffer += dumps(item)
+        buffer += b","
+    if starts:
+        buffer[-1:] = b"]"
+    else:
+        buffer += b"]"
+    starts.append(len(buffer))
+    return bytes(buffer), starts
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """The best of ``ENCODINGS`` an Accept-Encoding header allows, or None for identity"""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, wildcard)
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class RenderedJSON:
+    """A JSON body rendered once, with compressed variants made on first use or by ``precompress()``"""
+
+    __slots__ = ("identity", "_encoded")
+
+    def __init__(self, identity: bytes):
+        self.identity = identity
+        self._encoded: Dict[str, bytes] = {}
+
+    @classmethod
+    def of(cls, content) -> "RenderedJSON":
+        return cls(dumps(content))
+
+    def precompress(self, gzip_level: int = 9, brotli_quality: int = 11) -> "RenderedJSON":
+        if len(self.identity) >= COMPRESS_MIN_SIZE:
+            self._encoded["gzip"] = gzip.compress(self.identity, gzip_level, mtime=0)
+            self._encoded["br"] = brotli.compress(self.identity, quality=brotli_quality)
+        return self
+
+    def encoded(self, encoding: str) -> bytes:
+        body = self._encoded.get(encoding)
+        if body is None:
+            if encoding == "gzip":
+                body = gzip.compress(self.identity, GZIP_LEVEL, mtime=0)
+            else:
+                body = brotli.compress(self.identity, quality=BROTLI_QUALITY)
+            self._encoded[encoding] = body
+        return body
+
+    def encoding_for(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """The Content-Encoding ``negotiate`` would send this body in, without compressing it"""
+        return choose_encoding(accept_encoding) if len(self.identity) >= COMPRESS_MIN_SIZE else None
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """(body, Content-Encoding or None) for a request's Accept-Encoding"""
+        encoding = self.encoding_for(accept_encoding)
+        if encoding is None:
+            return self.identity, None
+        return self.encoded(encoding), encoding
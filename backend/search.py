@@ -0,0 +1,148 @@
+"""In-process full-text search with BM25 ranking.
+
+Every collection snapshot gets its own ``SearchIndex`` (built by
+``CollectionCache`` on refresh), so a refresh only re-indexes the collection
+that changed. ``search()`` ranks across several indexes at query time: IDF
+uses document frequencies summed over all searched collections, while
+length normalization stays per collection (articles are far longer than
+podcast blurbs). Per-posting BM25 term weights are precomputed as numpy
+arrays, so a query costs one vectorized multiply-add per term and collection.
+"""
+import heapq
+import html
+import math
+import re
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+TOKEN = re.compile(r"\w+")
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have how in is it its of on or that the their this to was "
+    "were what when which who will with".split()
+)
+BM25_K1 = 1.2
+BM25_B = 0.75
+SNIPPET_LENGTH = 160
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class SearchIndex:
+    """BM25 postings for one collection.
+
+    ``fields`` is a list of (getter, weight): each getter returns text for an
+    item, and its terms count ``weight`` times (titles usually weigh more than
+    bodies). ``title`` and ``snippet_fields`` are used to render results.
+    ``documents``, if given, are the records to read ``fields`` from, position
+    for position with ``items``, when ``items`` are a lighter projection
+    (listings without bodies); only their postings are kept.
+    """
+
+    def __init__(self, items: list, fields: Sequence[Tuple[Callable[[object], Optional[str]], float]],
+                 title: Callable[[object], str], snippet_fields: Sequence[Callable[[object], Optional[str]]],
+                 documents: Optional[list] = None):
+        self.items = items
+        self.title = title
+        self.snippet_fields = snippet_fields
+        term_frequencies = []
+        lengths = []
+        for item in items if documents is None else documents:
+            frequencies: Dict[str, float] = {}
+            length = 0.0
+            for getter, weight in fields:
+                for token in tokenize(getter(item) or ""):
+                    frequencies[token] = frequencies.get(token, 0.0) + weight
+                    length += weight
+            term_frequencies.append(frequencies)
+            lengths.append(length)
+        average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+
+        # term -> (positions, tf part of the BM25 weight)
+        postings: Dict[str, Tuple[List[int], List[float]]] = {}
+        for position, frequencies in enumerate(term_frequencies):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[position] / average_length) if average_length else BM25_K1
+            for term, frequency in frequencies.items():
+                positions, weights = postings.setdefault(term, ([], []))
+                positions.append(position)
+                weights.append(frequency * (BM25_K1 + 1) / (frequency + norm))
+        self.postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+            term: (np.asarray(positions, dtype=np.int32), np.asarray(weights, dtype=np.float32))
+            for term, (positions, weights) in postings.items()
+        }
+
+    def __len__(self):
+        return len(self.items)
+
+    def document_frequency(self, term: str) -> int:
+        postings = self.postings.get(term)
+        return len(postings[0]) if postings else 0
+
+    def snippet(self, item, pattern: re.Pattern, length: int = SNIPPET_LENGTH) -> str:
+        """HTML-escaped excerpt around the first ``pattern`` match, with matches wrapped in <mark>"""
+        texts = [text for text in (getter(item) for getter in self.snippet_fields) if text]
+        if not texts:
+            return ""
+        text, match = texts[0], None
+        for candidate in texts:
+            match = pattern.search(candidate)
+            if match:
+                text = candidate
+                break
+        start = 0
+        if match and match.start() > length // 3:
+            # Start a third of the window before the match, on a word boundary
+            start = text.rfind(" ", 0, match.start() - length // 3) + 1
+        excerpt = " ".join(text[start:start + length].split())
+        highlighted = pattern.sub(lambda found: f"\0{found.group(0)}\1", excerpt)
+        highlighted = html.escape(highlighted).replace("\0", "<mark>").replace("\1", "</mark>")
+        return ("…" if start else "") + highlighted + ("…" if start + length < len(text) else "")
+
+
+def search(indexes: Dict[str, SearchIndex], query: str, limit: int = 10) -> list:
+    """Top ``limit`` matches across ``indexes`` ({type: index}) as result dicts, best first"""
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms or limit < 1:
+        return []
+    total = sum(len(index) for index in indexes.values())
+    weighted_terms = []
+    for term in terms:
+        frequency = sum(index.document_frequency(term) for index in indexes.values())
+        if frequency:
+            weighted_terms.append((term, _idf(total, frequency)))
+
+    candidates = []
+    for content_type, index in indexes.items():
+        scores = None
+        for term, idf in weighted_terms:
+            postings = index.postings.get(term)
+            if postings is not None:
+                if scores is None:
+                    scores = np.zeros(len(index), dtype=np.float32)
+                scores[postings[0]] += idf * postings[1]
+        if scores is None:
+            continue
+        matches = np.flatnonzero(scores)
+        if len(matches) > limit:
+            matches = matches[np.argpartition(scores[matches], len(matches) - limit)[-limit:]]
+        candidates.extend((float(scores[position]), content_type, int(position)) for position in matches)
+
+    pattern = re.compile(r"\b(" + "|".join(re.escape(term) for term, _ in weighted_terms) + r")\b", re.IGNORECASE)
+    results = []
+    for score, content_type, position in heapq.nlargest(limit, candidates, key=lambda candidate: candidate[0]):
+        index = indexes[content_type]
+        item = index.items[position]
+        results.append({
+            "type": content_type,
+            "id": item.id,
+            "title": index.title(item),
+            "score": round(score, 4),
+            "snippet": index.snippet(item, pattern)
+        })
+    return results
+
+def _idf(total: int, frequency: int) -> float:
+    # Lucene's BM25 idf, which stays positive even for terms in most documents
+    return math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
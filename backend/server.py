@@ -1,4 +1,4 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Request, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -6,14 +6,30 @@ import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 import uuid
-from datetime import datetime
+import time
+import asyncio
+from datetime import datetime, timedelta
 import requests
 import json
-import httpx
+import functools
+import re
+from collections import Counter, OrderedDict
 import resend
 
+from airtable_client import AirtableClient, SchemaResolver, PRIORITY_BACKGROUND, request_priority
+from similarity import KeywordIndex, RelatedContentIndex, related_terms
+from cache_policy import SurrogatePurger, collection_policies, strictest
+from compact import compact_items
+from conditional import combine_hashes, content_hash, digest, http_date, is_fresh, matched_etag, variant_etag
+from facets import FacetIndex
+from pagination import decode_cursor, paginate, parse_fields, select_fields
+from rendering import RenderedJSON, dumps, exact, render_array
+from search import SearchIndex, search
+from suggest import SuggestIndex, Suggestion
+from record_mapping import RecordMapper, computed, first_attachment, first_of, joined, string_list, validate_many, value
+
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -126,6 +142,15 @@ class AirtableTeamMember(BaseModel):
     linkedin: Optional[str] = None  # Emergent LinkedIn
     section: Optional[str] = None  # Emergent Section
 
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class FacetedVideos(BaseModel):
+    items: List[AirtableVideo]  # matching videos, in view order
+    total: int
+    facets: Dict[str, List[FacetCount]]  # facet -> value counts, largest first
+
 # Airtable configuration
 AIRTABLE_ACCESS_TOKEN = os.environ.get('AIRTABLE_ACCESS_TOKEN')
 
@@ -168,95 +193,212 @@ TEAM_BASE_ID = "appcKcpx0rQ37ChAo"
 TEAM_TABLE_ID = "tblSUfzhtyMYe2Tpj"
 TEAM_VIEW_NAME = "Emergent Team Listing"
 
+def event_fallback_registration_url(fields: dict) -> str:
+    """Members-site events link, with the record's magic-link suffix if it has one"""
+    append_to_magic_link = fields.get("Append to magic link", "")
+    return f"https://members.thevanguardnetwork.com/events{append_to_magic_link}" if append_to_magic_link else "https://members.thevanguardnetwork.com/events"
+
+# How each model is read from its Airtable record (compiled once, applied per page)
+EVENT_MAPPER = RecordMapper(AirtableEvent, {
+    "event_title": value("Event Title"),
+    "date_time": value("Date & Time being/end"),
+    "start_date": value("Start Date"),
+    "listing_picture": first_attachment("Listing Picture"),
+    # Priority order: More Details URL -> Default Signup URL -> Fallback concatenated URL
+    "registration_url": first_of(value("More Details URL"), value("Default Sign up URL (for NON-members)"),
+                                 computed(event_fallback_registration_url, "Append to magic link")),
+    "default_signup_url": value("Default Sign up URL (for NON-members)"),
+    "more_details_url": value("More Details URL"),
+    "speaker": value("Speaker"),  # Keep for backward compatibility
+    # Final display name priority: Session Leader -> Lead Moderator -> None
+    "session_leader_name": first_of(joined("Session Leader Name"), joined("Lead Moderator Name")),
+    "lead_moderator_name": joined("Lead Moderator Name"),
+    "location": value("Location"),
+    "audience_network": joined("Audience (Network)")
+})
+PODCAST_MAPPER = RecordMapper(AirtablePodcast, {
+    "title": value("Title"),
+    "thumbnail": first_attachment("Thumbnail"),
+    "featured_speaker": joined("Featured Speaker for Linked In"),
+    "description": value("Description"),
+    "soundcloud_embed": value("Soundcloud Embed code (medium)"),
+    "keywords": string_list("Keywords"),
+    "release_date": value("Release date")
+})
+VIDEO_MAPPER = RecordMapper(AirtableVideo, {
+    "video_description": value("Video Description"),
+    "vimeo_name": value("Vimeo Name"),
+    "featured_speakers": joined("Featured Speakers"),
+    "headshot": first_attachment("Headshot (from Featured Speakers)"),
+    "category": value("Category"),
+    "tags": string_list("Tags"),
+    # Keyword cells may hold comma-separated values
+    "keywords": string_list("Keywords", split=True),
+    "vanguard_vimeo_link": value("Vanguard Vimeo Link"),
+    "vimeo_long_description": value("Vimeo - long description"),
+    "softr_order": value("Softr Order (Videos Members Page)", 0)
+})
+ARTICLE_MAPPER = RecordMapper(AirtableArticle, {
+    "blog_title": value("Blog Title"),
+    "description_teaser": value("Description (teaser)"),
+    "photo": first_attachment("Photo"),
+    "featured_speaker_linkedin": joined("Featured Speaker for Linked In"),
+    "body_qa": value("Body of Q&A"),
+    "body_of_blog": value("Body of Blog"),
+    "tags": string_list("tags"),
+    "published_to_web": value("Published to Web"),
+    "type_content": joined("Type of detailed content"),
+    "keywords": string_list("Keywords (From video)")
+})
+# Only include newsroom articles that have substantial content
+NEWSROOM_MAPPER = RecordMapper(AirtableNewsroom, {
+    "blog_title": value("Blog Title"),
+    "description_teaser": value("Description (teaser)"),
+    # Listing image: Social:Image (single colon) first, falling back to Photo
+    "photo": first_attachment("Social:Image", "Photo"),
+    "newsroom_detail_image": first_attachment("Newsroom (Rectangular Image for details page)"),
+    "body_of_blog": value("Body of Blog"),
+    "publish_by": value("Publish By"),  # Capital B
+    "featured_speakers": joined("Featured Speakers"),
+    "type_of_news": joined("Type of News")
+}, required=["blog_title", "description_teaser"])
+# In the Press reuses the blog table's columns (speaker field doubles as authors)
+IN_THE_PRESS_MAPPER = RecordMapper(AirtableInThePress, {
+    "article_title": value("Blog Title"),
+    "author_names": joined("Featured Speaker for Linked In"),
+    "short_description": value("Description (teaser)"),
+    "photo": first_attachment("Photo"),
+    "body_of_article": value("Body of Q&A"),
+    "authors_intro": joined("Featured Speaker for Linked In")  # Same as author for now
+}, required=["article_title"])
+TEAM_MAPPER = RecordMapper(AirtableTeamMember, {
+    "name": value("Name"),
+    "role": value("Title (External)"),
+    "bio": value("Job Description (Public)"),
+    "image": first_attachment("Emergent Headshot"),
+    "linkedin": value("Emergent LinkedIn"),
+    "section": value("Emergent Section")
+})
+
+@functools.lru_cache(maxsize=8)
+def gc_member_mapper(whole_name: tuple, headshot: tuple, company: tuple, position: tuple) -> RecordMapper:
+    """GC member mapper over the alias columns that exist in the table (first non-empty wins)"""
+    return RecordMapper(AirtableGCMember, {
+        "whole_name": first_of(*(value(name) for name in whole_name)),
+        "headshot": first_attachment(*headshot),
+        "company": first_of(*(value(name) for name in company)),
+        "position": first_of(*(value(name) for name in position))
+    }, required=["whole_name"])
+
+# Exact Airtable fields each fetcher maps, sent as fields[] so unrelated
+# columns never leave Airtable. GC members are projected onto whichever of
+# their alias columns the schema resolver finds.
+EVENTS_FIELDS = EVENT_MAPPER.source_fields
+PODCASTS_FIELDS = PODCAST_MAPPER.source_fields
+VIDEOS_FIELDS = VIDEO_MAPPER.source_fields
+# Union of the article, newsroom and In the Press mappings (one fetch feeds all three)
+BLOG_TABLE_FIELDS = list(dict.fromkeys(ARTICLE_MAPPER.source_fields + NEWSROOM_MAPPER.source_fields +
+                                       IN_THE_PRESS_MAPPER.source_fields))
+# Long-form bodies are only shown on detail pages, which fetch their record with every mapped field
+BLOG_TABLE_BODY_FIELDS = ["Body of Blog", "Body of Q&A"]
+BLOG_TABLE_LISTING_FIELDS = [field for field in BLOG_TABLE_FIELDS if field not in BLOG_TABLE_BODY_FIELDS]
+# View membership listings only need the primary field
+BLOG_TABLE_MEMBERSHIP_FIELDS = ["Blog Title"]
+# GC member attributes and the column spellings they may use, in preference order
+GC_MEMBER_FIELD_ALIASES = {
+    "whole_name": ["WholeName", "Whole Name", "Name", "Full Name"],
+    "headshot": ["Headshot", "Photo", "Picture"],
+    "company": ["Company", "Organization"],
+    "position": ["Position", "Title", "Job Title"]
+}
+TEAM_FIELDS = TEAM_MAPPER.source_fields
+
+# Shared pooled Airtable client (opened/closed with the app lifecycle)
+airtable = AirtableClient(token=AIRTABLE_ACCESS_TOKEN)
+airtable_schemas = SchemaResolver(airtable)
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one in-flight coroutine.
+
+    Every caller awaits the same task (shielded, so a disconnecting client does
+    not cancel the fetch for everyone else) and receives its result or error.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+        self._stats = {}
+
+    async def do(self, key, label: str, fn, *args, **kwargs):
+        stats = self._stats.setdefault(label, {"calls": 0, "flights": 0, "coalesced": 0, "in_flight": 0})
+        stats["calls"] += 1
+        task = self._inflight.get(key)
+        if task is None:
+            stats["flights"] += 1
+            stats["in_flight"] += 1
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._inflight[key] = task
+
+            def finished(_):
+                self._inflight.pop(key, None)
+                stats["in_flight"] -= 1
+            task.add_done_callback(finished)
+        else:
+            stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def coalesce(self, fn):
+        """Decorator: concurrent calls with equal arguments share one upstream fetch"""
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            return await self.do(key, fn.__name__, fn, *args, **kwargs)
+        return wrapper
+
+    def stats(self) -> dict:
+        return {label: dict(counters) for label, counters in self._stats.items()}
+
+
+upstream_flights = SingleFlight()
+
+def modified_since_formula(since: datetime) -> str:
+    """filterByFormula selecting records changed after ``since`` (naive UTC)"""
+    return f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{since.strftime('%Y-%m-%dT%H:%M:%S')}Z'))"
+
+@upstream_flights.coalesce
 async def fetch_airtable_gc_members():
     """Fetch GC Exchange members from Airtable"""
     try:
-        headers = {
-            "Authorization": f"Bearer {AIRTABLE_ACCESS_TOKEN}",
-            "Content-Type": "application/json"
-        }
+        # Field names are resolved once per process, so every call is a single request
+        columns = await airtable_schemas.resolve(GC_MEMBERS_BASE_ID, GC_MEMBERS_TABLE_ID, GC_MEMBER_FIELD_ALIASES,
+                                                 view=GC_MEMBERS_VIEW_ID, required=("whole_name",))
+        projection = [name for names in columns.values() for name in names]
         
         # Use the specific GC Members table ID with the GC Members view
-        url = f"https://api.airtable.com/v0/{GC_MEMBERS_BASE_ID}/{GC_MEMBERS_TABLE_ID}"
-        
-        # First, try without the view to see what fields actually exist
         params = {
-            "maxRecords": 10  # Just get a few to check structure
+            "view": GC_MEMBERS_VIEW_ID,
+            "maxRecords": 100
         }
+        response = await airtable.get(GC_MEMBERS_BASE_ID, GC_MEMBERS_TABLE_ID, params=params, fields=projection,
+                                      label="gc_members")
+        
+        # View doesn't work, fall back to filtered table results
+        strict = response.status_code != 200
+        if strict:
+            logging.warning(f"GC Members view {GC_MEMBERS_VIEW_ID} not accessible, using filtered table results")
+            params = {
+                "maxRecords": 10
+            }
+            response = await airtable.get(GC_MEMBERS_BASE_ID, GC_MEMBERS_TABLE_ID, params=params, fields=projection,
+                                          label="gc_members")
         
-        response = requests.get(url, headers=headers, params=params)
         response.raise_for_status()
+        data = airtable.decode(response, "gc_members")
         
-        data = response.json()
-        gc_members = []
+        mapper = gc_member_mapper(*(tuple(columns[attr]) for attr in GC_MEMBER_FIELD_ALIASES))
         
-        for record in data.get("records", []):
-            fields = record.get("fields", {})
-            
-            # Extract fields for GC Members - try different field name variations
-            whole_name = fields.get("WholeName", "") or fields.get("Whole Name", "") or fields.get("Name", "") or fields.get("Full Name", "")
-            headshot_raw = fields.get("Headshot", []) or fields.get("Photo", []) or fields.get("Picture", [])
-            company = fields.get("Company", "") or fields.get("Organization", "")
-            position = fields.get("Position", "") or fields.get("Title", "") or fields.get("Job Title", "")
-            
-            # Handle headshot - get first one if multiple
-            headshot_url = None
-            if headshot_raw and isinstance(headshot_raw, list) and len(headshot_raw) > 0:
-                headshot_url = headshot_raw[0].get("url", "")
-            
-            # Only include records that have a name and appear to be member records
-            # Look for records that have company/position info to identify GC members
-            if whole_name and (company or position):
-                gc_member = AirtableGCMember(
-                    id=record.get("id", ""),
-                    whole_name=whole_name,
-                    headshot=headshot_url,
-                    company=company,
-                    position=position
-                )
-                gc_members.append(gc_member)
-        
-        # If we have some potential GC members, try to apply the view filter for future requests
-        if gc_members:
-            # Now try with the specific view to get the filtered results
-            try:
-                params_with_view = {
-                    "view": GC_MEMBERS_VIEW_ID,
-                    "maxRecords": 100
-                }
-                
-                response_with_view = requests.get(url, headers=headers, params=params_with_view)
-                if response_with_view.status_code == 200:
-                    # If view works, use the view results
-                    view_data = response_with_view.json()
-                    gc_members = []  # Reset and use view results
-                    
-                    for record in view_data.get("records", []):
-                        fields = record.get("fields", {})
-                        
-                        whole_name = fields.get("WholeName", "") or fields.get("Whole Name", "") or fields.get("Name", "") or fields.get("Full Name", "")
-                        headshot_raw = fields.get("Headshot", []) or fields.get("Photo", []) or fields.get("Picture", [])
-                        company = fields.get("Company", "") or fields.get("Organization", "")
-                        position = fields.get("Position", "") or fields.get("Title", "") or fields.get("Job Title", "")
-                        
-                        headshot_url = None
-                        if headshot_raw and isinstance(headshot_raw, list) and len(headshot_raw) > 0:
-                            headshot_url = headshot_raw[0].get("url", "")
-                        
-                        if whole_name:  # Less strict filtering for view results
-                            gc_member = AirtableGCMember(
-                                id=record.get("id", ""),
-                                whole_name=whole_name,
-                                headshot=headshot_url,
-                                company=company,
-                                position=position
-                            )
-                            gc_members.append(gc_member)
-                else:
-                    # View doesn't work, stick with filtered results from initial call
-                    logging.warning(f"GC Members view {GC_MEMBERS_VIEW_ID} not accessible, using filtered table results")
-            except Exception as view_error:
-                logging.warning(f"Could not access GC Members view: {str(view_error)}, using filtered table results")
+        # View results only need a name; unfiltered table results must look like members
+        gc_members = mapper.map_many(data.get("records", []),
+                                     where=(lambda member: member["company"] or member["position"]) if strict else None)
         
         return gc_members
         
@@ -264,348 +406,134 @@ async def fetch_airtable_gc_members():
         logging.error(f"Error fetching Airtable GC members: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching GC members: {str(e)}")
 
-async def fetch_airtable_in_the_press():
-    """Fetch In the Press articles from Airtable"""
-    try:
-        headers = {
-            "Authorization": f"Bearer {AIRTABLE_ACCESS_TOKEN}",
-            "Content-Type": "application/json"
+async def fetch_view_record_ids(base_id: str, table_id: str, view_id: Optional[str],
+                                max_records: int = 100) -> Optional[List[str]]:
+    """Record ids of a view (or the bare table) in order, or None if the view is not accessible.
+
+    Only the primary field is requested, so this costs a few bytes per record.
+    """
+    params = {
+        "maxRecords": max_records
+    }
+    if view_id:
+        params["view"] = view_id
+    response = await airtable.get(base_id, table_id, params=params, fields=BLOG_TABLE_MEMBERSHIP_FIELDS,
+                                  label="blog_table_membership")
+    if response.status_code != 200:
+        return None
+    return [record["id"] for record in airtable.decode(response, "blog_table_membership").get("records", [])]
+
+async def fetch_records_by_id(base_id: str, table_id: str, record_ids: List[str], chunk_size: int = 50,
+                             fields: List[str] = BLOG_TABLE_FIELDS) -> List[dict]:
+    """Records for the given ids (all blog-table fields unless ``fields`` is given), via RECORD_ID() formulas in chunks"""
+    records = []
+    for start in range(0, len(record_ids), chunk_size):
+        chunk = record_ids[start:start + chunk_size]
+        params = {
+            "filterByFormula": "OR(" + ",".join(f"RECORD_ID()='{record_id}'" for record_id in chunk) + ")"
         }
-        
-        # First, let's try without the view to see what fields actually exist
-        # Using the same table ID as articles since they might be using existing article fields
-        url = f"https://api.airtable.com/v0/{IN_THE_PRESS_BASE_ID}/{ARTICLES_TABLE_ID}"
+        while True:
+            data = await airtable.list_records(base_id, table_id, params=params, fields=fields,
+                                               label="blog_table")
+            records.extend(data.get("records", []))
+            if not data.get("offset"):
+                break
+            params["offset"] = data["offset"]
+    return records
+
+@upstream_flights.coalesce
+async def fetch_airtable_blog_table():
+    """Fetch the shared blog table once and project it into articles, newsroom and In the Press.
+
+    Articles, newsroom and In the Press are different views of the same table
+    (``ARTICLES_TABLE_ID``). The Airtable API does not report which views a
+    record belongs to, so membership comes from id-only listings of the
+    newsroom and In the Press views. Listing records are downloaded once: the
+    articles view in full, plus any ids that are only in the other views.
+
+    The articles view's ``BLOG_TABLE_BODY_FIELDS`` come in a second, parallel
+    request and are merged in, so the returned models are full records. Only
+    the search indexes read their bodies: the snapshots hold listing
+    projections (see ``CollectionCache`` ``listing_only``), and detail routes
+    fetch bodies per record (see ``CollectionCache.get_detail``).
+    """
+    if not AIRTABLE_ACCESS_TOKEN:
+        raise HTTPException(status_code=500, detail="Error fetching articles: AIRTABLE_ACCESS_TOKEN environment variable not set")
+    try:
         params = {
-            "maxRecords": 5  # Just get a few to check structure
+            "view": ARTICLES_VIEW_ID,
+            "maxRecords": 100
         }
         
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        press_articles = []
-        
-        for record in data.get("records", []):
-            fields = record.get("fields", {})
-            
-            # Map the actual fields from the articles table to In the Press fields
-            # Based on the structure that exists in the table
-            article_title = fields.get("Blog Title", "")  # Use existing Blog Title field
-            author_names_raw = fields.get("Featured Speaker for Linked In", "")  # Use existing speaker field as author
-            short_description = fields.get("Description (teaser)", "")  # Use existing description field
-            photo_raw = fields.get("Photo", [])
-            body_of_article = fields.get("Body of Q&A", "")  # Use existing body field
-            authors_intro_raw = fields.get("Featured Speaker for Linked In", "")  # Same as author for now
-            
-            # Handle author names - can be a list or string
-            author_names = ""
-            if author_names_raw:
-                if isinstance(author_names_raw, list):
-                    author_names = ", ".join(author_names_raw)
-                else:
-                    author_names = str(author_names_raw)
-            
-            # Handle authors intro - can be a list or string
-            authors_intro = ""
-            if authors_intro_raw:
-                if isinstance(authors_intro_raw, list):
-                    authors_intro = ", ".join(authors_intro_raw)
-                else:
-                    authors_intro = str(authors_intro_raw)
-            
-            # Handle photo - get first one if multiple
-            photo_url = None
-            if photo_raw and isinstance(photo_raw, list) and len(photo_raw) > 0:
-                photo_url = photo_raw[0].get("url", "")
-            
-            # Only include records that have substantial content (likely press articles)
-            if article_title and body_of_article:
-                press_article = AirtableInThePress(
-                    id=record.get("id", ""),
-                    article_title=article_title,
-                    author_names=author_names,
-                    short_description=short_description,
-                    photo=photo_url,
-                    body_of_article=body_of_article,
-                    authors_intro=authors_intro
-                )
-                press_articles.append(press_article)
-        
-        # If we have records, try to apply the view filter for future requests
-        if press_articles:
-            # Now try with the specific view to get the filtered results
-            try:
-                params_with_view = {
-                    "view": IN_THE_PRESS_VIEW_ID,
-                    "maxRecords": 100
-                }
-                
-                response_with_view = requests.get(url, headers=headers, params=params_with_view)
-                if response_with_view.status_code == 200:
-                    # If view works, use the view results
-                    view_data = response_with_view.json()
-                    press_articles = []  # Reset and use view results
-                    
-                    for record in view_data.get("records", []):
-                        fields = record.get("fields", {})
-                        
-                        article_title = fields.get("Blog Title", "")
-                        author_names_raw = fields.get("Featured Speaker for Linked In", "")
-                        short_description = fields.get("Description (teaser)", "")
-                        photo_raw = fields.get("Photo", [])
-                        body_of_article = fields.get("Body of Q&A", "")
-                        authors_intro_raw = fields.get("Featured Speaker for Linked In", "")
-                        
-                        # Handle author names - can be a list or string
-                        author_names = ""
-                        if author_names_raw:
-                            if isinstance(author_names_raw, list):
-                                author_names = ", ".join(author_names_raw)
-                            else:
-                                author_names = str(author_names_raw)
-                        
-                        # Handle authors intro - can be a list or string
-                        authors_intro = ""
-                        if authors_intro_raw:
-                            if isinstance(authors_intro_raw, list):
-                                authors_intro = ", ".join(authors_intro_raw)
-                            else:
-                                authors_intro = str(authors_intro_raw)
-                        
-                        photo_url = None
-                        if photo_raw and isinstance(photo_raw, list) and len(photo_raw) > 0:
-                            photo_url = photo_raw[0].get("url", "")
-                        
-                        if article_title:  # Less strict filtering for view results
-                            press_article = AirtableInThePress(
-                                id=record.get("id", ""),
-                                article_title=article_title,
-                                author_names=author_names,
-                                short_description=short_description,
-                                photo=photo_url,
-                                body_of_article=body_of_article,
-                                authors_intro=authors_intro
-                            )
-                            press_articles.append(press_article)
-                else:
-                    # View doesn't work, stick with filtered results from initial call
-                    logging.warning(f"In the Press view {IN_THE_PRESS_VIEW_ID} not accessible, using filtered table results")
-            except Exception as view_error:
-                logging.warning(f"Could not access In the Press view: {str(view_error)}, using filtered table results")
+        articles_data, bodies_data, newsroom_ids, press_ids = await asyncio.gather(
+            airtable.list_records(ARTICLES_BASE_ID, ARTICLES_TABLE_ID, params=params,
+                                  fields=BLOG_TABLE_LISTING_FIELDS, label="blog_table"),
+            airtable.list_records(ARTICLES_BASE_ID, ARTICLES_TABLE_ID, params=params,
+                                  fields=BLOG_TABLE_BODY_FIELDS, label="blog_table_bodies"),
+            fetch_view_record_ids(NEWSROOM_BASE_ID, NEWSROOM_TABLE_ID, NEWSROOM_VIEW_ID),
+            fetch_view_record_ids(IN_THE_PRESS_BASE_ID, ARTICLES_TABLE_ID, IN_THE_PRESS_VIEW_ID)
+        )
+        records = {record["id"]: record for record in articles_data.get("records", [])}
+        for record in bodies_data.get("records", []):
+            if record["id"] in records:
+                records[record["id"]]["fields"].update(record.get("fields", {}))
+        article_ids = list(records)
+        
+        press_strict = False
+        if newsroom_ids is None:
+            logging.warning(f"Error fetching newsroom from view {NEWSROOM_VIEW_ID}, using unsorted table records")
+            newsroom_ids = await fetch_view_record_ids(NEWSROOM_BASE_ID, NEWSROOM_TABLE_ID, None) or []
+        if press_ids is None:
+            # View doesn't work, fall back to a few table records that look like press articles
+            logging.warning(f"In the Press view {IN_THE_PRESS_VIEW_ID} not accessible, using filtered table results")
+            press_ids = await fetch_view_record_ids(IN_THE_PRESS_BASE_ID, ARTICLES_TABLE_ID, None, max_records=5) or []
+            press_strict = True
+        
+        # Records only in the other views are read in full, bodies included, as the articles view's are
+        missing_ids = [record_id for record_id in dict.fromkeys(newsroom_ids + press_ids) if record_id not in records]
+        if missing_ids:
+            for record in await fetch_records_by_id(ARTICLES_BASE_ID, ARTICLES_TABLE_ID, missing_ids):
+                records[record["id"]] = record
+        
+        articles = ARTICLE_MAPPER.map_many(records[record_id] for record_id in article_ids)
+        newsroom_articles = NEWSROOM_MAPPER.map_many(records[record_id] for record_id in newsroom_ids
+                                                     if record_id in records)
+        # View results only need a title; unfiltered table results must also have a body
+        press_articles = IN_THE_PRESS_MAPPER.map_many((records[record_id] for record_id in press_ids
+                                                       if record_id in records),
+                                                      where=(lambda press: press["body_of_article"]) if press_strict else None)
         
-        return press_articles
+        return {
+            "articles": articles,
+            "newsroom": newsroom_articles,
+            "in_the_press": press_articles
+        }
         
     except Exception as e:
-        logging.error(f"Error fetching Airtable In the Press articles: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Error fetching In the Press articles: {str(e)}")
+        logging.error(f"Error fetching Airtable blog table: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error fetching articles: {str(e)}")
+
+async def fetch_airtable_in_the_press():
+    """Fetch In the Press articles from Airtable"""
+    return (await fetch_airtable_blog_table())["in_the_press"]
 
 async def fetch_airtable_newsroom():
     """Fetch newsroom articles from Airtable"""
-    try:
-        airtable_token = os.environ.get('AIRTABLE_ACCESS_TOKEN')
-        if not airtable_token:
-            raise ValueError("AIRTABLE_ACCESS_TOKEN environment variable not set")
-        
-        headers = {
-            'Authorization': f'Bearer {airtable_token}',
-            'Content-Type': 'application/json'
-        }
-        
-        # First try to fetch from the specific newsroom view
-        url = f"https://api.airtable.com/v0/{NEWSROOM_BASE_ID}/{NEWSROOM_TABLE_ID}"
-        params = {
-            'view': NEWSROOM_VIEW_ID,
-            'maxRecords': 100
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params)
-        
-        if response.status_code != 200:
-            logging.warning(f"Error fetching newsroom from view {NEWSROOM_VIEW_ID}: {response.status_code}")
-            # Fall back to fetching all records without sorting
-            params = {
-                'maxRecords': 100
-            }
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, params=params)
-        
-        response.raise_for_status()
-        data = response.json()
-        newsroom_articles = []
-        
-        for record in data.get("records", []):
-            fields = record.get("fields", {})
-            
-            # Extract fields
-            blog_title = fields.get("Blog Title", "")
-            description_teaser = fields.get("Description (teaser)", "")
-            social_image_raw = fields.get("Social:Image", [])
-            photo_raw = fields.get("Photo", [])
-            newsroom_detail_image_raw = fields.get("Newsroom (Rectangular Image for details page)", [])
-            body_of_blog = fields.get("Body of Blog", "")
-            publish_by = fields.get("Publish By", "")  # Capital B
-            featured_speakers_raw = fields.get("Featured Speakers", [])
-            type_of_news_raw = fields.get("Type of News", [])
-            
-            # Handle featured speakers - can be a list or string
-            featured_speakers = ""
-            if featured_speakers_raw:
-                if isinstance(featured_speakers_raw, list):
-                    featured_speakers = ", ".join(featured_speakers_raw)
-                else:
-                    featured_speakers = str(featured_speakers_raw)
-            
-            # Handle type of news - can be a list or string
-            type_of_news = ""
-            if type_of_news_raw:
-                if isinstance(type_of_news_raw, list):
-                    type_of_news = ", ".join(type_of_news_raw)
-                else:
-                    type_of_news = str(type_of_news_raw)
-            
-            # Handle listing image - prioritize Social:Image, fallback to Photo
-            photo_url = None
-            
-            # Try Social:Image first (note: single colon, not double)
-            if social_image_raw and isinstance(social_image_raw, list) and len(social_image_raw) > 0:
-                photo_url = social_image_raw[0].get("url", "")
-            
-            # Fallback to Photo field if Social:Image is not available
-            elif photo_raw and isinstance(photo_raw, list) and len(photo_raw) > 0:
-                photo_url = photo_raw[0].get("url", "")
-            
-            # Handle detail page rectangular image
-            newsroom_detail_image = None
-            if newsroom_detail_image_raw and isinstance(newsroom_detail_image_raw, list) and len(newsroom_detail_image_raw) > 0:
-                newsroom_detail_image = newsroom_detail_image_raw[0].get("url", "")
-            
-            # Only include articles that have substantial content
-            if blog_title and description_teaser:
-                article = AirtableNewsroom(
-                    id=record.get("id", ""),
-                    blog_title=blog_title,
-                    description_teaser=description_teaser,
-                    photo=photo_url,
-                    newsroom_detail_image=newsroom_detail_image,
-                    body_of_blog=body_of_blog,
-                    publish_by=publish_by,
-                    featured_speakers=featured_speakers,
-                    type_of_news=type_of_news
-                )
-                newsroom_articles.append(article)
-        
-        return newsroom_articles
-        
-    except Exception as e:
-        logging.error(f"Error fetching Airtable newsroom articles: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Error fetching newsroom articles: {str(e)}")
+    return (await fetch_airtable_blog_table())["newsroom"]
 
 async def fetch_airtable_articles():
     """Fetch articles from Airtable"""
-    try:
-        headers = {
-            "Authorization": f"Bearer {AIRTABLE_ACCESS_TOKEN}",
-            "Content-Type": "application/json"
-        }
-        
-        url = f"https://api.airtable.com/v0/{ARTICLES_BASE_ID}/{ARTICLES_TABLE_ID}"
-        params = {
-            "view": ARTICLES_VIEW_ID,
-            "maxRecords": 100
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        articles = []
-        
-        for record in data.get("records", []):
-            fields = record.get("fields", {})
-            
-            # Extract fields
-            blog_title = fields.get("Blog Title", "")
-            description_teaser = fields.get("Description (teaser)", "")
-            photo_raw = fields.get("Photo", [])
-            featured_speaker_linkedin_raw = fields.get("Featured Speaker for Linked In", "")
-            body_qa = fields.get("Body of Q&A", "")
-            body_of_blog = fields.get("Body of Blog", "")
-            tags_raw = fields.get("tags", [])
-            published_to_web = fields.get("Published to Web", "")
-            type_content_raw = fields.get("Type of detailed content", "")
-            keywords_raw = fields.get("Keywords (From video)", [])
-            
-            # Handle type_content - can be a list or string
-            type_content = ""
-            if type_content_raw:
-                if isinstance(type_content_raw, list):
-                    type_content = ", ".join(type_content_raw)
-                else:
-                    type_content = str(type_content_raw)
-            
-            # Handle featured speaker - can be a list or string
-            featured_speaker_linkedin = ""
-            if featured_speaker_linkedin_raw:
-                if isinstance(featured_speaker_linkedin_raw, list):
-                    featured_speaker_linkedin = ", ".join(featured_speaker_linkedin_raw)
-                else:
-                    featured_speaker_linkedin = str(featured_speaker_linkedin_raw)
-            
-            # Handle tags - can be a list or string
-            tags = []
-            if tags_raw:
-                if isinstance(tags_raw, list):
-                    tags = tags_raw
-                elif isinstance(tags_raw, str):
-                    tags = [tags_raw]
-            
-            # Handle keywords - can be a list or string
-            keywords = []
-            if keywords_raw:
-                if isinstance(keywords_raw, list):
-                    keywords = keywords_raw
-                elif isinstance(keywords_raw, str):
-                    keywords = [keywords_raw]
-            
-            # Handle photo - get first one if multiple
-            photo_url = None
-            if photo_raw and isinstance(photo_raw, list) and len(photo_raw) > 0:
-                photo_url = photo_raw[0].get("url", "")
-            
-            article = AirtableArticle(
-                id=record.get("id", ""),
-                blog_title=blog_title,
-                description_teaser=description_teaser,
-                photo=photo_url,
-                featured_speaker_linkedin=featured_speaker_linkedin,
-                body_qa=body_qa,
-                body_of_blog=body_of_blog,
-                tags=tags,
-                published_to_web=published_to_web,
-                type_content=type_content,
-                keywords=keywords
-            )
-            articles.append(article)
-        
-        return articles
-        
-    except Exception as e:
-        logging.error(f"Error fetching Airtable articles: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Error fetching articles: {str(e)}")
+    return (await fetch_airtable_blog_table())["articles"]
 
-async def fetch_airtable_videos():
-    """Fetch videos from Airtable"""
+@upstream_flights.coalesce
+async def fetch_airtable_videos(modified_since: Optional[datetime] = None):
+    """Fetch videos from Airtable (only those changed after ``modified_since`` if given)"""
     try:
-        headers = {
-            "Authorization": f"Bearer {AIRTABLE_ACCESS_TOKEN}",
-            "Content-Type": "application/json"
-        }
-        
-        url = f"https://api.airtable.com/v0/{VIDEOS_BASE_ID}/{VIDEOS_TABLE_ID}"
         params = {
             "view": VIDEOS_VIEW_ID
         }
+        if modified_since:
+            params["filterByFormula"] = modified_since_formula(modified_since)
         
         videos = []
         offset = None
@@ -615,79 +543,9 @@ async def fetch_airtable_videos():
             if offset:
                 params["offset"] = offset
             
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            records = data.get("records", [])
-            
-            for record in records:
-                fields = record.get("fields", {})
-                
-                # Extract fields
-                video_description = fields.get("Video Description", "")
-                vimeo_name = fields.get("Vimeo Name", "")
-                featured_speakers_raw = fields.get("Featured Speakers", "")
-                headshot_raw = fields.get("Headshot (from Featured Speakers)", [])
-                category = fields.get("Category", "")
-                tags_raw = fields.get("Tags", [])
-                keywords_raw = fields.get("Keywords", [])
-                vanguard_vimeo_link = fields.get("Vanguard Vimeo Link", "")
-                vimeo_long_description = fields.get("Vimeo - long description", "")
-                softr_order = fields.get("Softr Order (Videos Members Page)", 0)
-                
-                # Handle featured speakers - can be a list or string
-                featured_speakers = ""
-                if featured_speakers_raw:
-                    if isinstance(featured_speakers_raw, list):
-                        featured_speakers = ", ".join(featured_speakers_raw)
-                    else:
-                        featured_speakers = str(featured_speakers_raw)
-                
-                # Handle tags - can be a list or string
-                tags = []
-                if tags_raw:
-                    if isinstance(tags_raw, list):
-                        tags = tags_raw
-                    elif isinstance(tags_raw, str):
-                        tags = [tags_raw]
-                
-                # Handle keywords - can be a list or string, split by commas
-                keywords = []
-                if keywords_raw:
-                    if isinstance(keywords_raw, list):
-                        # If list, each item might be comma-separated
-                        for item in keywords_raw:
-                            if isinstance(item, str) and ',' in item:
-                                # Split comma-separated values and strip whitespace
-                                keywords.extend([k.strip() for k in item.split(',') if k.strip()])
-                            else:
-                                keywords.append(item)
-                    elif isinstance(keywords_raw, str):
-                        if ',' in keywords_raw:
-                            keywords = [k.strip() for k in keywords_raw.split(',') if k.strip()]
-                        else:
-                            keywords = [keywords_raw]
-                
-                # Handle headshot - get first one if multiple
-                headshot_url = None
-                if headshot_raw and isinstance(headshot_raw, list) and len(headshot_raw) > 0:
-                    headshot_url = headshot_raw[0].get("url", "")
-                
-                video = AirtableVideo(
-                    id=record.get("id", ""),
-                    video_description=video_description,
-                    vimeo_name=vimeo_name,
-                    featured_speakers=featured_speakers,
-                    headshot=headshot_url,
-                    category=category,
-                    tags=tags,
-                    keywords=keywords,
-                    vanguard_vimeo_link=vanguard_vimeo_link,
-                    vimeo_long_description=vimeo_long_description,
-                    softr_order=softr_order
-                )
-                videos.append(video)
+            data = await airtable.list_records(VIDEOS_BASE_ID, VIDEOS_TABLE_ID, params=params, fields=VIDEOS_FIELDS,
+                                               label="videos")
+            videos.extend(VIDEO_MAPPER.map_many(data.get("records", [])))
             
             # Check if there are more records to fetch
             offset = data.get("offset")
@@ -703,71 +561,18 @@ async def fetch_airtable_videos():
         logging.error(f"Error fetching Airtable videos: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching videos: {str(e)}")
 
+@upstream_flights.coalesce
 async def fetch_airtable_podcasts():
     """Fetch podcasts from Airtable"""
     try:
-        headers = {
-            "Authorization": f"Bearer {AIRTABLE_ACCESS_TOKEN}",
-            "Content-Type": "application/json"
-        }
-        
-        url = f"https://api.airtable.com/v0/{PODCASTS_BASE_ID}/{PODCASTS_TABLE_ID}"
         params = {
             "view": PODCASTS_VIEW_ID,
             "maxRecords": 100
         }
         
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        podcasts = []
-        
-        for record in data.get("records", []):
-            fields = record.get("fields", {})
-            
-            # Extract fields
-            title = fields.get("Title", "")
-            thumbnail_raw = fields.get("Thumbnail", [])
-            featured_speaker_raw = fields.get("Featured Speaker for Linked In", "")
-            description = fields.get("Description", "")
-            soundcloud_embed = fields.get("Soundcloud Embed code (medium)", "")
-            keywords_raw = fields.get("Keywords", [])
-            release_date = fields.get("Release date", "")
-            
-            # Handle featured speaker - can be a list or string
-            featured_speaker = ""
-            if featured_speaker_raw:
-                if isinstance(featured_speaker_raw, list):
-                    # Join multiple speakers with comma and space
-                    featured_speaker = ", ".join(featured_speaker_raw)
-                else:
-                    featured_speaker = str(featured_speaker_raw)
-            
-            # Handle keywords - can be a list or string
-            keywords = []
-            if keywords_raw:
-                if isinstance(keywords_raw, list):
-                    keywords = keywords_raw
-                elif isinstance(keywords_raw, str):
-                    keywords = [keywords_raw]
-            
-            # Handle thumbnail - get first one if multiple
-            thumbnail_url = None
-            if thumbnail_raw and isinstance(thumbnail_raw, list) and len(thumbnail_raw) > 0:
-                thumbnail_url = thumbnail_raw[0].get("url", "")
-            
-            podcast = AirtablePodcast(
-                id=record.get("id", ""),
-                title=title,
-                thumbnail=thumbnail_url,
-                featured_speaker=featured_speaker,
-                description=description,
-                soundcloud_embed=soundcloud_embed,
-                keywords=keywords,
-                release_date=release_date
-            )
-            podcasts.append(podcast)
+        data = await airtable.list_records(PODCASTS_BASE_ID, PODCASTS_TABLE_ID, params=params, fields=PODCASTS_FIELDS,
+                                           label="podcasts")
+        podcasts = PODCAST_MAPPER.map_many(data.get("records", []))
         
         return podcasts
         
@@ -775,100 +580,18 @@ async def fetch_airtable_podcasts():
         logger.error(f"Error fetching Airtable podcasts: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch podcasts: {str(e)}")
 
+@upstream_flights.coalesce
 async def fetch_airtable_events():
     """Fetch events from Airtable"""
     try:
-        headers = {
-            "Authorization": f"Bearer {AIRTABLE_ACCESS_TOKEN}",
-            "Content-Type": "application/json"
-        }
-        
-        url = f"https://api.airtable.com/v0/{EVENTS_BASE_ID}/{EVENTS_TABLE_ID}"
         params = {
             "view": EVENTS_VIEW_ID,
             "maxRecords": 100
         }
         
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        events = []
-        
-        for record in data.get("records", []):
-            fields = record.get("fields", {})
-            
-            # Extract fields
-            event_title = fields.get("Event Title", "")
-            date_time = fields.get("Date & Time being/end", "")
-            start_date = fields.get("Start Date", "")
-            listing_picture = fields.get("Listing Picture", [])
-            append_to_magic_link = fields.get("Append to magic link", "")
-            default_signup_url = fields.get("Default Sign up URL (for NON-members)", "")
-            more_details_url = fields.get("More Details URL", "")
-            speaker = fields.get("Speaker", "")  # Keep for backward compatibility
-            session_leader_raw = fields.get("Session Leader Name", "")
-            lead_moderator_raw = fields.get("Lead Moderator Name", "")
-            location = fields.get("Location", "")
-            audience_network_raw = fields.get("Audience (Network)", "")
-            
-            # Handle Session Leader Name (can be a list or string)
-            session_leader_name = ""
-            if session_leader_raw:
-                if isinstance(session_leader_raw, list):
-                    # Join multiple session leaders with comma and space
-                    session_leader_name = ", ".join(session_leader_raw)
-                else:
-                    session_leader_name = str(session_leader_raw)
-            
-            # Handle Lead Moderator Name (can be a list or string)
-            lead_moderator_name = ""
-            if lead_moderator_raw:
-                if isinstance(lead_moderator_raw, list):
-                    # Join multiple lead moderators with comma and space
-                    lead_moderator_name = ", ".join(lead_moderator_raw)
-                else:
-                    lead_moderator_name = str(lead_moderator_raw)
-            
-            # Handle Audience (Network) field (can be a list or string)
-            audience_network = ""
-            if audience_network_raw:
-                if isinstance(audience_network_raw, list):
-                    # Join multiple audiences with comma and space
-                    audience_network = ", ".join(audience_network_raw)
-                else:
-                    audience_network = str(audience_network_raw)
-            
-            # Final display name priority: Session Leader -> Lead Moderator -> None
-            final_leader_name = session_leader_name or lead_moderator_name
-            
-            # Handle picture URL
-            picture_url = None
-            if listing_picture and isinstance(listing_picture, list) and len(listing_picture) > 0:
-                picture_url = listing_picture[0].get("url", "")
-            
-            # Create registration URL (fallback if other URLs are not available)
-            fallback_registration_url = f"https://members.thevanguardnetwork.com/events{append_to_magic_link}" if append_to_magic_link else "https://members.thevanguardnetwork.com/events"
-            
-            # Priority order: More Details URL -> Default Signup URL -> Fallback concatenated URL
-            final_registration_url = more_details_url or default_signup_url or fallback_registration_url
-            
-            event = AirtableEvent(
-                id=record.get("id", ""),
-                event_title=event_title,
-                date_time=date_time,
-                start_date=start_date,
-                listing_picture=picture_url,
-                registration_url=final_registration_url,
-                default_signup_url=default_signup_url,
-                more_details_url=more_details_url,
-                speaker=speaker,
-                session_leader_name=final_leader_name,  # Use the combined logic
-                lead_moderator_name=lead_moderator_name,
-                location=location,
-                audience_network=audience_network
-            )
-            events.append(event)
+        data = await airtable.list_records(EVENTS_BASE_ID, EVENTS_TABLE_ID, params=params, fields=EVENTS_FIELDS,
+                                           label="events")
+        events = EVENT_MAPPER.map_many(data.get("records", []))
         
         return events
         
@@ -877,14 +600,10 @@ async def fetch_airtable_events():
         raise HTTPException(status_code=500, detail=f"Failed to fetch events: {str(e)}")
 
 
-async def fetch_airtable_team():
-    """Fetch team members from Airtable"""
+@upstream_flights.coalesce
+async def fetch_airtable_team(modified_since: Optional[datetime] = None):
+    """Fetch team members from Airtable (only those changed after ``modified_since`` if given)"""
     try:
-        headers = {
-            "Authorization": f"Bearer {AIRTABLE_ACCESS_TOKEN}",
-            "Content-Type": "application/json"
-        }
-        
         team_members = []
         offset = None
         
@@ -892,35 +611,15 @@ async def fetch_airtable_team():
             params = {
                 "view": TEAM_VIEW_NAME
             }
+            if modified_since:
+                params["filterByFormula"] = modified_since_formula(modified_since)
             if offset:
                 params["offset"] = offset
             
-            url = f"https://api.airtable.com/v0/{TEAM_BASE_ID}/{TEAM_TABLE_ID}"
-            
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await airtable.list_records(TEAM_BASE_ID, TEAM_TABLE_ID, params=params, fields=TEAM_FIELDS,
+                                               label="team")
             
-            for record in data.get("records", []):
-                fields = record.get("fields", {})
-                
-                # Get image URL from attachment field
-                image_url = None
-                emergent_headshot = fields.get("Emergent Headshot", [])
-                if emergent_headshot and isinstance(emergent_headshot, list) and len(emergent_headshot) > 0:
-                    image_url = emergent_headshot[0].get("url", "")
-                
-                team_member = {
-                    "id": record["id"],
-                    "name": fields.get("Name", ""),
-                    "role": fields.get("Title (External)", ""),
-                    "bio": fields.get("Job Description (Public)", ""),
-                    "image": image_url,
-                    "linkedin": fields.get("Emergent LinkedIn", ""),
-                    "section": fields.get("Emergent Section", "")
-                }
-                
-                team_members.append(team_member)
+            team_members.extend(TEAM_MAPPER.map_many(data.get("records", [])))
             
             offset = data.get("offset")
             if not offset:
@@ -934,6 +633,764 @@ async def fetch_airtable_team():
         raise HTTPException(status_code=500, detail=f"Failed to fetch team members: {str(e)}")
 
 
+# Airtable record ids: "rec" followed by 14 alphanumerics
+AIRTABLE_RECORD_ID = re.compile(r"rec[A-Za-z0-9]{14}")
+
+async def fetch_airtable_record(base_id: str, table_id: str, view_id: Optional[str], mapper: RecordMapper,
+                                record_id: str, label: str):
+    """Fetch and map one record of a view, or None if it is not in the view (or does not qualify).
+
+    The lookup is a RECORD_ID() filter inside the collection's view rather
+    than the bare per-record endpoint, so records the view hides (drafts,
+    unpublished videos) are never served by id.
+    """
+    if not AIRTABLE_RECORD_ID.fullmatch(record_id):
+        return None
+    params = {
+        "filterByFormula": f"RECORD_ID()='{record_id}'",
+        "maxRecords": 1
+    }
+    if view_id:
+        params["view"] = view_id
+    data = await airtable.list_records(base_id, table_id, params=params, fields=mapper.source_fields,
+                                       label=f"{label}_record")
+    records = data.get("records", [])
+    return mapper.map_one(records[0]) if records else None
+
+# Content cache configuration
+AIRTABLE_CACHE_TTL = float(os.environ.get('AIRTABLE_CACHE_TTL', '300'))  # seconds
+WARM_UP_CONCURRENCY = int(os.environ.get('WARM_UP_CONCURRENCY', '4'))
+WARM_UP_TIMEOUT = float(os.environ.get('WARM_UP_TIMEOUT', '20'))  # seconds, 0 disables warm-up
+CONTENT_MIRROR_ENABLED = os.environ.get('CONTENT_MIRROR_ENABLED', 'true').lower() == 'true'
+CONTENT_MIRROR_TIMEOUT = float(os.environ.get('CONTENT_MIRROR_TIMEOUT', '3'))  # seconds
+# Brotli quality for listings compressed at refresh (11 is smallest but ~10x slower than 9)
+PRECOMPRESS_BROTLI_QUALITY = int(os.environ.get('PRECOMPRESS_BROTLI_QUALITY', '9'))
+FULL_RECONCILE_INTERVAL = float(os.environ.get('FULL_RECONCILE_INTERVAL', '3600'))  # seconds
+DELTA_SYNC_SKEW = float(os.environ.get('DELTA_SYNC_SKEW', '60'))  # seconds of overlap between delta windows
+DETAIL_MISS_TTL = float(os.environ.get('DETAIL_MISS_TTL', '300'))  # seconds an unknown id is remembered as missing
+DETAIL_MISS_MAX = int(os.environ.get('DETAIL_MISS_MAX', '10000'))  # remembered missing ids per collection
+
+
+class CollectionSnapshot:
+    """One loaded version of an Airtable-backed collection.
+
+    ``items`` are held as compact slot records (see ``compact.py``) with the
+    models' attribute names; ``view()`` gives a record's pydantic model.
+    ``by_id`` indexes the items by record id. It is built with the snapshot
+    and replaced together with it, so a reader never sees an index that
+    disagrees with ``items``. ``indexes`` holds the collection's other derived
+    indexes (see ``CollectionCache``), built the same way.
+    """
+
+    def __init__(self, name: str, items: list, version: int = 1, loaded_at: Optional[datetime] = None,
+                 source: str = "airtable"):
+        self.name = name
+        # Every record is serialized once, into the listing body: each record's span of it is hashed
+        # for ETags (per record, and over the whole collection in order) and reused for detail bodies
+        self._listing, self._starts = render_array(items)
+        self.items = items = compact_items(items)
+        # Reversed so the first of any duplicate ids wins, as a linear scan would
+        self.by_id = {item.id: item for item in reversed(items)}
+        self.positions = {item.id: position for position, item in reversed(list(enumerate(items)))}
+        self.indexes = {}
+        self.version = version
+        self.source = source
+        self.loaded_at = loaded_at or datetime.utcnow()
+        listing = memoryview(self._listing)
+        hashes = [digest(listing[start:end - 1]) for start, end in zip(self._starts, self._starts[1:])]
+        self.record_hashes = {item.id: record_hash for item, record_hash in zip(reversed(items), reversed(hashes))}
+        self.content_hash = combine_hashes(hashes)
+        self._body = None
+        self._record_bodies = {}
+        # Full records behind listing-projected items: id -> (model, hash, body); see add_detail()
+        self.details = {}
+        # When the content last changed, for Last-Modified; see carry_over()
+        self.modified = datetime.utcnow()
+        self.record_modified = {}
+        # Restored snapshots keep their original age so they are refreshed promptly
+        self.loaded_monotonic = time.monotonic() - (datetime.utcnow() - self.loaded_at).total_seconds()
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.loaded_monotonic
+
+    def carry_over(self, previous: "CollectionSnapshot"):
+        """Keep ``previous``'s modification times for the collection and records that did not change"""
+        if previous.content_hash == self.content_hash:
+            self.modified = previous.modified
+        self.record_modified = {
+            item_id: previous.last_modified(item_id)
+            for item_id, record_hash in self.record_hashes.items()
+            if previous.record_hashes.get(item_id) == record_hash
+        }
+
+    def last_modified(self, item_id: str) -> datetime:
+        return self.record_modified.get(item_id, self.modified)
+
+    def body(self) -> RenderedJSON:
+        """The whole collection as a JSON response body, rendered once"""
+        if self._body is None:
+            self._body = RenderedJSON(self._listing)
+        return self._body
+
+    def head(self, count: int) -> bytes:
+        """The first ``count`` records as a JSON array, from the bytes already serialized"""
+        count = min(count, len(self.items))
+        return self._listing[:self._starts[count] - 1] + b"]" if count else b"[]"
+
+    def record_body(self, item_id: str) -> RenderedJSON:
+        """One record as a JSON response body, rendered once"""
+        body = self._record_bodies.get(item_id)
+        if body is None:
+            position = self.positions[item_id]
+            raw = self._listing[self._starts[position]:self._starts[position + 1] - 1]
+            body = self._record_bodies[item_id] = RenderedJSON(raw)
+        return body
+
+    def add_detail(self, item):
+        """Hold the full record for a listing-projected item, rendered and hashed once"""
+        raw = exact(dumps(item))
+        self.details[item.id] = (item, digest(raw), RenderedJSON(raw))
+
+    def changed_since(self, previous: "CollectionSnapshot") -> List[str]:
+        """Ids of records added, changed or removed relative to ``previous``"""
+        changed = [item_id for item_id, record_hash in self.record_hashes.items()
+                   if previous.record_hashes.get(item_id) != record_hash]
+        changed.extend(item_id for item_id in previous.record_hashes if item_id not in self.record_hashes)
+        return changed
+
+
+class IncrementalSync:
+    """Delta refreshes for paged tables using Airtable's LAST_MODIFIED_TIME().
+
+    The first load (and one every ``reconcile_interval`` seconds) is a full
+    fetch, which also drops records deleted upstream. In between, only records
+    modified since the previous fetch started (minus ``skew`` for clock drift)
+    are requested and merged into the held collection by id.
+    """
+
+    def __init__(self, sort_key=None, reverse: bool = False,
+                 reconcile_interval: float = FULL_RECONCILE_INTERVAL, skew: float = DELTA_SYNC_SKEW):
+        self.sort_key = sort_key
+        self.reverse = reverse
+        self.reconcile_interval = reconcile_interval
+        self.skew = skew
+        self.high_water: Optional[datetime] = None
+        self.last_full = 0.0
+        self.stats = {"full_syncs": 0, "delta_syncs": 0, "delta_records": 0}
+
+    async def load(self, loader, previous_items: Optional[list]) -> list:
+        started_at = datetime.utcnow()
+        full = (
+            previous_items is None
+            or self.high_water is None
+            or time.monotonic() - self.last_full >= self.reconcile_interval
+        )
+        if full:
+            items = await loader()
+            self.last_full = time.monotonic()
+            self.stats["full_syncs"] += 1
+        else:
+            changed = await loader(modified_since=self.high_water - timedelta(seconds=self.skew))
+            items = self.merge(previous_items, changed)
+            self.stats["delta_syncs"] += 1
+            self.stats["delta_records"] += len(changed)
+        self.high_water = started_at
+        return items
+
+    def merge(self, items: list, changed: list) -> list:
+        if not changed:
+            return items
+        updates = {item.id: item for item in changed}
+        merged = [updates.pop(item.id, item) for item in items]
+        merged.extend(item for item in changed if item.id in updates)
+        if self.sort_key is not None:
+            merged.sort(key=self.sort_key, reverse=self.reverse)
+        return merged
+
+
+class CollectionCache:
+    """Stale-while-revalidate cache of Airtable collections, keyed by collection name.
+
+    Fresh snapshots are served directly. Once a snapshot is older than its TTL
+    it is still served immediately while a single background task refreshes
+    it. Only a cold miss waits for Airtable.
+
+    Collections listed in ``groups`` ({group: (loader, [collections])}) come
+    from one shared upstream fetch whose loader returns {collection: items};
+    loading any member refreshes all of them.
+
+    ``record_loaders`` ({collection: async fn(record_id) -> item or None})
+    answer detail lookups for ids the held snapshot does not contain. Found
+    records are added to the collection; missing ids are remembered for
+    ``miss_ttl`` seconds (or until the next refresh) so repeated lookups of
+    bogus ids never reach Airtable. Records added this way keep the
+    snapshot's indexes (built from the listing) rather than rebuilding them.
+
+    Loaders of ``listing_only`` collections ({collection: project(item)})
+    return full records, but snapshots hold a lighter projection of each:
+    the collection's index builds also get the full records as
+    ``documents``, and ``get_detail`` reads a full record through the record
+    loader once per snapshot. Records found by id are added projected.
+
+    ``indexes`` ({collection: {key: build(items)}}) are derived structures
+    built for every new snapshot before it is published, available to routes
+    as ``snapshot.indexes[key]``. ``combined_indexes`` ({key: ([collections],
+    build({collection: items}))}) span several collections; they are rebuilt
+    whenever one of their collections publishes a new snapshot and read with
+    ``get_combined(key)``.
+
+    ``on_change(collection, [record ids], listing)`` is called whenever a new
+    snapshot replaces one with different content, with the ids of the
+    records that were added, changed or removed (empty if only their order
+    changed). ``listing`` is False when the only change is a record found by
+    id, which leaves what the listing routes were serving in place.
+    """
+
+    def __init__(self, loaders: dict, ttl: float = AIRTABLE_CACHE_TTL, mirror: Optional["SnapshotMirror"] = None,
+                 incremental: Optional[dict] = None, groups: Optional[dict] = None,
+                 record_loaders: Optional[dict] = None, miss_ttl: float = DETAIL_MISS_TTL,
+                 miss_max: int = DETAIL_MISS_MAX, indexes: Optional[dict] = None,
+                 combined_indexes: Optional[dict] = None, on_change=None, listing_only: Optional[dict] = None):
+        self.loaders = loaders
+        self.listing_only = listing_only or {}
+        self.on_change = on_change
+        self.indexes = indexes or {}
+        self.combined_indexes = combined_indexes or {}
+        self._combined = {}  # key -> (snapshot versions, index)
+        self.record_loaders = record_loaders or {}
+        self.miss_ttl = miss_ttl
+        self.miss_max = miss_max
+        self._missing = {name: OrderedDict() for name in loaders}  # id -> expiry (monotonic), oldest first
+        self.mirror = mirror
+        self.incremental = incremental or {}
+        self.groups = groups or {}
+        self._group_of = {name: group for group, (_, members) in self.groups.items() for name in members}
+        # Per-collection override, e.g. AIRTABLE_CACHE_TTL_EVENTS=60
+        self.ttls = {
+            name: float(os.environ.get(f'AIRTABLE_CACHE_TTL_{name.upper()}', ttl))
+            for name in loaders
+        }
+        self._snapshots = {}
+        self._refreshing = {}
+        self._warming = set()
+        self._mirror_writes = set()
+        self.warm_up_report = {}
+        self._stats = {
+            name: {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0,
+                   "record_fetches": 0, "record_misses_cached": 0}
+            for name in loaders
+        }
+
+    async def get(self, name: str) -> CollectionSnapshot:
+        """Return the current snapshot for a collection, loading it on a cold miss"""
+        snapshot = self._snapshots.get(name)
+        stats = self._stats[name]
+        if snapshot is None:
+            stats["misses"] += 1
+            return await self.load(name)
+        if snapshot.age < self.ttls[name]:
+            stats["hits"] += 1
+        else:
+            stats["stale_hits"] += 1
+            self._schedule_refresh(name)
+        return snapshot
+
+    def current(self, name: str) -> Optional[CollectionSnapshot]:
+        """The installed snapshot, if any, without counting a read or scheduling a refresh"""
+        return self._snapshots.get(name)
+
+    def sources(self, key: str) -> List[CollectionSnapshot]:
+        """The snapshots a cross-collection index is currently built from"""
+        return [self._snapshots[name] for name in self.combined_indexes[key][0]]
+
+    async def get_items(self, name: str) -> list:
+        """Shortcut for routes that only need the records"""
+        return (await self.get(name)).items
+
+    async def get_item(self, name: str, item_id: str):
+        """One record of a collection by id (constant time), or None.
+
+        Ids the snapshot does not hold fall through to the collection's record
+        loader, if it has one.
+        """
+        item = (await self.get(name)).by_id.get(item_id)
+        if item is None and name in self.record_loaders:
+            item = await self.fetch_item(name, item_id)
+        return item
+
+    async def fetch_item(self, name: str, item_id: str):
+        """Fetch one record upstream and add it to the collection, or remember that it is missing"""
+        missing = self._missing[name]
+        expires = missing.get(item_id)
+        if expires is not None:
+            if expires > time.monotonic():
+                self._stats[name]["record_misses_cached"] += 1
+                return None
+            del missing[item_id]
+
+        self._stats[name]["record_fetches"] += 1
+        item = await upstream_flights.do(("record", name, item_id), f"record:{name}",
+                                         self.record_loaders[name], item_id)
+        if item is None:
+            missing[item_id] = time.monotonic() + self.miss_ttl
+            while len(missing) > self.miss_max:
+                missing.popitem(last=False)
+            return None
+        project = self.listing_only.get(name)
+        self._add_item(name, item if project is None else project(item))
+        snapshot = self._snapshots[name]
+        if project is not None:
+            # The loader read the whole record, so this is also its detail
+            snapshot.add_detail(item)
+        # The snapshot's compact copy, whose body and validators are cached with it
+        return snapshot.by_id.get(item.id, item)
+
+    async def get_detail(self, name: str, item_id: str):
+        """A record for its detail page: ``get_item``, but the full record for ``listing_only`` collections.
+
+        The full record is fetched once per snapshot, so a refresh also
+        refreshes the details read after it.
+        """
+        item = await self.get_item(name, item_id)
+        if item is None or name not in self.listing_only:
+            return item
+        snapshot = self._snapshots[name]
+        detail = snapshot.details.get(item_id)
+        if detail is None:
+            self._stats[name]["record_fetches"] += 1
+            full = await upstream_flights.do(("record", name, item_id), f"record:{name}",
+                                             self.record_loaders[name], item_id)
+            if full is None:
+                # Left the view since the snapshot was loaded; serve what the listing has
+                return item
+            snapshot.add_detail(full)
+            detail = snapshot.details[item_id]
+        return detail[0]
+
+    def _add_item(self, name: str, item):
+        """Install a snapshot that also holds ``item``, keeping the current snapshot's age"""
+        snapshot = self._snapshots.get(name)
+        if snapshot is None or item.id in snapshot.by_id:
+            return
+        sync = self.incremental.get(name)
+        items = sync.merge(snapshot.items, [item]) if sync is not None else snapshot.items + [item]
+        updated = CollectionSnapshot(name, items, version=snapshot.version + 1,
+                                     loaded_at=snapshot.loaded_at, source=snapshot.source)
+        updated.carry_over(snapshot)
+        updated.details = snapshot.details
+        # The listing's indexes still hold (they keep their own items), so a crawler walking old ids
+        # does not rebuild them once per record; the next refresh indexes the added records
+        updated.indexes = snapshot.indexes
+        self._snapshots[name] = updated
+        for key, (names, _) in self.combined_indexes.items():
+            cached = self._combined.get(key)
+            if cached is not None and name in names:
+                versions = list(cached[0])
+                position = names.index(name)
+                if versions[position] == snapshot.version:
+                    versions[position] = updated.version
+                    self._combined[key] = (tuple(versions), cached[1])
+        self._notify_change(snapshot, updated, listing=False)
+
+    async def load(self, name: str) -> CollectionSnapshot:
+        """Fetch a collection from Airtable; concurrent loads share one fetch and one snapshot"""
+        group = self._group_of.get(name)
+        if group is not None:
+            await upstream_flights.do(("load", group), f"load:{group}", self._load_group, group)
+            return self._snapshots[name]
+        return await upstream_flights.do(("load", name), f"load:{name}", self._load, name)
+
+    async def _load(self, name: str) -> CollectionSnapshot:
+        previous = self._snapshots.get(name)
+        sync = self.incremental.get(name)
+        if sync is not None:
+            items = await sync.load(self.loaders[name], previous.items if previous else None)
+        else:
+            items = await self.loaders[name]()
+        return self._install(name, items)
+
+    async def _load_group(self, group: str):
+        loader, members = self.groups[group]
+        projections = await loader()
+        for name in members:
+            self._install(name, projections[name])
+
+    def _notify_change(self, previous: CollectionSnapshot, snapshot: CollectionSnapshot, listing: bool = True):
+        if self.on_change is not None and snapshot.content_hash != previous.content_hash:
+            self.on_change(snapshot.name, snapshot.changed_since(previous), listing)
+
+    def _publish(self, snapshot: CollectionSnapshot, documents: Optional[list] = None):
+        """Build the snapshot's derived indexes (over ``documents`` if given), then make it the one readers see"""
+        for key, build in self.indexes.get(snapshot.name, {}).items():
+            snapshot.indexes[key] = build(snapshot.items) if documents is None else build(snapshot.items,
+                                                                                           documents=documents)
+        self._snapshots[snapshot.name] = snapshot
+        for key, (names, _) in self.combined_indexes.items():
+            if snapshot.name in names and all(name in self._snapshots for name in names):
+                self._build_combined(key)
+
+    def _build_combined(self, key: str):
+        names, build = self.combined_indexes[key]
+        snapshots = [self._snapshots[name] for name in names]
+        versions = tuple(snapshot.version for snapshot in snapshots)
+        cached = self._combined.get(key)
+        if cached is None or cached[0] != versions:
+            started = time.perf_counter()
+            cached = self._combined[key] = (versions, build({snapshot.name: snapshot.items for snapshot in snapshots}))
+            logger.info(f"Built {key} index over {', '.join(names)} in {time.perf_counter() - started:.3f}s")
+        return cached[1]
+
+    async def get_combined(self, key: str):
+        """A cross-collection index, loading its collections first if needed"""
+        names, _ = self.combined_indexes[key]
+        await asyncio.gather(*(self.get(name) for name in names))
+        return self._build_combined(key)
+
+    def _install(self, name: str, items: list) -> CollectionSnapshot:
+        previous = self._snapshots.get(name)
+        documents, project = None, self.listing_only.get(name)
+        if project is not None:
+            documents, items = items, [project(item) for item in items]
+        snapshot = CollectionSnapshot(name, items, version=previous.version + 1 if previous else 1)
+        if previous is not None:
+            snapshot.carry_over(previous)
+        # Compress the listing now, on the refresh path, rather than on the first request for it
+        snapshot.body().precompress(brotli_quality=PRECOMPRESS_BROTLI_QUALITY)
+        self._publish(snapshot, documents)
+        if previous is not None:
+            self._notify_change(previous, snapshot)
+        # A refresh may have brought in records that were missing before
+        self._missing[name].clear()
+        self._stats[name]["refreshes"] += 1
+        logger.info(f"Refreshed {name}: {len(items)} items (version {snapshot.version})")
+        if self.mirror is not None:
+            task = asyncio.create_task(self.mirror.save(snapshot))
+            self._mirror_writes.add(task)
+            task.add_done_callback(self._mirror_writes.discard)
+        return snapshot
+
+    def _schedule_refresh(self, name: str):
+        if name in self._refreshing:
+            return
+        task = asyncio.create_task(self._background_refresh(name))
+        self._refreshing[name] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(name, None))
+
+    async def _background_refresh(self, name: str):
+        # Interactive Airtable reads are scheduled ahead of this refresh
+        request_priority.set(PRIORITY_BACKGROUND)
+        try:
+            await self.load(name)
+        except Exception as e:
+            # Keep serving the stale snapshot; the next stale hit retries
+            self._stats[name]["refresh_errors"] += 1
+            logger.warning(f"Background refresh of {name} failed, serving stale data: {str(e)}")
+
+    async def restore(self) -> list:
+        """Install snapshots from the MongoDB mirror for collections not loaded yet"""
+        if self.mirror is None:
+            return []
+        restored = []
+        for snapshot in await self.mirror.load_all():
+            if snapshot.name in self.loaders and snapshot.name not in self._snapshots:
+                self._publish(snapshot)
+                restored.append(snapshot.name)
+        return restored
+
+    async def warm_up(self, concurrency: int = WARM_UP_CONCURRENCY, timeout: float = WARM_UP_TIMEOUT):
+        """Load every collection concurrently, waiting at most ``timeout`` seconds.
+
+        Collections restored from the MongoDB mirror are served right away and
+        refreshed from Airtable in the background. Collections still loading
+        when the budget runs out keep loading in the background and are served
+        as soon as they land.
+        """
+        for name in await self.restore():
+            snapshot = self._snapshots[name]
+            self.warm_up_report[name] = {"items": len(snapshot.items), "source": "mongo", "version": snapshot.version}
+            logger.info(f"Restored {name} from MongoDB mirror: {len(snapshot.items)} items (version {snapshot.version})")
+            self._schedule_refresh(name)
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def warm(names):
+            request_priority.set(PRIORITY_BACKGROUND)
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    await self.load(names[0])
+                    elapsed = time.perf_counter() - started
+                    for name in names:
+                        snapshot = self._snapshots[name]
+                        self.warm_up_report[name] = {"items": len(snapshot.items), "seconds": round(elapsed, 3)}
+                        logger.info(f"Warmed {name}: {len(snapshot.items)} items in {elapsed:.2f}s")
+                except Exception as e:
+                    elapsed = time.perf_counter() - started
+                    for name in names:
+                        self.warm_up_report[name] = {"error": str(e), "seconds": round(elapsed, 3)}
+                        logger.warning(f"Warm-up of {name} failed after {elapsed:.2f}s: {str(e)}")
+
+        # One load per upstream fetch: grouped collections share a single task
+        units = {}
+        for name in self.loaders:
+            if name not in self._snapshots:
+                units.setdefault(self._group_of.get(name, name), []).append(name)
+
+        started = time.perf_counter()
+        tasks = {asyncio.create_task(warm(names)): ", ".join(names) for names in units.values()}
+        if not tasks:
+            return
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            self._warming.add(task)
+            task.add_done_callback(self._warming.discard)
+        if pending:
+            still_loading = ", ".join(sorted(tasks[task] for task in pending))
+            logger.warning(f"Warm-up budget of {timeout:.0f}s exhausted; still loading in background: {still_loading}")
+        logger.info(f"Warm-up finished in {time.perf_counter() - started:.2f}s ({len(done)}/{len(tasks)} upstream loads)")
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drop one (or every) snapshot so the next read reloads it"""
+        if name is None:
+            self._snapshots.clear()
+            self._combined.clear()
+        else:
+            self._snapshots.pop(name, None)
+            # Reloaded snapshots restart at version 1, so combined indexes over them could match by version
+            for key, (names, _) in self.combined_indexes.items():
+                if name in names:
+                    self._combined.pop(key, None)
+
+    def stats(self) -> dict:
+        collections = {}
+        for name, counters in self._stats.items():
+            snapshot = self._snapshots.get(name)
+            collections[name] = {
+                **counters,
+                "ttl": self.ttls[name],
+                "cached": snapshot is not None,
+                "items": len(snapshot.items) if snapshot else 0,
+                "version": snapshot.version if snapshot else 0,
+                "age_seconds": round(snapshot.age, 3) if snapshot else None,
+                "loaded_at": snapshot.loaded_at.isoformat() if snapshot else None,
+                "source": snapshot.source if snapshot else None,
+                "refreshing": name in self._refreshing
+            }
+            if name in self.incremental:
+                collections[name]["sync"] = self.incremental[name].stats
+        return collections
+
+
+class SnapshotMirror:
+    """Durable copy of every collection snapshot in MongoDB.
+
+    Each successful Airtable load is written as one document per collection
+    (``_id`` is the collection name, ``version`` is bumped on every write), so
+    a freshly booted worker can serve content before Airtable answers and the
+    site stays readable during Airtable outages.
+    """
+
+    def __init__(self, collection, models: dict, timeout: float = CONTENT_MIRROR_TIMEOUT):
+        self.collection = collection
+        self.models = models
+        self.timeout = timeout
+
+    async def save(self, snapshot: CollectionSnapshot):
+        items = [item.model_dump() if hasattr(item, "model_dump") else item for item in snapshot.items]
+        try:
+            await asyncio.wait_for(self.collection.update_one(
+                {"_id": snapshot.name},
+                {
+                    "$set": {"items": items, "loaded_at": snapshot.loaded_at},
+                    "$inc": {"version": 1}
+                },
+                upsert=True
+            ), timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f"Could not mirror {snapshot.name} snapshot to MongoDB: {str(e)}")
+
+    async def load_all(self) -> List[CollectionSnapshot]:
+        try:
+            documents = await asyncio.wait_for(
+                self.collection.find({"_id": {"$in": list(self.models)}}).to_list(len(self.models)),
+                timeout=self.timeout
+            )
+        except Exception as e:
+            logger.warning(f"Could not read content snapshots from MongoDB: {str(e)}")
+            return []
+
+        snapshots = []
+        for document in documents:
+            model = self.models[document["_id"]]
+            try:
+                items = validate_many(model, document.get("items", []))
+            except Exception as e:
+                logger.warning(f"Discarding unreadable {document['_id']} snapshot from MongoDB: {str(e)}")
+                continue
+            snapshots.append(CollectionSnapshot(
+                document["_id"], items, version=document.get("version", 1),
+                loaded_at=document.get("loaded_at"), source="mongo"
+            ))
+        return snapshots
+
+
+CONTENT_MODELS = {
+    "videos": AirtableVideo,
+    "podcasts": AirtablePodcast,
+    "articles": AirtableArticle,
+    "newsroom": AirtableNewsroom,
+    "events": AirtableEvent,
+    "team": AirtableTeamMember,
+    "gc_members": AirtableGCMember,
+    "in_the_press": AirtableInThePress
+}
+
+def video_speakers(video) -> List[str]:
+    """Individual names from a video's comma-joined Featured Speakers"""
+    return [speaker.strip() for speaker in (video.featured_speakers or "").split(",") if speaker.strip()]
+
+# Facets /api/videos can filter and count by: facet -> values of a video
+VIDEO_FACETS = {
+    "category": lambda video: [video.category],
+    "tags": lambda video: video.tags or [],
+    "speaker": video_speakers
+}
+
+# Related-content types, the collection each is read from and its feature terms
+RELATED_TYPES = {
+    "video": ("videos", lambda video: related_terms(
+        topics=[*(video.keywords or ()), *(video.tags or ())], categories=[video.category],
+        speakers=video.featured_speakers)),
+    "podcast": ("podcasts", lambda podcast: related_terms(
+        topics=podcast.keywords or [], speakers=podcast.featured_speaker)),
+    "article": ("articles", lambda article: related_terms(
+        topics=[*(article.keywords or ()), *(article.tags or ())], speakers=article.featured_speaker_linkedin))
+}
+RELATED_TOP_K = int(os.environ.get('RELATED_TOP_K', '10'))  # neighbors kept per item and type
+
+def build_related_index(collections: dict) -> RelatedContentIndex:
+    return RelatedContentIndex(
+        {content_type: collections[name] for content_type, (name, _) in RELATED_TYPES.items()},
+        {content_type: terms for content_type, (_, terms) in RELATED_TYPES.items()},
+        top_k=RELATED_TOP_K
+    )
+
+# Full-text search: result type -> (collection, how its items are indexed and rendered)
+SEARCH_TYPES = {
+    "video": ("videos", functools.partial(
+        SearchIndex,
+        fields=[(lambda video: video.vimeo_name, 3), (lambda video: video.featured_speakers, 2),
+                (lambda video: video.video_description, 1), (lambda video: video.vimeo_long_description, 1)],
+        title=lambda video: video.vimeo_name or video.video_description,
+        snippet_fields=[lambda video: video.vimeo_long_description, lambda video: video.video_description])),
+    "podcast": ("podcasts", functools.partial(
+        SearchIndex,
+        fields=[(lambda podcast: podcast.title, 3), (lambda podcast: podcast.featured_speaker, 2),
+                (lambda podcast: podcast.description, 1)],
+        title=lambda podcast: podcast.title,
+        snippet_fields=[lambda podcast: podcast.description])),
+    # Blog-table bodies are indexed from the full records each refresh reads (the snapshots leave them out),
+    # so their snippets come from the teaser
+    "article": ("articles", functools.partial(
+        SearchIndex,
+        fields=[(lambda article: article.blog_title, 3), (lambda article: article.featured_speaker_linkedin, 2),
+                (lambda article: article.description_teaser, 1), (lambda article: article.body_of_blog, 1),
+                (lambda article: article.body_qa, 1)],
+        title=lambda article: article.blog_title,
+        snippet_fields=[lambda article: article.description_teaser])),
+    "newsroom": ("newsroom", functools.partial(
+        SearchIndex,
+        fields=[(lambda article: article.blog_title, 3), (lambda article: article.featured_speakers, 2),
+                (lambda article: article.description_teaser, 1), (lambda article: article.body_of_blog, 1)],
+        title=lambda article: article.blog_title,
+        snippet_fields=[lambda article: article.description_teaser])),
+    "press": ("in_the_press", functools.partial(
+        SearchIndex,
+        fields=[(lambda press: press.article_title, 3), (lambda press: press.author_names, 2),
+                (lambda press: press.short_description, 1), (lambda press: press.body_of_article, 1)],
+        title=lambda press: press.article_title,
+        snippet_fields=[lambda press: press.short_description]))
+}
+SEARCH_MAX_LIMIT = 50
+
+# Typeahead sources: suggestion type -> (collection, text); views are ordered newest/most prominent first
+SUGGEST_TYPES = {
+    "video": ("videos", lambda video: video.vimeo_name),
+    "article": ("articles", lambda article: article.blog_title),
+    "podcast": ("podcasts", lambda podcast: podcast.title)
+}
+SUGGEST_MAX_LIMIT = 20
+
+def build_suggest_index(collections: dict) -> SuggestIndex:
+    """Titles weighted by view position, speakers by how many videos feature them, GC members evenly"""
+    suggestions = []
+    for content_type, (name, text) in SUGGEST_TYPES.items():
+        items = collections[name]
+        suggestions.extend(Suggestion(text(item), content_type, item.id, 1 - position / len(items))
+                           for position, item in enumerate(items))
+    speakers = Counter(speaker for video in collections["videos"] for speaker in video_speakers(video))
+    most_featured = max(speakers.values(), default=1)
+    suggestions.extend(Suggestion(speaker, "speaker", None, count / most_featured)
+                       for speaker, count in speakers.items())
+    suggestions.extend(Suggestion(member.whole_name, "member", member.id, 0.5)
+                       for member in collections["gc_members"])
+    return SuggestIndex(suggestions)
+
+# Cache-Control per collection, and purges of the surrogate keys of changed content
+cache_policies = collection_policies(CONTENT_MODELS)
+surrogate_purger = SurrogatePurger(os.environ.get('SURROGATE_PURGE_URL'), os.environ.get('SURROGATE_PURGE_TOKEN'))
+
+content_mirror = SnapshotMirror(db.content_snapshots, CONTENT_MODELS) if CONTENT_MIRROR_ENABLED else None
+
+content_cache = CollectionCache({
+    "videos": fetch_airtable_videos,
+    "podcasts": fetch_airtable_podcasts,
+    "articles": fetch_airtable_articles,
+    "newsroom": fetch_airtable_newsroom,
+    "events": fetch_airtable_events,
+    "team": fetch_airtable_team,
+    "gc_members": fetch_airtable_gc_members,
+    "in_the_press": fetch_airtable_in_the_press
+}, mirror=content_mirror, incremental={
+    "videos": IncrementalSync(sort_key=lambda video: video.softr_order or 0, reverse=True),
+    "team": IncrementalSync()
+}, groups={
+    # Articles, newsroom and In the Press are views of one table, fetched together
+    "blog_table": (fetch_airtable_blog_table, ["articles", "newsroom", "in_the_press"])
+}, record_loaders={
+    # Detail pages for records beyond the listing cap or newer than the snapshot
+    "videos": functools.partial(fetch_airtable_record, VIDEOS_BASE_ID, VIDEOS_TABLE_ID, VIDEOS_VIEW_ID,
+                                VIDEO_MAPPER, label="videos"),
+    "podcasts": functools.partial(fetch_airtable_record, PODCASTS_BASE_ID, PODCASTS_TABLE_ID, PODCASTS_VIEW_ID,
+                                  PODCAST_MAPPER, label="podcasts"),
+    "articles": functools.partial(fetch_airtable_record, ARTICLES_BASE_ID, ARTICLES_TABLE_ID, ARTICLES_VIEW_ID,
+                                  ARTICLE_MAPPER, label="articles"),
+    "newsroom": functools.partial(fetch_airtable_record, NEWSROOM_BASE_ID, NEWSROOM_TABLE_ID, NEWSROOM_VIEW_ID,
+                                  NEWSROOM_MAPPER, label="newsroom"),
+    "in_the_press": functools.partial(fetch_airtable_record, IN_THE_PRESS_BASE_ID, ARTICLES_TABLE_ID,
+                                      IN_THE_PRESS_VIEW_ID, IN_THE_PRESS_MAPPER, label="in_the_press")
+}, indexes={
+    # Keyword postings for the /similar routes, BM25 postings for /search, facets for /videos
+    "videos": {"keywords": KeywordIndex, "search": SEARCH_TYPES["video"][1],
+               "facets": functools.partial(FacetIndex, facets=VIDEO_FACETS)},
+    "podcasts": {"keywords": KeywordIndex, "search": SEARCH_TYPES["podcast"][1]},
+    "articles": {"keywords": KeywordIndex, "search": SEARCH_TYPES["article"][1]},
+    "newsroom": {"search": SEARCH_TYPES["newsroom"][1]},
+    "in_the_press": {"search": SEARCH_TYPES["press"][1]}
+}, combined_indexes={
+    # Cross-type "related content" for /api/related/{id}
+    "related": (["videos", "podcasts", "articles"], build_related_index),
+    # Typeahead for /api/suggest
+    "suggest": (["videos", "articles", "podcasts", "gc_members"], build_suggest_index)
+}, listing_only={
+    # Blog-table listings leave out article bodies (BLOG_TABLE_BODY_FIELDS); detail routes read them per record
+    "articles": ARTICLE_MAPPER.omitting(BLOG_TABLE_BODY_FIELDS),
+    "newsroom": NEWSROOM_MAPPER.omitting(BLOG_TABLE_BODY_FIELDS),
+    "in_the_press": IN_THE_PRESS_MAPPER.omitting(BLOG_TABLE_BODY_FIELDS)
+}, on_change=lambda name, changed, listing: surrogate_purger.purge([name, *changed] if listing else changed))
+
+
 # Add your routes to the router instead of directly to app
 @api_router.get("/")
 async def root():
@@ -951,95 +1408,357 @@ async def get_status_checks():
     status_checks = await db.status_checks.find({}, {"_id": 0}).limit(100).to_list(100)
     return [StatusCheck(**status_check) for status_check in status_checks]
 
+@api_router.get("/stats")
+async def get_stats():
+    """Content cache statistics (hits, misses, snapshot age per collection)"""
+    return {
+        "cache": content_cache.stats(),
+        "warm_up": content_cache.warm_up_report,
+        "single_flight": upstream_flights.stats(),
+        "surrogate_purges": surrogate_purger.stats(),
+        "airtable": airtable.stats()
+    }
+
 @api_router.get("/podcasts/similar/{podcast_id}")
-async def get_similar_podcasts(podcast_id: str):
+async def get_similar_podcasts(podcast_id: str, request: Request, response: Response):
     """Get similar podcasts based on keywords"""
     try:
-        # Get all podcasts
-        all_podcasts = await fetch_airtable_podcasts()
-        
-        # Find the target podcast
-        target_podcast = None
-        for podcast in all_podcasts:
-            if podcast.id == podcast_id:
-                target_podcast = podcast
-                break
-        
-        if not target_podcast or not target_podcast.keywords:
-            return []
-        
-        # Find similar podcasts based on keyword overlap
-        similar_podcasts = []
-        target_keywords = set(target_podcast.keywords)
-        
-        for podcast in all_podcasts:
-            if podcast.id == podcast_id:  # Skip the same podcast
-                continue
-                
-            if podcast.keywords:
-                podcast_keywords = set(podcast.keywords)
-                overlap = len(target_keywords.intersection(podcast_keywords))
-                
-                if overlap > 0:  # Has at least one keyword in common
-                    similar_podcasts.append({
-                        "podcast": podcast,
-                        "similarity_score": overlap
-                    })
-        
-        # Sort by similarity score and return top 3
-        similar_podcasts.sort(key=lambda x: x["similarity_score"], reverse=True)
-        return [item["podcast"] for item in similar_podcasts[:3]]
+        # Top 3 podcasts by keyword overlap, from the snapshot's keyword index
+        snapshot = await content_cache.get("podcasts")
+        not_modified = revalidate(request, response, snapshot, encoded=False)
+        if not_modified:
+            return not_modified
+        return [podcast.view() for podcast in snapshot.indexes["keywords"].similar(podcast_id, 3)]
         
     except Exception as e:
         logger.error(f"Error in get_similar_podcasts: {str(e)}")
+        uncacheable(response)
         return []
 
+# Largest page a list route serves when a client asks for one (no limit means the whole list)
+LIST_MAX_LIMIT = int(os.environ.get('LIST_MAX_LIMIT', '100'))
+
+def check_list_params(name: str, cursor: Optional[str], fields: Optional[str]):
+    """Reject a malformed cursor or unknown fields with a 400.
+
+    List routes call this before their ``try``, whose fallback turns any
+    other failure (an unreachable Airtable included) into an empty list.
+    """
+    try:
+        if cursor:
+            decode_cursor(cursor)
+        parse_fields(fields, CONTENT_MODELS[name])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def page_records(snapshot: CollectionSnapshot, request: Request, cursor: Optional[str], limit: Optional[int],
+                 fields: Optional[str], items: Optional[list] = None):
+    """Apply a list route's checked cursor/limit/fields parameters to a snapshot, or to ``items`` filtered from it.
+
+    Returns (records, headers): models, or plain dicts of just the requested
+    fields; headers carry the next page's cursor when there is one.
+    """
+    selected = parse_fields(fields, CONTENT_MODELS[snapshot.name])
+    page = paginate(snapshot.items if items is None else items, snapshot.positions, cursor,
+                    None if limit is None else max(1, min(limit, LIST_MAX_LIMIT)),
+                    None if items is None else (lambda item: snapshot.positions[item.id]))
+    headers = {}
+    if page.next_cursor:
+        headers["X-Next-Cursor"] = page.next_cursor
+        headers["Link"] = f'<{request.url.include_query_params(cursor=page.next_cursor)}>; rel="next"'
+    return (page.items if selected is None else select_fields(page.items, selected)), headers
+
+def json_response(request: Request, response: Response, body: RenderedJSON, headers: Optional[dict] = None):
+    """Send a rendered body in the best encoding the client accepts, with the headers set so far.
+
+    Answers 304 instead when ``_revalidate`` left that to the body (the
+    client's copy is current by date or ``If-None-Match: *``), tagged with
+    the variant this body would have been sent as.
+    """
+    if getattr(request.state, "not_modified", False):
+        encoding = body.encoding_for(request.headers.get("accept-encoding"))
+        response.headers["ETag"] = variant_etag(response.headers["ETag"], encoding)
+        return Response(status_code=304, headers=dict(response.headers))
+    content, encoding = body.negotiate(request.headers.get("accept-encoding"))
+    headers = {**response.headers, **(headers or {})}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        if "etag" in headers:
+            headers["etag"] = variant_etag(headers["etag"], encoding)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+def list_response(request: Request, response: Response, snapshot: CollectionSnapshot, cursor: Optional[str],
+                  limit: Optional[int], fields: Optional[str]):
+    """A list route's body: the snapshot's pre-rendered listing, or a page/selection of it rendered now"""
+    if not cursor and limit is None and not fields:
+        return json_response(request, response, snapshot.body())
+    records, headers = page_records(snapshot, request, cursor, limit, fields)
+    return json_response(request, response, RenderedJSON.of(records), headers)
+
+def _revalidate(request: Request, response: Response, digest: str, modified: datetime, names: List[str],
+                surrogate_keys: List[str], encoded: bool = True) -> Optional[Response]:
+    # Query parameters select different representations of the same content, so they are part of the tag
+    if request.url.query:
+        digest = combine_hashes([digest, *sorted(f"{key}={value}" for key, value
+                                                 in request.query_params.multi_items())])
+    response.headers["ETag"] = f'"{digest}"'
+    response.headers["Last-Modified"] = http_date(modified)
+    response.headers["Cache-Control"] = strictest(cache_policies[name] for name in names).header()
+    response.headers["Surrogate-Key"] = " ".join(surrogate_keys)
+    response.headers["Vary"] = "Accept-Encoding"
+    if is_fresh(request.headers, response.headers["ETag"], modified):
+        # A 304 carries the ETag of the variant the client holds (the one a 200 would have sent)
+        etag = matched_etag(request.headers, response.headers["ETag"])
+        if etag is None and encoded:
+            # Fresh by date or "*": whether a 200 would be content-coded depends on the body's size,
+            # so json_response answers once the route has it
+            request.state.not_modified = True
+            return None
+        response.headers["ETag"] = etag or response.headers["ETag"]
+        return Response(status_code=304, headers=dict(response.headers))
+    return None
+
+def uncacheable(response: Response):
+    """Drop the validators a route set for its content, for a fallback body that must not be cached under them"""
+    for header in ("ETag", "Last-Modified", "Surrogate-Key"):
+        if header in response.headers:
+            del response.headers[header]
+    response.headers["Cache-Control"] = "no-store"
+
+def revalidate(request: Request, response: Response, *snapshots: CollectionSnapshot,
+               encoded: bool = True) -> Optional[Response]:
+    """Set validator and caching headers for a response built from ``snapshots``.
+
+    Returns a bodiless 304 when the client's copy is still current, so the
+    route can return it before rendering anything; otherwise None. The
+    response is tagged with its collections' surrogate keys. Routes that
+    return plain lists (never content-coded) pass ``encoded=False``; for the
+    others, a 304 that depends on the body is sent by ``json_response``.
+    """
+    if len(snapshots) == 1:
+        digest = snapshots[0].content_hash
+    else:
+        digest = combine_hashes(snapshot.content_hash for snapshot in snapshots)
+    names = [snapshot.name for snapshot in snapshots]
+    return _revalidate(request, response, digest, max(snapshot.modified for snapshot in snapshots), names, names,
+                       encoded)
+
+def record_response(request: Request, response: Response, name: str, item):
+    """A detail route's response: 304 if the client's copy is current, else the record's pre-rendered body.
+
+    Validators and surrogate key are the record's own, not its collection's.
+    """
+    snapshot = content_cache.current(name)
+    detail = snapshot.details.get(item.id)
+    if detail is not None and detail[0] is item:
+        record_hash, body = detail[1], detail[2]
+    elif snapshot.by_id.get(item.id) is item:
+        record_hash, body = snapshot.record_hashes[item.id], None
+    else:
+        record_hash, body = content_hash(item), None
+    not_modified = _revalidate(request, response, record_hash, snapshot.last_modified(item.id), [name], [item.id])
+    if not_modified:
+        return not_modified
+    if body is None:
+        body = snapshot.record_body(item.id) if snapshot.by_id.get(item.id) is item else RenderedJSON.of(item)
+    return json_response(request, response, body)
+
+def parse_type_filter(value: Optional[str], allowed: dict) -> Optional[List[str]]:
+    """Comma-separated ``type`` query parameter as a list (None if absent), rejecting unknown types"""
+    if not value:
+        return None
+    types = list(dict.fromkeys(content_type.strip() for content_type in value.split(",") if content_type.strip()))
+    unknown = [content_type for content_type in types if content_type not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown content type: {', '.join(unknown)}")
+    return types or None
+
+@api_router.get("/search")
+async def search_content(request: Request, response: Response, q: str = "", type: Optional[str] = None,
+                         limit: int = 10):
+    """Full-text search over videos, podcasts, articles, newsroom and In the Press.
+
+    Results are ranked by BM25 and carry an HTML snippet with matches wrapped
+    in ``<mark>``. ``type`` optionally restricts results to a comma-separated
+    list of ``video``, ``podcast``, ``article``, ``newsroom`` and ``press``.
+    """
+    types = parse_type_filter(type, SEARCH_TYPES) or list(SEARCH_TYPES)
+    try:
+        snapshots = await asyncio.gather(*(content_cache.get(SEARCH_TYPES[content_type][0]) for content_type in types))
+        not_modified = revalidate(request, response, *snapshots, encoded=False)
+        if not_modified:
+            return not_modified
+        indexes = {content_type: snapshot.indexes["search"] for content_type, snapshot in zip(types, snapshots)}
+        return search(indexes, q, max(1, min(limit, SEARCH_MAX_LIMIT)))
+    except Exception as e:
+        logger.error(f"Error in search_content: {str(e)}")
+        uncacheable(response)
+        return []
+
+@api_router.get("/suggest")
+async def suggest_content(request: Request, response: Response, prefix: str = "", limit: int = 8):
+    """Typeahead: titles, speakers and GC members with a word starting with ``prefix``"""
+    try:
+        index = await content_cache.get_combined("suggest")
+        not_modified = revalidate(request, response, *content_cache.sources("suggest"), encoded=False)
+        if not_modified:
+            return not_modified
+        return [
+            {"text": suggestion.text, "type": suggestion.type, "id": suggestion.id}
+            for suggestion in index.suggest(prefix, max(1, min(limit, SUGGEST_MAX_LIMIT)))
+        ]
+    except Exception as e:
+        logger.error(f"Error in suggest_content: {str(e)}")
+        uncacheable(response)
+        return []
+
+@api_router.get("/related/{item_id}")
+async def get_related_content(item_id: str, request: Request, response: Response, type: Optional[str] = None,
+                              limit: int = 6):
+    """Related videos, podcasts and articles for any of them, by TF-IDF similarity.
+
+    ``type`` optionally restricts results to a comma-separated list of
+    ``video``, ``podcast`` and ``article``.
+    """
+    types = parse_type_filter(type, RELATED_TYPES)
+    try:
+        index = await content_cache.get_combined("related")
+        not_modified = revalidate(request, response, *content_cache.sources("related"), encoded=False)
+        if not_modified:
+            return not_modified
+        return [
+            {"type": content_type, "score": score, "item": item.view()}
+            for content_type, item, score in index.related(item_id, types, max(1, min(limit, RELATED_TOP_K)))
+        ]
+    except Exception as e:
+        logger.error(f"Error in get_related_content: {str(e)}")
+        uncacheable(response)
+        return []
+
+# Rendered /bundle bodies by include list, each with the content hashes it was built from, oldest first
+BUNDLE_CACHE_MAX = int(os.environ.get('BUNDLE_CACHE_MAX', '64'))
+bundle_bodies = OrderedDict()
+
+def parse_bundle_include(value: str) -> List[tuple]:
+    """``include`` as [(collection, count)], e.g. "newsroom:6,events:4" (hyphenated route names work too)"""
+    parts = [part.strip() for part in value.split(",") if part.strip()]
+    if not parts:
+        raise HTTPException(status_code=400, detail="include must list at least one collection:count")
+    include = []
+    for part in parts:
+        name, _, count = part.partition(":")
+        name = name.strip().replace("-", "_")
+        if name not in CONTENT_MODELS:
+            raise HTTPException(status_code=400, detail=f"Unknown collection: {name}")
+        if any(name == included for included, _ in include):
+            raise HTTPException(status_code=400, detail=f"Collection included twice: {name}")
+        count = count.strip()
+        if not count.isdigit() or not 1 <= int(count) <= LIST_MAX_LIMIT:
+            raise HTTPException(status_code=400,
+                                detail=f"Count for {name} must be between 1 and {LIST_MAX_LIMIT}")
+        include.append((name, int(count)))
+    return include
+
+@api_router.get("/bundle")
+async def get_bundle(request: Request, response: Response, include: str = ""):
+    """The first records of several collections in one response, e.g. ``include=newsroom:6,events:4,videos:8``.
+
+    Returns an object with one array per included collection, in listing
+    order. Missing collections are loaded concurrently; the body is cached
+    until one of them changes, and is revalidated like a listing.
+    """
+    include = parse_bundle_include(include)
+    try:
+        snapshots = await asyncio.gather(*(content_cache.get(name) for name, _ in include))
+        not_modified = revalidate(request, response, *snapshots)
+        if not_modified:
+            return not_modified
+        key = tuple(include)
+        hashes = tuple(snapshot.content_hash for snapshot in snapshots)
+        cached = bundle_bodies.get(key)
+        if cached is not None and cached[0] == hashes:
+            bundle_bodies.move_to_end(key)
+        else:
+            body = RenderedJSON(b"{" + b",".join(
+                dumps(name) + b":" + snapshot.head(count) for (name, count), snapshot in zip(include, snapshots)
+            ) + b"}")
+            cached = bundle_bodies[key] = (hashes, body)
+            bundle_bodies.move_to_end(key)
+            while len(bundle_bodies) > BUNDLE_CACHE_MAX:
+                bundle_bodies.popitem(last=False)
+        return json_response(request, response, cached[1])
+    except Exception as e:
+        logger.error(f"Error in get_bundle: {str(e)}")
+        uncacheable(response)
+        return {}
+
 @api_router.get("/podcasts", response_model=List[AirtablePodcast])
-async def get_podcasts():
+async def get_podcasts(request: Request, response: Response, cursor: Optional[str] = None,
+                       limit: Optional[int] = None, fields: Optional[str] = None):
     """Get podcasts from Airtable"""
+    check_list_params("podcasts", cursor, fields)
     try:
-        podcasts = await fetch_airtable_podcasts()
-        logger.info(f"Successfully fetched {len(podcasts)} podcasts from Airtable")
-        return podcasts
+        snapshot = await content_cache.get("podcasts")
+        not_modified = revalidate(request, response, snapshot)
+        if not_modified:
+            return not_modified
+        return list_response(request, response, snapshot, cursor, limit, fields)
     except Exception as e:
         logger.error(f"Error in get_podcasts: {str(e)}")
+        uncacheable(response)
         return []
 
 @api_router.get("/podcast/{podcast_id}")
-async def get_podcast(podcast_id: str):
+async def get_podcast(podcast_id: str, request: Request, response: Response):
     """Get a single podcast by ID from Airtable"""
     try:
-        podcasts = await fetch_airtable_podcasts()
-        for podcast in podcasts:
-            if podcast.id == podcast_id:
-                return podcast
-        raise HTTPException(status_code=404, detail="Podcast not found")
+        podcast = await content_cache.get_item("podcasts", podcast_id)
+        if podcast is None:
+            raise HTTPException(status_code=404, detail="Podcast not found")
+        return record_response(request, response, "podcasts", podcast)
     except HTTPException as he:
         raise he
     except Exception as e:
         logger.error(f"Error in get_podcast: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch podcast")
 
-@api_router.get("/videos", response_model=List[AirtableVideo])
-async def get_videos():
-    """Get videos from Airtable"""
+@api_router.get("/videos", response_model=Union[List[AirtableVideo], FacetedVideos])
+async def get_videos(request: Request, response: Response, category: List[str] = Query(default=[]),
+                     tag: List[str] = Query(default=[]), speaker: List[str] = Query(default=[]),
+                     facets: bool = False, cursor: Optional[str] = None, limit: Optional[int] = None,
+                     fields: Optional[str] = None):
+    """Get videos from Airtable.
+
+    With any category/tag/speaker filter (repeatable; ORed within a facet,
+    ANDed across facets) or ``facets=true``, returns the matching videos with
+    per-facet counts instead of the bare list.
+    """
+    check_list_params("videos", cursor, fields)
     try:
-        videos = await fetch_airtable_videos()
-        logger.info(f"Successfully fetched {len(videos)} videos from Airtable")
-        return videos
+        filters = {"category": category, "tags": tag, "speaker": speaker}
+        snapshot = await content_cache.get("videos")
+        not_modified = revalidate(request, response, snapshot)
+        if not_modified:
+            return not_modified
+        if not facets and not any(filters.values()):
+            return list_response(request, response, snapshot, cursor, limit, fields)
+        videos, counts = snapshot.indexes["facets"].select(filters)
+        records, headers = page_records(snapshot, request, cursor, limit, fields, videos)
+        return json_response(request, response,
+                             RenderedJSON.of({"items": records, "total": len(videos), "facets": counts}), headers)
     except Exception as e:
         logger.error(f"Error in get_videos: {str(e)}")
+        uncacheable(response)
         return []
 
 @api_router.get("/video/{video_id}")
-async def get_video(video_id: str):
+async def get_video(video_id: str, request: Request, response: Response):
     """Get a single video by ID from Airtable"""
     try:
-        videos = await fetch_airtable_videos()
-        for video in videos:
-            if video.id == video_id:
-                return video
-        raise HTTPException(status_code=404, detail="Video not found")
+        video = await content_cache.get_item("videos", video_id)
+        if video is None:
+            raise HTTPException(status_code=404, detail="Video not found")
+        return record_response(request, response, "videos", video)
     except HTTPException as he:
         raise he
     except Exception as e:
@@ -1047,68 +1766,45 @@ async def get_video(video_id: str):
         raise HTTPException(status_code=500, detail="Failed to fetch video")
 
 @api_router.get("/videos/similar/{video_id}")
-async def get_similar_videos(video_id: str):
+async def get_similar_videos(video_id: str, request: Request, response: Response):
     """Get similar videos based on keywords"""
     try:
-        # Get all videos
-        all_videos = await fetch_airtable_videos()
-        
-        # Find the target video
-        target_video = None
-        for video in all_videos:
-            if video.id == video_id:
-                target_video = video
-                break
-        
-        if not target_video or not target_video.keywords:
-            return []
-        
-        # Find similar videos based on keyword overlap
-        similar_videos = []
-        target_keywords = set(target_video.keywords)
-        
-        for video in all_videos:
-            if video.id == video_id:  # Skip the same video
-                continue
-                
-            if video.keywords:
-                video_keywords = set(video.keywords)
-                overlap = len(target_keywords.intersection(video_keywords))
-                
-                if overlap > 0:  # Has at least one keyword in common
-                    similar_videos.append({
-                        "video": video,
-                        "similarity_score": overlap
-                    })
-        
-        # Sort by similarity score and return top 3
-        similar_videos.sort(key=lambda x: x["similarity_score"], reverse=True)
-        return [item["video"] for item in similar_videos[:3]]
+        # Top 3 videos by keyword overlap, from the snapshot's keyword index
+        snapshot = await content_cache.get("videos")
+        not_modified = revalidate(request, response, snapshot, encoded=False)
+        if not_modified:
+            return not_modified
+        return [video.view() for video in snapshot.indexes["keywords"].similar(video_id, 3)]
         
     except Exception as e:
         logger.error(f"Error in get_similar_videos: {str(e)}")
+        uncacheable(response)
         return []
 
 @api_router.get("/articles", response_model=List[AirtableArticle])
-async def get_articles():
+async def get_articles(request: Request, response: Response, cursor: Optional[str] = None,
+                       limit: Optional[int] = None, fields: Optional[str] = None):
     """Get articles from Airtable (sorted according to AirTable view configuration)"""
+    check_list_params("articles", cursor, fields)
     try:
-        articles = await fetch_airtable_articles()
-        logger.info(f"Successfully fetched {len(articles)} articles from Airtable")
-        return articles
+        snapshot = await content_cache.get("articles")
+        not_modified = revalidate(request, response, snapshot)
+        if not_modified:
+            return not_modified
+        return list_response(request, response, snapshot, cursor, limit, fields)
     except Exception as e:
         logger.error(f"Error in get_articles: {str(e)}")
+        uncacheable(response)
         return []
 
 @api_router.get("/article/{article_id}")
-async def get_article(article_id: str):
+async def get_article(article_id: str, request: Request, response: Response):
     """Get a single article by ID from Airtable"""
     try:
-        articles = await fetch_airtable_articles()
-        for article in articles:
-            if article.id == article_id:
-                return article
-        raise HTTPException(status_code=404, detail="Article not found")
+        article = await content_cache.get_detail("articles", article_id)
+        if article is None:
+            raise HTTPException(status_code=404, detail="Article not found")
+        return record_response(request, response, "articles", article)
     except HTTPException as he:
         raise he
     except Exception as e:
@@ -1116,84 +1812,49 @@ async def get_article(article_id: str):
         raise HTTPException(status_code=500, detail="Failed to fetch article")
 
 @api_router.get("/articles/similar/{article_id}", response_model=List[AirtableArticle])
-async def get_similar_articles(article_id: str):
+async def get_similar_articles(article_id: str, request: Request, response: Response):
     """Get similar articles based on keyword matching"""
     try:
-        all_articles = await fetch_airtable_articles()
-        
-        # Find the target article
-        target_article = None
-        for article in all_articles:
-            if article.id == article_id:
-                target_article = article
-                break
-        
-        if not target_article:
-            return []
-        
-        # If no keywords, return empty list
-        if not target_article.keywords or len(target_article.keywords) == 0:
-            return []
-        
-        # Calculate similarity scores
-        similar_articles = []
-        target_keywords = set(target_article.keywords)
-        
-        for article in all_articles:
-            # Skip the article itself
-            if article.id == article_id:
-                continue
-            
-            # Skip articles without keywords
-            if not article.keywords or len(article.keywords) == 0:
-                continue
-            
-            # Calculate similarity (number of matching keywords)
-            article_keywords = set(article.keywords)
-            common_keywords = target_keywords.intersection(article_keywords)
-            similarity_score = len(common_keywords)
-            
-            # Only include articles with at least 1 matching keyword
-            if similarity_score > 0:
-                similar_articles.append({
-                    'article': article,
-                    'score': similarity_score
-                })
-        
-        # Sort by similarity score (descending) and return top 3
-        similar_articles.sort(key=lambda x: x['score'], reverse=True)
-        top_similar = [item['article'] for item in similar_articles[:3]]
+        # Top 3 articles by matching keywords, from the snapshot's keyword index
+        snapshot = await content_cache.get("articles")
+        not_modified = revalidate(request, response, snapshot, encoded=False)
+        if not_modified:
+            return not_modified
+        top_similar = [article.view() for article in snapshot.indexes["keywords"].similar(article_id, 3)]
         
         logger.info(f"Found {len(top_similar)} similar articles for article {article_id}")
         return top_similar
         
     except Exception as e:
         logger.error(f"Error in get_similar_articles: {str(e)}")
+        uncacheable(response)
         return []
 
 @api_router.get("/newsroom", response_model=List[AirtableNewsroom])
-async def get_newsroom():
+async def get_newsroom(request: Request, response: Response, cursor: Optional[str] = None,
+                       limit: Optional[int] = None, fields: Optional[str] = None):
     """Get newsroom articles from Airtable"""
+    check_list_params("newsroom", cursor, fields)
     try:
-        newsroom_articles = await fetch_airtable_newsroom()
-        logger.info(f"Successfully fetched {len(newsroom_articles)} newsroom articles from Airtable")
-        return newsroom_articles
+        snapshot = await content_cache.get("newsroom")
+        not_modified = revalidate(request, response, snapshot)
+        if not_modified:
+            return not_modified
+        return list_response(request, response, snapshot, cursor, limit, fields)
     except Exception as e:
         logger.error(f"Error in get_newsroom: {str(e)}")
+        uncacheable(response)
         return []
 
 @api_router.get("/newsroom/{article_id}")
-async def get_newsroom_article(article_id: str):
+async def get_newsroom_article(article_id: str, request: Request, response: Response):
     """Get a single newsroom article by ID from Airtable"""
     try:
-        newsroom_articles = await fetch_airtable_newsroom()
-        
-        # Find the specific article
-        article = next((art for art in newsroom_articles if art.id == article_id), None)
+        article = await content_cache.get_detail("newsroom", article_id)
         if not article:
             raise HTTPException(status_code=404, detail="Newsroom article not found")
         
-        return article
+        return record_response(request, response, "newsroom", article)
     except HTTPException as he:
         raise he
     except Exception as e:
@@ -1201,25 +1862,29 @@ async def get_newsroom_article(article_id: str):
         raise HTTPException(status_code=500, detail="Failed to fetch newsroom article")
 
 @api_router.get("/in-the-press", response_model=List[AirtableInThePress])
-async def get_in_the_press():
+async def get_in_the_press(request: Request, response: Response, cursor: Optional[str] = None,
+                           limit: Optional[int] = None, fields: Optional[str] = None):
     """Get In the Press articles from Airtable"""
+    check_list_params("in_the_press", cursor, fields)
     try:
-        press_articles = await fetch_airtable_in_the_press()
-        logger.info(f"Successfully fetched {len(press_articles)} In the Press articles from Airtable")
-        return press_articles
+        snapshot = await content_cache.get("in_the_press")
+        not_modified = revalidate(request, response, snapshot)
+        if not_modified:
+            return not_modified
+        return list_response(request, response, snapshot, cursor, limit, fields)
     except Exception as e:
         logger.error(f"Error in get_in_the_press: {str(e)}")
+        uncacheable(response)
         return []
 
 @api_router.get("/in-the-press/{press_id}")
-async def get_in_the_press_article(press_id: str):
+async def get_in_the_press_article(press_id: str, request: Request, response: Response):
     """Get a single In the Press article by ID from Airtable"""
     try:
-        press_articles = await fetch_airtable_in_the_press()
-        for press_article in press_articles:
-            if press_article.id == press_id:
-                return press_article
-        raise HTTPException(status_code=404, detail="In the Press article not found")
+        press_article = await content_cache.get_detail("in_the_press", press_id)
+        if press_article is None:
+            raise HTTPException(status_code=404, detail="In the Press article not found")
+        return record_response(request, response, "in_the_press", press_article)
     except HTTPException as he:
         raise he
     except Exception as e:
@@ -1227,36 +1892,49 @@ async def get_in_the_press_article(press_id: str):
         raise HTTPException(status_code=500, detail="Failed to fetch In the Press article")
 
 @api_router.get("/gc-members", response_model=List[AirtableGCMember])
-async def get_gc_members():
+async def get_gc_members(request: Request, response: Response):
     """Get GC Exchange members from Airtable"""
     try:
-        gc_members = await fetch_airtable_gc_members()
-        logger.info(f"Successfully fetched {len(gc_members)} GC members from Airtable")
-        return gc_members
+        snapshot = await content_cache.get("gc_members")
+        not_modified = revalidate(request, response, snapshot)
+        if not_modified:
+            return not_modified
+        return json_response(request, response, snapshot.body())
     except Exception as e:
         logger.error(f"Error in get_gc_members: {str(e)}")
+        uncacheable(response)
         return []
 
 @api_router.get("/events", response_model=List[AirtableEvent])
-async def get_upcoming_events():
+async def get_upcoming_events(request: Request, response: Response, cursor: Optional[str] = None,
+                              limit: Optional[int] = None, fields: Optional[str] = None):
     """Get upcoming events from Airtable"""
+    check_list_params("events", cursor, fields)
     try:
-        events = await fetch_airtable_events()
-        logger.info(f"Successfully fetched {len(events)} events from Airtable")
-        return events
+        snapshot = await content_cache.get("events")
+        not_modified = revalidate(request, response, snapshot)
+        if not_modified:
+            return not_modified
+        return list_response(request, response, snapshot, cursor, limit, fields)
     except Exception as e:
         logger.error(f"Error in get_upcoming_events: {str(e)}")
+        uncacheable(response)
         return []
 
 @api_router.get("/team", response_model=List[AirtableTeamMember])
-async def get_team_members():
+async def get_team_members(request: Request, response: Response, cursor: Optional[str] = None,
+                           limit: Optional[int] = None, fields: Optional[str] = None):
     """Get team members from Airtable"""
+    check_list_params("team", cursor, fields)
     try:
-        team_members = await fetch_airtable_team()
-        logger.info(f"Successfully fetched {len(team_members)} team members from Airtable")
-        return team_members
+        snapshot = await content_cache.get("team")
+        not_modified = revalidate(request, response, snapshot)
+        if not_modified:
+            return not_modified
+        return list_response(request, response, snapshot, cursor, limit, fields)
     except Exception as e:
         logger.error(f"Error in get_team_members: {str(e)}")
+        uncacheable(response)
         return []
 
 # Membership Application Models
@@ -1508,6 +2186,8 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination cursors and ETags travel in headers, which browsers hide from scripts unless exposed
+    expose_headers=["X-Next-Cursor", "Link", "ETag"],
 )
 
 # Configure logging
@@ -1517,6 +2197,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def start_airtable_client():
+    await airtable.start()
+
+@app.on_event("startup")
+async def warm_up_content_cache():
+    # Runs before uvicorn reports startup complete, bounded by WARM_UP_TIMEOUT
+    if WARM_UP_TIMEOUT > 0:
+        await content_cache.warm_up()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
+
+@app.on_event("shutdown")
+async def shutdown_airtable_client():
+    await airtable.close()
+
+@app.on_event("shutdown")
+async def shutdown_surrogate_purger():
+    await surrogate_purger.close()
@@ -0,0 +1,190 @@
+"""Precomputed "similar content" indexes over collection snapshots.
+
+Indexes are built once per snapshot (at refresh time) by ``CollectionCache``
+and answer per-request lookups from memory.
+"""
+import heapq
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+
+def item_keywords(item) -> list:
+    return item.keywords or []
+
+
+class KeywordIndex:
+    """Inverted keyword -> item postings for keyword-overlap similarity.
+
+    ``similar(id)`` scores only the items that share at least one keyword with
+    the target, by walking the target's postings lists, and takes the top k
+    with a heap. Results are memoized per indexed id for the life of the snapshot.
+    ``documents`` are read instead of ``items`` when given (see ``SearchIndex``).
+    """
+
+    def __init__(self, items: list, keywords: Callable[[object], list] = item_keywords,
+                 documents: Optional[list] = None):
+        self.items = items
+        self.keyword_sets: List[tuple] = []
+        self.postings: Dict[str, List[int]] = {}
+        self.positions: Dict[str, int] = {}
+        for position, item in enumerate(items if documents is None else documents):
+            unique = tuple(dict.fromkeys(keywords(item)))
+            self.keyword_sets.append(unique)
+            for keyword in unique:
+                self.postings.setdefault(keyword, []).append(position)
+            self.positions.setdefault(item.id, position)
+        self._memo: Dict[tuple, list] = {}
+
+    def similar(self, item_id: str, k: int = 3) -> list:
+        """Up to ``k`` items sharing the most keywords with ``item_id`` (ties keep collection order)"""
+        position = self.positions.get(item_id)
+        if position is None:
+            # Not memoized, so requests for unknown ids cannot grow the memo
+            return []
+        key = (position, k)
+        cached = self._memo.get(key)
+        if cached is None:
+            cached = self._memo[key] = self._similar(position, k)
+        return cached
+
+    def _similar(self, position: int, k: int) -> list:
+        # Counter.update walks each postings list in C
+        scores = Counter()
+        for keyword in self.keyword_sets[position]:
+            scores.update(self.postings[keyword])
+        del scores[position]
+        # Sorted positions make heap ties fall back to collection order
+        top = heapq.nlargest(k, sorted(scores), key=scores.__getitem__)
+        return [self.items[other] for other in top]
+
+
+def related_terms(topics=(), categories=(), speakers: str = "") -> List[str]:
+    """Normalized feature terms for ``RelatedContentIndex``.
+
+    Keywords and tags share one topic space; categories and speakers get their
+    own prefixes so a speaker named like a topic does not match it.
+    """
+    terms = [f"topic:{value.strip().lower()}" for value in topics if isinstance(value, str) and value.strip()]
+    terms.extend(f"category:{value.strip().lower()}" for value in categories if value and value.strip())
+    if speakers:
+        terms.extend(f"speaker:{name.strip().lower()}" for name in speakers.split(",") if name.strip())
+    return terms
+
+
+class RelatedContentIndex:
+    """TF-IDF similarity across several content types, with top-k neighbors precomputed per type.
+
+    Every item becomes an L2-normalized TF-IDF vector over its terms (binary
+    term frequency, smoothed IDF), so rare shared terms count for more than
+    ubiquitous ones and scores rarely tie. Cosine similarities are computed
+    block by block from the sparse term postings, and for each item the
+    ``top_k`` best neighbors of every type are kept. ``related()`` only merges
+    those precomputed lists.
+    """
+
+    def __init__(self, collections: Dict[str, list], terms: Dict[str, Callable[[object], List[str]]],
+                 top_k: int = 10, block_size: int = 512):
+        self.types = list(collections)
+        self.entries = [(content_type, item) for content_type in self.types for item in collections[content_type]]
+        self.positions: Dict[str, int] = {}
+        for position, (_, item) in enumerate(self.entries):
+            self.positions.setdefault(item.id, position)
+        self.top_k = top_k
+
+        vocabulary: Dict[str, int] = {}
+        rows, columns = [], []
+        for position, (content_type, item) in enumerate(self.entries):
+            for term in set(terms[content_type](item)):
+                rows.append(position)
+                columns.append(vocabulary.setdefault(term, len(vocabulary)))
+        self.vocabulary_size = len(vocabulary)
+
+        # Sparse item x term matrix: row-major (rows are already in item order) and column-major copies
+        count = len(self.entries)
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        document_frequency = np.bincount(columns, minlength=len(vocabulary))
+        idf = np.log((1 + count) / (1 + document_frequency)) + 1
+        weights = idf[columns]
+        weights /= np.sqrt(np.bincount(rows, weights=weights ** 2, minlength=count))[rows]
+        row_start = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=count))))
+        by_column = np.argsort(columns, kind="stable")
+        column_rows, column_weights = rows[by_column], weights[by_column]
+        column_start = np.concatenate(([0], np.cumsum(document_frequency)))
+
+        # type -> (positions, scores), each shaped (items, <= top_k), best first
+        ranges, offset = {}, 0
+        for content_type in self.types:
+            ranges[content_type] = (offset, offset + len(collections[content_type]))
+            offset += len(collections[content_type])
+        self.neighbors: Dict[str, tuple] = {
+            content_type: (np.zeros((count, min(top_k, stop - start)), dtype=np.int64),
+                           np.zeros((count, min(top_k, stop - start)), dtype=np.float32))
+            for content_type, (start, stop) in ranges.items()
+        }
+
+        tie_break = np.arange(count) * (1e-9 / max(count, 1))
+        for block_start in range(0, count, block_size):
+            block_stop = min(block_start + block_size, count)
+            similarity = self._cosine_block(block_start, block_stop, count, row_start, columns, weights,
+                                            column_start, column_rows, column_weights)
+            # Never recommend the item itself
+            similarity[np.arange(block_stop - block_start), np.arange(block_start, block_stop)] = -1
+            # A tiny per-position penalty makes equal scores distinct (so selection does not stall on the
+            # many zero ties) and ranks ties in collection order
+            ranked = similarity - tie_break
+            for content_type, (start, stop) in ranges.items():
+                width = stop - start
+                k = min(top_k, width)
+                if k == 0:
+                    continue
+                scores = ranked[:, start:stop]
+                if k < width:
+                    best = np.argpartition(scores, width - k, axis=1)[:, width - k:]
+                else:
+                    best = np.broadcast_to(np.arange(width), scores.shape)
+                order = np.argsort(-np.take_along_axis(scores, best, axis=1), axis=1)
+                best = start + np.take_along_axis(best, order, axis=1)
+                positions, neighbor_scores = self.neighbors[content_type]
+                positions[block_start:block_stop] = best
+                neighbor_scores[block_start:block_stop] = np.take_along_axis(similarity, best, axis=1)
+
+    @staticmethod
+    def _cosine_block(block_start, block_stop, count, row_start, columns, weights,
+                      column_start, column_rows, column_weights) -> np.ndarray:
+        """Dense (block x count) cosine similarities, accumulated from the block's terms' postings.
+
+        Each nonzero (row, term, weight) of the block is paired with every
+        item that has the term; the products are summed per (row, item) with
+        one ``bincount``. Work is proportional to shared terms, not to the
+        vocabulary size a dense matrix product would pay for.
+        """
+        first, last = row_start[block_start], row_start[block_stop]
+        block_terms = columns[first:last]
+        lengths = column_start[block_terms + 1] - column_start[block_terms]
+        total = int(lengths.sum())
+        # Index of every (block nonzero, posting) pair into the column-major arrays
+        pair_offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        postings = np.repeat(column_start[block_terms], lengths) + pair_offsets
+        block_rows = np.repeat(np.repeat(np.arange(block_stop - block_start),
+                                         np.diff(row_start[block_start:block_stop + 1])), lengths)
+        products = np.repeat(weights[first:last], lengths) * column_weights[postings]
+        similarity = np.bincount(block_rows * count + column_rows[postings], weights=products,
+                                 minlength=(block_stop - block_start) * count)
+        return similarity.reshape(block_stop - block_start, count)
+
+    def related(self, item_id: str, types: Optional[List[str]] = None, limit: int = 6) -> list:
+        """Up to ``limit`` (type, item, score) neighbors of ``item_id``, best first"""
+        position = self.positions.get(item_id)
+        if position is None:
+            return []
+        candidates = []
+        for content_type in types or self.types:
+            positions, scores = self.neighbors[content_type]
+            for other, score in zip(positions[position].tolist(), scores[position].tolist()):
+                if score > 0:
+                    candidates.append((score, other))
+        candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+        return [(*self.entries[other], round(score, 4)) for score, other in candidates[:limit]]
@@ -0,0 +1,98 @@
+"""Typeahead suggestions over titles and names.
+
+``SuggestIndex`` keeps a sorted array of normalized keys, one per word start
+in every suggestion's text, so "gov" finds "Corporate Governance Summit".
+A prefix maps to one contiguous range of that array via ``bisect``. The best
+suggestions in the range come from a sparse-table range-maximum structure
+over the suggestion weights. A lookup costs O(log n + k log k) however many
+keys share the prefix.
+"""
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Iterable, List, NamedTuple, Optional
+
+NON_WORD = re.compile(r"[^\w]+")
+
+
+class Suggestion(NamedTuple):
+    text: str
+    type: str
+    id: Optional[str]
+    weight: float
+
+
+def normalize(text: str) -> str:
+    """Case- and accent-insensitive form with punctuation folded to single spaces"""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return NON_WORD.sub(" ", stripped).strip()
+
+
+class SuggestIndex:
+    """Sorted word-start keys with a range-maximum table over suggestion weights"""
+
+    def __init__(self, suggestions: Iterable[Suggestion]):
+        self.suggestions: List[Suggestion] = []
+        seen = set()
+        keyed = []
+        for suggestion in suggestions:
+            normalized = normalize(suggestion.text or "")
+            if not normalized or (suggestion.type, normalized, suggestion.id) in seen:
+                continue
+            seen.add((suggestion.type, normalized, suggestion.id))
+            owner = len(self.suggestions)
+            self.suggestions.append(suggestion)
+            keyed.append((normalized, owner))
+            keyed.extend((normalized[match.start() + 1:], owner) for match in re.finditer(" ", normalized))
+        keyed.sort()
+        self.keys = [key for key, _ in keyed]
+        self.owners = [owner for _, owner in keyed]
+        self._weights = [self.suggestions[owner].weight for owner in self.owners]
+        self._table = self._build_table(self._weights)
+
+    @staticmethod
+    def _build_table(weights: List[float]) -> List[List[int]]:
+        # _table[j][i] is the index of the largest weight in [i, i + 2**j), leftmost on ties
+        table = [list(range(len(weights)))]
+        span = 1
+        while span * 2 <= len(weights):
+            previous = table[-1]
+            row = []
+            for start in range(len(weights) - span * 2 + 1):
+                left, right = previous[start], previous[start + span]
+                row.append(left if weights[left] >= weights[right] else right)
+            table.append(row)
+            span *= 2
+        return table
+
+    def _argmax(self, start: int, stop: int) -> int:
+        level = (stop - start).bit_length() - 1
+        left, right = self._table[level][start], self._table[level][stop - (1 << level)]
+        return left if self._weights[left] >= self._weights[right] else right
+
+    def suggest(self, prefix: str, limit: int = 8) -> List[Suggestion]:
+        """Up to ``limit`` distinct suggestions with a word starting with ``prefix``, heaviest first"""
+        normalized = normalize(prefix)
+        if not normalized or limit < 1:
+            return []
+        start = bisect_left(self.keys, normalized)
+        # Every key with the prefix sorts before prefix + the highest code point
+        stop = bisect_left(self.keys, normalized + "\U0010ffff", start)
+        results, seen = [], set()
+        ranges = []
+        if start < stop:
+            best = self._argmax(start, stop)
+            ranges.append((-self._weights[best], best, start, stop))
+        while ranges and len(results) < limit:
+            _, best, range_start, range_stop = heapq.heappop(ranges)
+            owner = self.owners[best]
+            if owner not in seen:
+                seen.add(owner)
+                results.append(self.suggestions[owner])
+            for sub_start, sub_stop in ((range_start, best), (best + 1, range_stop)):
+                if sub_start < sub_stop:
+                    sub_best = self._argmax(sub_start, sub_stop)
+                    heapq.heappush(ranges, (-self._weights[sub_best], sub_best, sub_start, sub_stop))
+        return results
@@ -0,0 +1,44 @@
+import asyncio
+import logging
+import os
+import sys
+
+import httpx
+import pytest
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend")
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "benchmarks"))
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    """The app wired to an in-process fake Airtable, with an empty content cache and no MongoDB mirror"""
+    import server
+    from airtable_client import AirtableClient, SchemaResolver
+    from synthetic import FakeAirtable
+
+    logging.disable(logging.INFO)
+    fake = FakeAirtable(latency=0.0)
+    client = AirtableClient(token="test", transport=fake.transport(), http2=False, rate_per_base=1e6, burst=10 ** 6)
+    monkeypatch.setattr(server, "AIRTABLE_ACCESS_TOKEN", "test")
+    monkeypatch.setattr(server, "airtable", client)
+    monkeypatch.setattr(server, "airtable_schemas", SchemaResolver(client))
+    monkeypatch.setattr(server.content_cache, "mirror", None)
+    server.content_cache.invalidate()
+    yield server, fake
+    server.content_cache.invalidate()
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture
+def call_api(backend):
+    """Run ``scenario(api)`` against the app, where ``api`` is an httpx client for it"""
+    server, _ = backend
+
+    def run(scenario):
+        async def main():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app), base_url="http://test") as api:
+                return await scenario(api)
+        return asyncio.run(main())
+    return run
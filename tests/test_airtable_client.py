@@ -0,0 +1,178 @@
+import asyncio
+
+import httpx
+
+import airtable_client
+from airtable_client import (AirtableClient, PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, SchemaResolver, TokenBucket,
+                             retry_delay)
+
+
+def test_token_bucket_serves_interactive_waiters_before_background():
+    async def scenario():
+        bucket = TokenBucket(rate=50, burst=1)
+        await bucket.acquire()  # drain the only token so everyone else queues
+        order = []
+
+        async def request(name, priority):
+            await bucket.acquire(priority)
+            order.append(name)
+
+        tasks = [asyncio.create_task(request("background-1", PRIORITY_BACKGROUND)),
+                 asyncio.create_task(request("background-2", PRIORITY_BACKGROUND))]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(request("interactive", PRIORITY_INTERACTIVE)))
+        await asyncio.gather(*tasks)
+        return order, bucket
+
+    order, bucket = asyncio.run(scenario())
+    assert order == ["interactive", "background-1", "background-2"]
+    assert bucket.stats["queued"] == 3
+
+
+def test_token_bucket_pause_holds_requests():
+    async def scenario():
+        bucket = TokenBucket(rate=1000, burst=5)
+        bucket.pause(0.05)
+        return await bucket.acquire()
+
+    assert asyncio.run(scenario()) >= 0.04
+
+
+def test_retry_delay_honours_retry_after():
+    response = httpx.Response(429, headers={"Retry-After": "2"})
+    assert 2 <= retry_delay(response, 0) <= 2 + airtable_client.AIRTABLE_BACKOFF_BASE
+
+
+def test_retry_delay_waits_out_rate_limit_penalty_without_retry_after():
+    delay = retry_delay(httpx.Response(429), 0)
+    assert delay >= airtable_client.AIRTABLE_RATE_LIMIT_PENALTY
+
+
+def test_retry_delay_backs_off_exponentially_for_503():
+    assert retry_delay(httpx.Response(503), 0) <= airtable_client.AIRTABLE_BACKOFF_BASE
+    assert retry_delay(httpx.Response(503), 3) >= airtable_client.AIRTABLE_BACKOFF_BASE * 2 ** 3 / 2
+
+
+def rate_limited_client(statuses):
+    """A client whose Airtable answers with ``statuses`` in turn (then 200), and the list of requests made"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        status = statuses[len(requests) - 1] if len(requests) <= len(statuses) else 200
+        return httpx.Response(status, json={"records": []})
+
+    client = AirtableClient(token="test", transport=httpx.MockTransport(handler), http2=False,
+                            rate_per_base=1e6, burst=10 ** 6)
+    return client, requests
+
+
+def test_interactive_reads_fail_fast_on_a_429_penalty():
+    client, requests = rate_limited_client([429])
+
+    async def scenario():
+        started = asyncio.get_running_loop().time()
+        first = await client.get("app", "tbl")
+        second = await client.get("app", "tbl")  # the base is now paused for the penalty window
+        return first, second, asyncio.get_running_loop().time() - started
+
+    first, second, elapsed = asyncio.run(scenario())
+    assert first.status_code == 429 and second.status_code == 429 and elapsed < 1
+    assert len(requests) == 1
+    assert client.stats()["bases"]["app"]["shed"] == 1
+    assert client.stats()["bases"]["app"]["paused_for"] > airtable_client.AIRTABLE_INTERACTIVE_MAX_WAIT
+
+
+def test_interactive_reads_retry_within_their_budget(monkeypatch):
+    monkeypatch.setattr(airtable_client, "AIRTABLE_BACKOFF_BASE", 0.01)
+    client, requests = rate_limited_client([503, 503, 503])
+    response = asyncio.run(client.get("app", "tbl"))
+    assert response.status_code == 503
+    assert len(requests) == 1 + airtable_client.AIRTABLE_INTERACTIVE_MAX_RETRIES
+
+
+def test_background_reads_keep_retrying(monkeypatch):
+    monkeypatch.setattr(airtable_client, "AIRTABLE_RATE_LIMIT_PENALTY", 0.01)
+    monkeypatch.setattr(airtable_client, "AIRTABLE_BACKOFF_BASE", 0.01)
+    client, requests = rate_limited_client([429, 429, 503])
+
+    async def scenario():
+        airtable_client.request_priority.set(PRIORITY_BACKGROUND)
+        return await client.get("app", "tbl")
+
+    assert asyncio.run(scenario()).status_code == 200
+    assert len(requests) == 4
+
+
+class SchemaTransport:
+    """Airtable without metadata access whose view may be unreadable; counts record requests"""
+
+    def __init__(self, view_status=200, rows=None):
+        self.view_status = view_status
+        self.rows = [{"Whole Name": "Ada Lovelace", "Company": "Analytical"}] if rows is None else rows
+        self.requests = []
+
+    def handler(self, request):
+        if "/meta/" in request.url.path:
+            return httpx.Response(403, json={"error": "INVALID_PERMISSIONS"})
+        self.requests.append(dict(request.url.params))
+        if "view" in request.url.params and self.view_status != 200:
+            return httpx.Response(self.view_status, json={"error": "VIEW_NAME_NOT_FOUND"})
+        return httpx.Response(200, json={"records": [{"id": f"rec{i:014d}", "fields": fields}
+                                                     for i, fields in enumerate(self.rows)]})
+
+    def resolver(self):
+        client = AirtableClient(token="test", transport=httpx.MockTransport(self.handler), http2=False,
+                                rate_per_base=1e6, burst=10 ** 6)
+        return SchemaResolver(client)
+
+
+ALIASES = {"whole_name": ["WholeName", "Whole Name"], "company": ["Company"], "position": ["Position"]}
+
+
+def test_schema_resolver_samples_the_table_when_the_view_is_unreadable():
+    transport = SchemaTransport(view_status=422)
+    resolver = transport.resolver()
+    columns = asyncio.run(resolver.resolve("app", "tbl", ALIASES, view="viw", required=("whole_name",)))
+    assert columns == {"whole_name": ["Whole Name"], "company": ["Company"], "position": []}
+    assert ["view" in params for params in transport.requests] == [True, False]
+
+
+def test_schema_resolver_caches_a_sample_that_resolves_required_attributes():
+    transport = SchemaTransport()
+    resolver = transport.resolver()
+
+    async def scenario():
+        for _ in range(2):
+            await resolver.resolve("app", "tbl", ALIASES, view="viw", required=("whole_name",))
+
+    asyncio.run(scenario())
+    assert len(transport.requests) == 1
+
+
+def test_schema_resolver_samples_again_after_an_empty_or_sparse_sample():
+    for rows in [[], [{"Company": "Analytical"}]]:
+        transport = SchemaTransport(rows=rows)
+        resolver = transport.resolver()
+
+        async def scenario():
+            first = await resolver.resolve("app", "tbl", ALIASES, view="viw", required=("whole_name",))
+            transport.rows = [{"WholeName": "Ada Lovelace"}]
+            second = await resolver.resolve("app", "tbl", ALIASES, view="viw", required=("whole_name",))
+            return first, second
+
+        first, second = asyncio.run(scenario())
+        assert first["whole_name"] == [] and second["whole_name"] == ["WholeName"], rows
+        assert len(transport.requests) == 2
+
+
+def test_gc_members_fall_back_to_the_table_when_the_view_is_unreadable(monkeypatch):
+    import server
+
+    transport = SchemaTransport(view_status=422, rows=[{"Whole Name": "Ada Lovelace", "Company": "Analytical"},
+                                                       {"Whole Name": "Not A Member"}])
+    resolver = transport.resolver()
+    monkeypatch.setattr(server, "airtable", resolver.client)
+    monkeypatch.setattr(server, "airtable_schemas", resolver)
+    members = asyncio.run(server.fetch_airtable_gc_members())
+    assert [member.whole_name for member in members] == ["Ada Lovelace"]
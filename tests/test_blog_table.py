@@ -0,0 +1,79 @@
+import server
+
+
+def test_listings_leave_out_bodies_and_detail_routes_fetch_them(call_api):
+    async def scenario(api):
+        listings = {route: (await api.get(f"/api/{route}")).json() for route in ("articles", "newsroom", "in-the-press")}
+        details = {
+            "article": (await api.get(f"/api/article/{listings['articles'][3]['id']}")).json(),
+            "newsroom": (await api.get(f"/api/newsroom/{listings['newsroom'][3]['id']}")).json(),
+            "in-the-press": (await api.get(f"/api/in-the-press/{listings['in-the-press'][3]['id']}")).json(),
+        }
+        return listings, details
+
+    listings, details = call_api(scenario)
+    assert listings["articles"] and not any(article["body_of_blog"] or article["body_qa"] for article in listings["articles"])
+    assert not any(article["body_of_blog"] for article in listings["newsroom"])
+    assert not any(press["body_of_article"] for press in listings["in-the-press"])
+    assert details["article"]["id"] == listings["articles"][3]["id"] and details["article"]["body_of_blog"]
+    assert details["newsroom"]["body_of_blog"]
+    assert details["in-the-press"]["body_of_article"]
+
+
+def test_detail_bodies_are_fetched_once_per_snapshot(backend, call_api):
+    _, fake = backend
+
+    async def scenario(api):
+        article_id = (await api.get("/api/articles")).json()[0]["id"]
+        first = await api.get(f"/api/article/{article_id}")
+        before = fake.requests
+        second = await api.get(f"/api/article/{article_id}")
+        revalidated = await api.get(f"/api/article/{article_id}", headers={"If-None-Match": first.headers["etag"]})
+        return first, second, revalidated, fake.requests - before
+
+    first, second, revalidated, upstream = call_api(scenario)
+    assert upstream == 0
+    assert first.content == second.content and first.headers["etag"] == second.headers["etag"]
+    assert revalidated.status_code == 304
+
+
+def test_listing_projection_excludes_body_fields():
+    assert set(server.BLOG_TABLE_BODY_FIELDS) <= set(server.BLOG_TABLE_FIELDS)
+    assert not set(server.BLOG_TABLE_BODY_FIELDS) & set(server.BLOG_TABLE_LISTING_FIELDS)
+
+
+def test_records_found_by_id_join_the_listing_without_bodies(backend, call_api, monkeypatch):
+    server_module, fake = backend
+    fake.records_per_table = 120  # more than the listing cap
+    purged = []
+    monkeypatch.setattr(server_module.surrogate_purger, "purge", purged.extend)
+
+    async def scenario(api):
+        listing = (await api.get("/api/articles")).json()
+        cache = server_module.content_cache
+        indexes = cache.current("articles").indexes
+        beyond = f"rec{len(listing) + 5:014d}"
+        detail = (await api.get(f"/api/article/{beyond}")).json()
+        return listing, beyond, detail, (await api.get("/api/articles")).json(), indexes, cache.current("articles")
+
+    listing, beyond, detail, after, indexes, snapshot = call_api(scenario)
+    assert detail["id"] == beyond and detail["body_of_blog"]
+    assert [article["id"] for article in after] == [article["id"] for article in listing] + [beyond]
+    assert not any(article["body_of_blog"] or article["body_qa"] for article in after)
+    assert snapshot.indexes is indexes
+    assert purged == [beyond]
+
+
+def test_search_finds_blog_table_bodies_the_listings_leave_out(backend, call_api):
+    server_module, _ = backend
+
+    async def scenario(api):
+        results = {content_type: (await api.get("/api/search", params={"q": "executives", "type": content_type})).json()
+                   for content_type in ("article", "newsroom", "press")}
+        return results, {name: server_module.content_cache.current(name).items
+                         for name in ("articles", "newsroom", "in_the_press")}
+
+    results, items = call_api(scenario)
+    assert all(results.values()), results
+    assert not any(getattr(item, "body_of_blog", "") or getattr(item, "body_qa", "") or
+                   getattr(item, "body_of_article", "") for collection in items.values() for item in collection)
@@ -0,0 +1,46 @@
+import pytest
+from fastapi import HTTPException
+
+import server
+from server import parse_bundle_include
+
+
+def test_parse_bundle_include_accepts_hyphenated_route_names():
+    assert parse_bundle_include(" newsroom:6, in-the-press:2 ,events:4,") == [
+        ("newsroom", 6), ("in_the_press", 2), ("events", 4)]
+
+
+@pytest.mark.parametrize("value", [
+    "", " , ", "nope:3", "events", "events:", "events:0", "events:-1", "events:two",
+    f"events:{server.LIST_MAX_LIMIT + 1}", "events:2,events:3", "in_the_press:1,in-the-press:1",
+])
+def test_parse_bundle_include_rejects_bad_lists(value):
+    with pytest.raises(HTTPException) as raised:
+        parse_bundle_include(value)
+    assert raised.value.status_code == 400
+
+
+def test_bundle_returns_the_head_of_each_collection_in_order(call_api):
+    async def scenario(api):
+        bundle = await api.get("/api/bundle", params={"include": "videos:3,events:2"})
+        videos = await api.get("/api/videos")
+        events = await api.get("/api/events")
+        bad = await api.get("/api/bundle", params={"include": "videos:3,nope:1"})
+        return bundle, videos.json(), events.json(), bad
+
+    bundle, videos, events, bad = call_api(scenario)
+    assert bundle.status_code == 200
+    assert list(bundle.json()) == ["videos", "events"]
+    assert bundle.json() == {"videos": videos[:3], "events": events[:2]}
+    assert bad.status_code == 400
+
+
+def test_bundle_answers_if_none_match_with_304(call_api):
+    async def scenario(api):
+        first = await api.get("/api/bundle", params={"include": "videos:3,events:2"})
+        again = await api.get("/api/bundle", params={"include": "videos:3,events:2"},
+                              headers={"If-None-Match": first.headers["etag"]})
+        return first, again
+
+    first, again = call_api(scenario)
+    assert again.status_code == 304 and again.headers["etag"] == first.headers["etag"]
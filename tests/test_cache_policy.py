@@ -0,0 +1,41 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from cache_policy import DEFAULT_POLICY, CachePolicy, SurrogatePurger, strictest
+
+
+def test_policy_parses_directives_and_defaults_the_rest():
+    policy = CachePolicy.parse("max-age=30, s-maxage=120")
+    assert policy == DEFAULT_POLICY._replace(max_age=30, s_maxage=120)
+    assert policy.header().startswith("public, max-age=30, s-maxage=120")
+    with pytest.raises(ValueError):
+        CachePolicy.parse("private")
+
+
+def test_strictest_takes_the_shortest_lifetimes():
+    assert strictest([CachePolicy(60, 600, 10, 100), CachePolicy(30, 900, 20, 50)]) == CachePolicy(30, 600, 10, 50)
+
+
+def test_purger_batches_keys_over_one_pooled_client():
+    posted = []
+
+    def handler(request):
+        posted.append((request.headers["authorization"], json.loads(request.content)["surrogate_keys"]))
+        return httpx.Response(200)
+
+    async def scenario():
+        purger = SurrogatePurger("https://purge.example/keys", "secret", transport=httpx.MockTransport(handler))
+        purger.purge([f"rec{i}" for i in range(300)])
+        purger.purge(["videos"])
+        await asyncio.sleep(0.05)
+        client = purger._client
+        await purger.close()
+        return purger, client
+
+    purger, client = asyncio.run(scenario())
+    assert [len(keys) for _, keys in posted] == [256, 44, 1]
+    assert {authorization for authorization, _ in posted} == {"Bearer secret"}
+    assert purger.stats()["sent"] == 2 and client.is_closed
@@ -0,0 +1,151 @@
+import asyncio
+
+import server
+from server import CollectionCache
+
+
+def make_cache(loaders, **options):
+    return CollectionCache(loaders, ttl=60, **options)
+
+
+def test_invalidate_drops_combined_indexes_built_on_the_collection():
+    generation = {"n": 0}
+
+    async def load_videos():
+        generation["n"] += 1
+        return [server.AirtableVideo(id=f"rec{generation['n']}", video_description="d")]
+
+    cache = make_cache({"videos": load_videos},
+                       combined_indexes={"ids": (["videos"], lambda items: [item.id for item in items["videos"]])})
+
+    async def scenario():
+        first = await cache.get_combined("ids")
+        cache.invalidate("videos")
+        second = await cache.get_combined("ids")
+        cache.invalidate()
+        third = await cache.get_combined("ids")
+        return first, second, third
+
+    assert asyncio.run(scenario()) == (["rec1"], ["rec2"], ["rec3"])
+
+
+def test_detail_misses_are_remembered_for_miss_ttl():
+    lookups = []
+
+    async def load_videos():
+        return [server.AirtableVideo(id="rec1", video_description="held")]
+
+    async def load_video(record_id):
+        lookups.append(record_id)
+        if record_id == "recNew":
+            return server.AirtableVideo(id="recNew", video_description="fetched")
+        return None
+
+    cache = make_cache({"videos": load_videos}, record_loaders={"videos": load_video}, miss_ttl=0.05)
+
+    async def scenario():
+        held = await cache.get_item("videos", "rec1")
+        first_miss = await cache.get_item("videos", "recGone")
+        cached_miss = await cache.get_item("videos", "recGone")
+        await asyncio.sleep(0.06)
+        expired_miss = await cache.get_item("videos", "recGone")
+        fetched = await cache.get_item("videos", "recNew")
+        again = await cache.get_item("videos", "recNew")
+        return held, first_miss, cached_miss, expired_miss, fetched, again
+
+    held, first_miss, cached_miss, expired_miss, fetched, again = asyncio.run(scenario())
+    assert held.video_description == "held"
+    assert first_miss is cached_miss is expired_miss is None
+    assert lookups == ["recGone", "recGone", "recNew"]
+    assert fetched.video_description == "fetched" and again is fetched
+    assert cache.stats()["videos"]["record_misses_cached"] == 1
+
+
+def test_stale_snapshots_are_served_while_one_background_refresh_runs():
+    generation = {"n": 0}
+    release = asyncio.Event()
+
+    async def load_videos():
+        generation["n"] += 1
+        if generation["n"] > 1:
+            await release.wait()
+        return [server.AirtableVideo(id="rec1", video_description=f"v{generation['n']}")]
+
+    cache = CollectionCache({"videos": load_videos}, ttl=0.05)
+
+    async def scenario():
+        cold = await cache.get("videos")
+        fresh = await cache.get("videos")
+        await asyncio.sleep(0.06)
+        stale = [await cache.get("videos") for _ in range(3)]
+        refreshing = cache.stats()["videos"]["refreshing"]
+        release.set()
+        while cache.stats()["videos"]["refreshing"]:
+            await asyncio.sleep(0)
+        refreshed = await cache.get("videos")
+        return cold, fresh, stale, refreshing, refreshed
+
+    cold, fresh, stale, refreshing, refreshed = asyncio.run(scenario())
+    assert fresh is cold and all(snapshot is cold for snapshot in stale)
+    assert refreshing and generation["n"] == 2
+    assert refreshed.version == 2 and refreshed.items[0].video_description == "v2"
+    stats = cache.stats()["videos"]
+    assert (stats["misses"], stats["hits"], stats["stale_hits"], stats["refreshes"]) == (1, 2, 3, 2)
+
+
+def test_failed_background_refresh_keeps_serving_the_stale_snapshot():
+    generation = {"n": 0}
+
+    async def load_videos():
+        generation["n"] += 1
+        if generation["n"] > 1:
+            raise RuntimeError("Airtable is down")
+        return [server.AirtableVideo(id="rec1", video_description="held")]
+
+    cache = CollectionCache({"videos": load_videos}, ttl=0)
+
+    async def scenario():
+        first = await cache.get("videos")
+        stale = await cache.get("videos")
+        while cache.stats()["videos"]["refreshing"]:
+            await asyncio.sleep(0)
+        return first, stale, cache.stats()["videos"], await cache.get("videos")
+
+    first, stale, stats, after_error = asyncio.run(scenario())
+    assert stale is first and after_error is first
+    assert stats["refresh_errors"] == 1 and stats["refreshes"] == 1 and stats["version"] == 1
+
+
+def test_warm_up_returns_after_its_budget_and_slow_collections_land_later():
+    calls = []
+    release = asyncio.Event()
+
+    async def load_videos():
+        calls.append("videos")
+        return [server.AirtableVideo(id="rec1", video_description="d")]
+
+    async def load_podcasts():
+        calls.append("podcasts")
+        await release.wait()
+        return [server.AirtablePodcast(id="rec2", title="t")]
+
+    async def load_blog():
+        calls.append("blog")
+        return {"articles": [], "newsroom": []}
+
+    cache = CollectionCache({"videos": load_videos, "podcasts": load_podcasts, "articles": None, "newsroom": None},
+                            ttl=60, groups={"blog": (load_blog, ["articles", "newsroom"])})
+
+    async def scenario():
+        await cache.warm_up(timeout=0.05)
+        during = dict(cache.warm_up_report), cache.current("podcasts")
+        release.set()
+        while cache._warming:
+            await asyncio.sleep(0)
+        return during
+
+    (report, podcasts_during) = asyncio.run(scenario())
+    assert podcasts_during is None and "podcasts" not in report
+    assert report["videos"]["items"] == 1 and report["articles"]["items"] == 0 and "newsroom" in report
+    assert sorted(calls) == ["blog", "podcasts", "videos"]
+    assert cache.warm_up_report["podcasts"]["items"] == 1 and cache.current("podcasts") is not None
@@ -0,0 +1,121 @@
+from datetime import datetime
+
+import server
+from conditional import combine_hashes, http_date, is_fresh, matched_etag
+
+
+def test_is_fresh_compares_if_none_match_weakly():
+    etag = '"abc"'
+    assert is_fresh({"if-none-match": '"abc"'}, etag, None)
+    assert is_fresh({"if-none-match": 'W/"abc", "other"'}, etag, None)
+    assert is_fresh({"if-none-match": "*"}, etag, None)
+    assert not is_fresh({"if-none-match": '"other"'}, etag, None)
+
+
+def test_matched_etag_keeps_the_variant_the_client_holds():
+    assert matched_etag({"if-none-match": '"other", W/"abc-br"'}, '"abc"') == '"abc-br"'
+    assert matched_etag({"if-none-match": '"abc"'}, '"abc"') == '"abc"'
+    assert matched_etag({"if-none-match": "*"}, '"abc"') is None
+    assert matched_etag({}, '"abc"') is None
+
+
+def test_if_modified_since_is_only_used_without_if_none_match():
+    modified = datetime(2026, 1, 2, 3, 4, 5)
+    assert is_fresh({"if-modified-since": http_date(modified)}, '"abc"', modified)
+    assert not is_fresh({"if-modified-since": http_date(datetime(2026, 1, 1))}, '"abc"', modified)
+    assert not is_fresh({"if-none-match": '"other"', "if-modified-since": http_date(modified)}, '"abc"', modified)
+    assert not is_fresh({"if-modified-since": "garbage"}, '"abc"', modified)
+
+
+def test_combine_hashes_depends_on_order():
+    assert combine_hashes(["a", "b"]) != combine_hashes(["b", "a"])
+
+
+def test_list_and_detail_routes_answer_if_none_match_with_304(call_api):
+    async def scenario(api):
+        results = []
+        for path in ["/api/events", "/api/video/rec00000000000003", "/api/search?q=video", "/api/suggest?prefix=vi",
+                     "/api/related/rec00000000000001"]:
+            first = await api.get(path, headers={"Accept-Encoding": "identity"})
+            again = await api.get(path, headers={"If-None-Match": first.headers["etag"]})
+            other = await api.get(path, headers={"If-None-Match": '"stale"'})
+            results.append((path, first, again, other))
+        return results
+
+    for path, first, again, other in call_api(scenario):
+        assert first.status_code == 200 and first.headers["etag"].startswith('"'), path
+        assert again.status_code == 304 and again.content == b"", path
+        assert other.status_code == 200, path
+
+
+def test_etag_changes_with_content(backend, call_api):
+    server_module, _ = backend
+
+    async def scenario(api):
+        before = await api.get("/api/videos")
+        cache = server_module.content_cache
+        items = [item.view() for item in cache.current("videos").items]
+        items[0] = items[0].model_copy(update={"vimeo_name": "Renamed"})
+        cache._install("videos", items)
+        after = await api.get("/api/videos", headers={"If-None-Match": before.headers["etag"]})
+        return before, after
+
+    before, after = call_api(scenario)
+    assert after.status_code == 200 and after.headers["etag"] != before.headers["etag"]
+
+
+def test_fallback_bodies_are_not_cached_under_the_content_validators(backend, call_api, monkeypatch):
+    server_module, _ = backend
+
+    def broken_search(*args, **kwargs):
+        raise RuntimeError("index corrupted")
+
+    monkeypatch.setattr(server_module, "search", broken_search)
+
+    async def scenario(api):
+        return await api.get("/api/search", params={"q": "video"})
+
+    response = call_api(scenario)
+    assert response.json() == []
+    assert "etag" not in response.headers and "last-modified" not in response.headers
+    assert "surrogate-key" not in response.headers
+    assert response.headers["cache-control"] == "no-store"
+
+
+def test_304_carries_the_etag_of_the_compressed_variant(call_api):
+    async def scenario(api):
+        results = {}
+        for coding in ["br", "gzip"]:
+            first = await api.get("/api/events", headers={"Accept-Encoding": coding})
+            again = await api.get("/api/events", headers={"Accept-Encoding": coding,
+                                                          "If-None-Match": first.headers["etag"]})
+            since = await api.get("/api/events", headers={"Accept-Encoding": coding,
+                                                          "If-Modified-Since": first.headers["last-modified"]})
+            results[coding] = first, again, since
+        return results
+
+    for coding, (first, again, since) in call_api(scenario).items():
+        assert first.headers["content-encoding"] == coding
+        assert first.headers["etag"].endswith(f'-{coding}"')
+        assert again.status_code == 304 and again.headers["etag"] == first.headers["etag"]
+        assert since.status_code == 304 and since.headers["etag"] == first.headers["etag"]
+
+
+def test_304_by_date_carries_the_etag_of_the_body_that_would_be_sent(call_api):
+    async def scenario(api):
+        results = []
+        # Plain-list routes and bodies under COMPRESS_MIN_SIZE are never content-coded
+        for path in ["/api/suggest?prefix=zzzz", "/api/search?q=video", "/api/events?limit=1", "/api/events"]:
+            headers = {"Accept-Encoding": "br"}
+            first = await api.get(path, headers=headers)
+            since = await api.get(path, headers={**headers, "If-Modified-Since": first.headers["last-modified"]})
+            star = await api.get(path, headers={**headers, "If-None-Match": "*"})
+            results.append((path, first, since, star))
+        return results
+
+    results = call_api(scenario)
+    for path, first, since, star in results:
+        assert since.status_code == 304 and since.headers["etag"] == first.headers["etag"], path
+        assert star.status_code == 304 and star.headers["etag"] == first.headers["etag"], path
+        assert since.content == b"", path
+    assert [first.headers["etag"].endswith('-br"') for _, first, _, _ in results] == [False, False, False, True]
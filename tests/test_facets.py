@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+import pytest
+
+from facets import FacetIndex
+
+ITEMS = [
+    SimpleNamespace(id="v1", category="Panel", tags=["Risk", "Legal"]),
+    SimpleNamespace(id="v2", category="Keynote", tags=["Risk"]),
+    SimpleNamespace(id="v3", category="Panel", tags=["Culture", " "]),
+    SimpleNamespace(id="v4", category=None, tags=["Legal", "Legal"]),
+]
+FACETS = {"category": lambda item: [item.category], "tags": lambda item: item.tags}
+
+
+def counts_of(entries):
+    return [(entry["value"], entry["count"]) for entry in entries]
+
+
+def test_unfiltered_counts_cover_every_value_largest_first():
+    items, counts = FacetIndex(ITEMS, FACETS).select({})
+    assert [item.id for item in items] == ["v1", "v2", "v3", "v4"]
+    assert counts_of(counts["category"]) == [("Panel", 2), ("Keynote", 1)]
+    assert counts_of(counts["tags"]) == [("Legal", 2), ("Risk", 2), ("Culture", 1)]
+
+
+def test_values_of_one_facet_are_ored_and_facets_are_anded():
+    index = FacetIndex(ITEMS, FACETS)
+    items, _ = index.select({"tags": ["Culture", "Legal"]})
+    assert [item.id for item in items] == ["v1", "v3", "v4"]
+    items, _ = index.select({"tags": ["Culture", "Legal"], "category": ["Panel"]})
+    assert [item.id for item in items] == ["v1", "v3"]
+
+
+def test_each_facet_is_counted_without_its_own_filter():
+    _, counts = FacetIndex(ITEMS, FACETS).select({"category": ["Panel"], "tags": ["Risk"]})
+    assert counts_of(counts["category"]) == [("Keynote", 1), ("Panel", 1)]
+    assert counts_of(counts["tags"]) == [("Culture", 1), ("Legal", 1), ("Risk", 1)]
+
+
+def test_selected_values_without_matches_are_counted_as_zero():
+    items, counts = FacetIndex(ITEMS, FACETS).select({"category": ["Fireside Chat"]})
+    assert items == []
+    assert ("Fireside Chat", 0) in counts_of(counts["category"])
+    assert counts_of(counts["tags"]) == []
+
+
+def test_unknown_facets_are_rejected():
+    with pytest.raises(KeyError):
+        FacetIndex(ITEMS, FACETS).select({"speaker": ["Someone"]})
+
+
+def test_videos_route_filters_and_counts(call_api):
+    async def scenario(api):
+        everything = (await api.get("/api/videos", params={"facets": "true"})).json()
+        category = everything["facets"]["category"][0]["value"]
+        filtered = (await api.get("/api/videos", params={"category": category, "facets": "true"})).json()
+        return everything, category, filtered
+
+    everything, category, filtered = call_api(scenario)
+    expected = sum(1 for video in everything["items"] if video["category"] == category)
+    assert len(filtered["items"]) == expected == everything["facets"]["category"][0]["count"]
+    assert all(video["category"] == category for video in filtered["items"])
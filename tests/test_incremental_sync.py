@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from server import IncrementalSync
+
+
+def item(id, order=0, title=""):
+    return SimpleNamespace(id=id, order=order, title=title)
+
+
+class Table:
+    """A loader recording each call's ``modified_since`` and answering from ``full`` or ``changed``"""
+
+    def __init__(self, full, changed=()):
+        self.full = list(full)
+        self.changed = list(changed)
+        self.calls = []
+
+    async def __call__(self, modified_since=None):
+        self.calls.append(modified_since)
+        return list(self.full) if modified_since is None else list(self.changed)
+
+
+def test_first_load_is_full_then_deltas_start_skew_before_the_last_fetch():
+    sync = IncrementalSync(reconcile_interval=3600, skew=60)
+    table = Table([item("a"), item("b")], changed=[item("b", title="new")])
+
+    async def scenario():
+        first = await sync.load(table, None)
+        high_water = sync.high_water
+        second = await sync.load(table, first)
+        return first, high_water, second
+
+    first, high_water, second = asyncio.run(scenario())
+    assert [x.id for x in first] == ["a", "b"]
+    assert table.calls == [None, high_water - timedelta(seconds=60)]
+    assert [(x.id, x.title) for x in second] == [("a", ""), ("b", "new")]
+    assert sync.stats == {"full_syncs": 1, "delta_syncs": 1, "delta_records": 1}
+    assert sync.high_water >= high_water
+
+
+def test_high_water_is_when_the_fetch_started():
+    sync = IncrementalSync()
+    before = datetime.utcnow()
+
+    async def slow(modified_since=None):
+        await asyncio.sleep(0.02)
+        return []
+
+    asyncio.run(sync.load(slow, None))
+    assert before <= sync.high_water < before + timedelta(seconds=0.02)
+
+
+def test_reconcile_interval_forces_a_full_load_that_drops_deleted_records():
+    sync = IncrementalSync(reconcile_interval=0.05)
+    table = Table([item("a"), item("b")])
+
+    async def scenario():
+        held = await sync.load(table, None)
+        table.full = [item("b")]  # "a" was deleted upstream
+        held = await sync.load(table, held)  # delta: deletions go unnoticed
+        delta = [x.id for x in held]
+        await asyncio.sleep(0.06)
+        held = await sync.load(table, held)
+        return delta, [x.id for x in held]
+
+    delta, reconciled = asyncio.run(scenario())
+    assert delta == ["a", "b"] and reconciled == ["b"]
+    assert table.calls[0] is None and table.calls[1] is not None and table.calls[2] is None
+    assert sync.stats["full_syncs"] == 2
+
+
+def test_a_missing_collection_is_always_loaded_in_full():
+    sync = IncrementalSync()
+    table = Table([item("a")])
+    asyncio.run(sync.load(table, None))
+    asyncio.run(sync.load(table, None))
+    assert table.calls == [None, None]
+
+
+def test_merge_replaces_in_place_appends_new_and_sorts():
+    held = [item("a", 3), item("b", 2), item("c", 1)]
+    assert IncrementalSync().merge(held, []) is held
+    merged = IncrementalSync().merge(held, [item("b", 2, "edited"), item("d", 0)])
+    assert [(x.id, x.title) for x in merged] == [("a", ""), ("b", "edited"), ("c", ""), ("d", "")]
+    ordered = IncrementalSync(sort_key=lambda x: x.order, reverse=True).merge(held, [item("d", 5), item("c", 4)])
+    assert [x.id for x in ordered] == ["d", "c", "a", "b"]
+    assert [x.id for x in held] == ["a", "b", "c"]
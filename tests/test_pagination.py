@@ -0,0 +1,96 @@
+import pytest
+
+import server
+from pagination import decode_cursor, encode_cursor, paginate, parse_fields
+
+
+class Record:
+    def __init__(self, id):
+        self.id = id
+
+
+def snapshot_of(ids):
+    items = [Record(item_id) for item_id in ids]
+    return items, {item.id: position for position, item in enumerate(items)}
+
+
+def walk(items, positions, limit, refresh_after_first=None):
+    """Every id a client sees paging through with ``limit``, optionally swapping snapshots after page one"""
+    seen, cursor = [], None
+    while True:
+        page = paginate(items, positions, cursor, limit)
+        seen.extend(item.id for item in page.items)
+        if page.next_cursor is None:
+            return seen
+        cursor = page.next_cursor
+        if refresh_after_first is not None:
+            items, positions = refresh_after_first
+            refresh_after_first = None
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    assert decode_cursor(encode_cursor("rec1", 4)) == ("rec1", 4)
+    for cursor in ["not-a-cursor", encode_cursor("rec1", 4)[:-3], "WzEsMl0"]:
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+def test_pages_cover_the_snapshot_once():
+    items, positions = snapshot_of([f"r{i}" for i in range(10)])
+    assert walk(items, positions, 3) == [f"r{i}" for i in range(10)]
+
+
+def test_paging_is_stable_when_a_refresh_inserts_records_before_the_cursor():
+    items, positions = snapshot_of([f"r{i}" for i in range(6)])
+    refreshed = snapshot_of(["new1", "new2", "r0", "r1", "r2", "r3", "r4", "r5"])
+    assert walk(items, positions, 2, refreshed) == ["r0", "r1", "r2", "r3", "r4", "r5"]
+
+
+def test_paging_resumes_in_place_when_the_cursor_record_is_removed():
+    items, positions = snapshot_of([f"r{i}" for i in range(6)])
+    refreshed = snapshot_of(["r0", "r2", "r3", "r4", "r5"])
+    assert walk(items, positions, 2, refreshed) == ["r0", "r1", "r2", "r3", "r4", "r5"]
+
+
+def test_parse_fields_keeps_model_order_and_id():
+    assert parse_fields("title, description", server.AirtablePodcast) == ("id", "title", "description")
+    with pytest.raises(ValueError):
+        parse_fields("title,nope", server.AirtablePodcast)
+
+
+def test_list_routes_page_with_cursor_headers_and_sparse_fields(call_api):
+    async def scenario(api):
+        first = await api.get("/api/podcasts", params={"limit": 30, "fields": "title"})
+        second = await api.get("/api/podcasts", params={"limit": 30, "fields": "title",
+                                                        "cursor": first.headers["x-next-cursor"]})
+        everything = (await api.get("/api/podcasts")).json()
+        return first, second, everything
+
+    first, second, everything = call_api(scenario)
+    assert set(first.json()[0]) == {"id", "title"}
+    assert 'rel="next"' in first.headers["link"]
+    assert [p["id"] for p in first.json() + second.json()] == [p["id"] for p in everything[:60]]
+
+
+def test_bad_cursor_and_unknown_field_are_400(call_api):
+    async def scenario(api):
+        return [(await api.get(path)).status_code for path in
+                ["/api/podcasts?cursor=garbage", "/api/events?fields=nope", "/api/videos?facets=true&cursor=%%%",
+                 "/api/team?fields=name"]]
+
+    assert call_api(scenario) == [400, 400, 400, 200]
+
+
+def test_upstream_failure_falls_back_to_an_empty_list(backend, call_api, monkeypatch):
+    server_module, _ = backend
+
+    async def failing():
+        raise server.HTTPException(status_code=500, detail="Error fetching podcasts: https://api.airtable.com/v0/app...")
+
+    monkeypatch.setitem(server_module.content_cache.loaders, "podcasts", failing)
+
+    async def scenario(api):
+        return await api.get("/api/podcasts", params={"limit": 5})
+
+    response = call_api(scenario)
+    assert response.status_code == 200 and response.json() == []
@@ -0,0 +1,46 @@
+import pytest
+from pydantic import BaseModel
+from typing import List, Optional
+
+from record_mapping import RecordMapper, Rule, first_attachment, joined, string_list, value
+
+
+class Item(BaseModel):
+    id: str
+    title: str
+    speakers: Optional[str] = None
+    tags: Optional[List[str]] = None
+    image: Optional[str] = None
+
+
+MAPPER = RecordMapper(Item, {
+    "title": value("Title"),
+    "speakers": joined("Speakers"),
+    "tags": string_list("Tags", split=True),
+    "image": first_attachment("Photo", "Logo"),
+}, required=["title"])
+
+
+def test_map_many_normalizes_fields_and_skips_records_missing_required_values():
+    records = [
+        {"id": "rec1", "fields": {"Title": "One", "Speakers": ["A", "B"], "Tags": "x, y", "Logo": [{"url": "u"}]}},
+        {"id": "rec2", "fields": {"Speakers": "C"}},
+        {"id": "rec3", "fields": {"Title": "Three"}},
+    ]
+    items = MAPPER.map_many(records)
+    assert [item.id for item in items] == ["rec1", "rec3"]
+    assert items[0] == Item(id="rec1", title="One", speakers="A, B", tags=["x", "y"], image="u")
+    assert items[1] == Item(id="rec3", title="Three", speakers="", tags=[], image=None)
+    assert MAPPER.map_one(records[1]) is None
+    assert MAPPER.source_fields == ["Title", "Speakers", "Tags", "Photo", "Logo"]
+
+
+def test_rules_must_implement_compile():
+    with pytest.raises(TypeError):
+        Rule()
+
+
+def test_omitting_blanks_attributes_read_from_the_fields():
+    record = {"id": "rec1", "fields": {"Title": "Hello", "Speakers": ["Ada", "Grace"], "Tags": "a, b"}}
+    omit = MAPPER.omitting(["Speakers", "Tags"])
+    assert omit(MAPPER.map_one(record)) == MAPPER.map_one({"id": "rec1", "fields": {"Title": "Hello"}})
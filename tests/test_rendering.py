@@ -0,0 +1,61 @@
+import gc
+import json
+import tracemalloc
+
+import orjson
+
+import server
+from rendering import exact, render_array
+from synthetic import make_records, video_fields
+
+RECORDS = 1000
+
+
+def retained_bytes(build):
+    """Bytes still allocated after ``build()``, whose result is kept alive until measured"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - baseline, kept
+    finally:
+        tracemalloc.stop()
+
+
+def test_render_array_marks_where_each_element_starts():
+    for items in [[], [1], [{"a": 1}, "x,]", [2, 3]]]:
+        body, starts = render_array(items)
+        assert json.loads(body) == items
+        assert [json.loads(body[start:end - 1]) for start, end in zip(starts, starts[1:])] == items
+
+
+def test_exact_copies_drop_orjson_buffer_slack():
+    size, _ = retained_bytes(lambda: [orjson.dumps(i) for i in range(RECORDS)])
+    exact_size, _ = retained_bytes(lambda: [exact(orjson.dumps(i)) for i in range(RECORDS)])
+    assert exact_size < 100 * RECORDS < size
+
+
+def test_snapshot_retains_about_its_json_per_record():
+    models = server.VIDEO_MAPPER.map_many(make_records(RECORDS, video_fields))
+    server.CollectionSnapshot("videos", models[:10])  # build the compact class untraced
+    size, snapshot = retained_bytes(lambda: server.CollectionSnapshot("videos", models))
+    json_size = len(snapshot.body().identity)
+    # Records, ids, positions and hashes on top of one copy of the JSON; orjson's per-object
+    # buffers would add ~8 KB per record
+    assert size / RECORDS < json_size / RECORDS + 1024
+    assert snapshot.head(2) == orjson.dumps(models[:2], default=lambda model: model.model_dump())
+    assert json.loads(snapshot.record_body(models[5].id).identity) == models[5].model_dump()
+
+
+def test_details_retain_exact_copies():
+    models = server.VIDEO_MAPPER.map_many(make_records(RECORDS, video_fields))
+    snapshot = server.CollectionSnapshot("videos", models)
+    json_size = sum(len(orjson.dumps(model.model_dump())) for model in models)
+
+    def add_details():
+        for model in models:
+            snapshot.add_detail(model)
+    size, _ = retained_bytes(add_details)
+    assert size / RECORDS < json_size / RECORDS + 512
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from search import SearchIndex, search, tokenize
+
+
+def doc(id, title, body=""):
+    return SimpleNamespace(id=id, title=title, body=body)
+
+
+def index_of(*docs):
+    return SearchIndex(list(docs), fields=[(lambda d: d.title, 3), (lambda d: d.body, 1)],
+                       title=lambda d: d.title, snippet_fields=[lambda d: d.body, lambda d: d.title])
+
+
+def test_tokenize_lowercases_and_drops_stopwords():
+    assert tokenize("The Future of General Counsel") == ["future", "general", "counsel"]
+
+
+def test_bm25_ranks_title_matches_and_rarer_terms_higher():
+    videos = index_of(
+        doc("title", "Leadership in crisis", "A conversation."),
+        doc("body", "Quarterly update", "Notes on leadership and budgets."),
+        doc("rare", "Governance", "Leadership and cybersecurity governance."),
+        doc("none", "Unrelated", "Nothing to see."),
+    )
+    ranked = [result["id"] for result in search({"video": videos}, "leadership")]
+    assert ranked[0] == "title"
+    assert set(ranked) == {"title", "body", "rare"}
+    assert search({"video": videos}, "leadership cybersecurity")[0]["id"] == "rare"
+    assert search({"video": videos}, "the of") == []
+    assert len(search({"video": videos}, "leadership", limit=2)) == 2
+
+
+def test_results_span_collections_with_their_type():
+    videos = index_of(doc("v1", "Risk appetite"))
+    podcasts = index_of(doc("p1", "Talking risk", "Risk, risk and more risk."))
+    results = search({"video": videos, "podcast": podcasts}, "risk")
+    assert {(result["type"], result["id"]) for result in results} == {("video", "v1"), ("podcast", "p1")}
+    assert results == sorted(results, key=lambda result: -result["score"])
+
+
+def test_snippets_escape_html_and_mark_matches():
+    articles = index_of(doc("a1", "Boards", 'Directors <script>alert("x")</script> & boards discuss oversight.'))
+    snippet = search({"article": articles}, "oversight")[0]["snippet"]
+    assert "<script>" not in snippet
+    assert "&lt;script&gt;" in snippet and "&amp;" in snippet
+    assert "<mark>oversight</mark>" in snippet
+
+
+def test_long_snippets_are_windowed_around_the_first_match():
+    body = " ".join(["filler"] * 100) + " compliance " + " ".join(["tail"] * 100)
+    snippet = search({"article": index_of(doc("a1", "Report", body))}, "compliance")[0]["snippet"]
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert "<mark>compliance</mark>" in snippet
+
+
+def test_documents_are_indexed_in_place_of_items():
+    listing = [doc("a", "Quarterly update"), doc("b", "Governance")]
+    full = [doc("a", "Quarterly update", "Notes on cybersecurity."), doc("b", "Governance", "Budgets.")]
+    index = SearchIndex(listing, fields=[(lambda d: d.title, 3), (lambda d: d.body, 1)],
+                        title=lambda d: d.title, snippet_fields=[lambda d: d.body], documents=full)
+    [result] = search({"article": index}, "cybersecurity")
+    assert result["id"] == "a" and index.items[0] is listing[0]
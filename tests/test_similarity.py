@@ -0,0 +1,38 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from bench_similar import scan_similar
+from similarity import KeywordIndex
+
+
+def catalog(size, vocabulary=30, seed=5):
+    rng = random.Random(seed)
+    return [SimpleNamespace(id=f"rec{i}", keywords=rng.sample([f"k{j}" for j in range(vocabulary)], rng.randrange(5)))
+            for i in range(size)]
+
+
+@pytest.mark.parametrize("k", [1, 3, 10])
+def test_similar_matches_the_overlap_scan(k):
+    items = catalog(300)
+    index = KeywordIndex(items)
+    for item in items:
+        assert [other.id for other in index.similar(item.id, k)] == \
+               [other.id for other in scan_similar(items, item.id, k)], item.id
+
+
+def test_ties_keep_collection_order_and_the_target_is_excluded():
+    items = [SimpleNamespace(id=name, keywords=keywords) for name, keywords in
+             [("a", ["x", "y"]), ("b", ["x"]), ("c", ["y"]), ("d", ["x", "y"]), ("e", [])]]
+    assert [item.id for item in KeywordIndex(items).similar("a")] == ["d", "b", "c"]
+    assert KeywordIndex(items).similar("e") == []
+
+
+def test_unknown_ids_are_not_memoized():
+    index = KeywordIndex(catalog(50))
+    for i in range(1000):
+        assert index.similar(f"bogus{i}") == []
+    assert not index._memo
+    first = index.similar("rec1")
+    assert index.similar("rec1") is first and len(index._memo) == 1
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from server import SingleFlight
+
+
+def test_concurrent_calls_for_one_key_share_a_single_flight():
+    flights = SingleFlight()
+    calls = []
+
+    async def fetch(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    async def scenario():
+        return await asyncio.gather(*(flights.do("key", "fetch", fetch, 21) for _ in range(5)),
+                                    flights.do("other", "fetch", fetch, 1))
+
+    assert asyncio.run(scenario()) == [42, 42, 42, 42, 42, 2]
+    assert calls == [21, 1]
+    assert flights.stats()["fetch"] == {"calls": 6, "flights": 2, "coalesced": 4, "in_flight": 0}
+
+
+def test_errors_reach_every_waiter_and_the_next_call_flies_again():
+    flights = SingleFlight()
+    attempts = []
+
+    @flights.coalesce
+    async def fetch():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise RuntimeError("upstream down")
+        return "ok"
+
+    async def scenario():
+        results = await asyncio.gather(fetch(), fetch(), return_exceptions=True)
+        return results, await fetch()
+
+    results, retried = asyncio.run(scenario())
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert retried == "ok" and len(attempts) == 2
+
+
+def test_a_cancelled_caller_does_not_cancel_the_shared_flight():
+    flights = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def scenario():
+        first = asyncio.create_task(flights.do("key", "fetch", fetch))
+        second = asyncio.create_task(flights.do("key", "fetch", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "done"
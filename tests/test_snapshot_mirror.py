@@ -0,0 +1,100 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import server
+from compact import CompactRecord
+from server import CollectionCache, CollectionSnapshot, SnapshotMirror
+
+
+class FakeCollection:
+    """The parts of a Motor collection SnapshotMirror uses, held in a dict"""
+
+    def __init__(self, fail=False):
+        self.documents = {}
+        self.fail = fail
+
+    async def update_one(self, query, update, upsert=False):
+        if self.fail:
+            raise ConnectionError("mongo down")
+        document = self.documents.setdefault(query["_id"], {"_id": query["_id"]})
+        document.update(update["$set"])
+        for key, step in update["$inc"].items():
+            document[key] = document.get(key, 0) + step
+
+    def find(self, query):
+        collection = self
+
+        class Cursor:
+            async def to_list(self, length):
+                if collection.fail:
+                    raise ConnectionError("mongo down")
+                return [document for name, document in collection.documents.items() if name in query["_id"]["$in"]]
+        return Cursor()
+
+
+def videos(*names):
+    return [server.AirtableVideo(id=f"rec{name}", video_description=name, keywords=["a", "b"], softr_order=3)
+            for name in names]
+
+
+def test_save_and_load_all_round_trip_compact_records():
+    mirror = SnapshotMirror(FakeCollection(), {"videos": server.AirtableVideo})
+    loaded_at = datetime.utcnow() - timedelta(minutes=5)
+    snapshot = CollectionSnapshot("videos", videos("1", "2"), loaded_at=loaded_at)
+    assert isinstance(snapshot.items[0], CompactRecord)
+
+    async def scenario():
+        await mirror.save(snapshot)
+        await mirror.save(snapshot)
+        return await mirror.load_all()
+
+    [restored] = asyncio.run(scenario())
+    assert mirror.collection.documents["videos"]["items"][0]["keywords"] == ["a", "b"]
+    assert restored.name == "videos" and restored.source == "mongo" and restored.version == 2
+    assert restored.loaded_at == loaded_at and restored.age >= 300
+    assert restored.content_hash == snapshot.content_hash
+    assert restored.body().identity == snapshot.body().identity
+
+
+def test_unreadable_documents_and_outages_are_skipped():
+    collection = FakeCollection()
+    collection.documents = {
+        "videos": {"_id": "videos", "items": [{"id": "rec1", "video_description": "ok"}], "version": 1},
+        "events": {"_id": "events", "items": [{"unexpected": True}], "version": 1},
+    }
+    mirror = SnapshotMirror(collection, {"videos": server.AirtableVideo, "events": server.AirtableEvent})
+    assert [snapshot.name for snapshot in asyncio.run(mirror.load_all())] == ["videos"]
+    collection.fail = True
+    assert asyncio.run(mirror.load_all()) == []
+    asyncio.run(mirror.save(CollectionSnapshot("videos", videos("1"))))  # logged, not raised
+
+
+def test_restore_installs_mirrored_snapshots_and_loads_mirror_new_ones():
+    collection = FakeCollection()
+    mirror = SnapshotMirror(collection, {"videos": server.AirtableVideo, "team": server.AirtableTeamMember})
+    loads = []
+
+    async def load_videos():
+        loads.append("videos")
+        return videos("fresh")
+
+    async def load_team():
+        loads.append("team")
+        return []
+
+    cache = CollectionCache({"videos": load_videos, "team": load_team}, ttl=60, mirror=mirror,
+                            indexes={"videos": {"ids": lambda items: [item.id for item in items]}})
+
+    async def scenario():
+        await mirror.save(CollectionSnapshot("videos", videos("1", "2")))
+        restored = await cache.restore()
+        snapshot = cache.current("videos")
+        await cache.get("team")
+        await asyncio.sleep(0)  # let the mirror write of the team load finish
+        return restored, snapshot
+
+    restored, snapshot = asyncio.run(scenario())
+    assert restored == ["videos"]
+    assert snapshot.source == "mongo" and snapshot.indexes["ids"] == ["rec1", "rec2"]
+    assert loads == ["team"]
+    assert collection.documents["team"]["items"] == []
@@ -0,0 +1,36 @@
+import random
+
+from suggest import Suggestion, SuggestIndex, normalize
+
+
+def test_normalize_folds_case_accents_and_punctuation():
+    assert normalize("  Société Générale — M&A!  ") == "societe generale m a"
+
+
+def test_prefix_matches_any_word_start_heaviest_first():
+    index = SuggestIndex([
+        Suggestion("Corporate Governance Summit", "video", "v1", 0.2),
+        Suggestion("Governing AI", "article", "a1", 0.9),
+        Suggestion("Good Governance", "podcast", "p1", 0.5),
+        Suggestion("Risk Oversight", "video", "v2", 1.0),
+    ])
+    assert [suggestion.id for suggestion in index.suggest("gov")] == ["a1", "p1", "v1"]
+    assert [suggestion.id for suggestion in index.suggest("GOVERNANCE s")] == ["v1"]
+    assert [suggestion.id for suggestion in index.suggest("gov", limit=1)] == ["a1"]
+    assert index.suggest("zzz") == [] and index.suggest("  ") == []
+
+
+def test_a_suggestion_is_returned_once_even_when_several_words_match():
+    index = SuggestIndex([Suggestion("Board to board", "video", "v1", 1.0), Suggestion("Boardroom", "video", "v2", 0.5)])
+    assert [suggestion.id for suggestion in index.suggest("board")] == ["v1", "v2"]
+
+
+def test_ranking_matches_a_brute_force_scan():
+    rng = random.Random(3)
+    words = ["alpha", "alps", "beta", "better", "gamma", "gambit", "delta"]
+    suggestions = [Suggestion(" ".join(rng.sample(words, 3)), "video", f"v{i}", rng.random()) for i in range(300)]
+    index = SuggestIndex(suggestions)
+    for prefix in ["al", "alp", "be", "gam", "d", "x"]:
+        expected = sorted((s for s in suggestions if any(word.startswith(prefix) for word in s.text.split())),
+                          key=lambda s: -s.weight)[:8]
+        assert index.suggest(prefix) == expected